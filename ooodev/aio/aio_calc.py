@@ -0,0 +1,152 @@
+# coding: utf-8
+from __future__ import annotations
+from typing import Any, List
+
+from ..office import calc as mCalc
+from ..utils.type_var import FloatTable, TupleArray
+from . import aio_lo as mAioLo
+
+
+class AioCalc:
+    """
+    Awaitable versions of :py:class:`~.office.calc.Calc` bulk get and set methods.
+
+    Methods take the same arguments as the ``Calc`` method of the same name and are run on the
+    :py:class:`~.aio.aio_lo.AioLo` executor.
+    Any other ``Calc`` method can be awaited using :py:meth:`.AioLo.run`.
+
+    Example:
+
+        .. code::
+
+            sheet = await AioLo.run(Calc.get_sheet, doc, 0)
+            await AioCalc.set_array(values=rows, sheet=sheet, name="A1")
+            data = await AioCalc.get_array(sheet=sheet, range_name="A1:C100")
+
+    .. versionadded:: 0.8.4
+    """
+
+    @staticmethod
+    async def get_array(*args: Any, **kwargs: Any) -> TupleArray:
+        """
+        Gets a 2-Dimensional array of values from a range. See :py:meth:`.Calc.get_array`.
+
+        Args:
+            args (Any): Positional args passed to ``Calc.get_array``.
+            kwargs (Any): Keyword args passed to ``Calc.get_array``.
+
+        Returns:
+            TupleArray: See :py:meth:`.Calc.get_array`.
+        """
+        return await mAioLo.AioLo.run(mCalc.Calc.get_array, *args, **kwargs)
+
+    @staticmethod
+    async def set_array(*args: Any, **kwargs: Any) -> None:
+        """
+        Set a 2-Dimensional array of values into a range. See :py:meth:`.Calc.set_array`.
+
+        Args:
+            args (Any): Positional args passed to ``Calc.set_array``.
+            kwargs (Any): Keyword args passed to ``Calc.set_array``.
+        """
+        await mAioLo.AioLo.run(mCalc.Calc.set_array, *args, **kwargs)
+
+    @staticmethod
+    async def get_float_array(*args: Any, **kwargs: Any) -> FloatTable:
+        """
+        Gets a 2-Dimensional array of floats from a range. See :py:meth:`.Calc.get_float_array`.
+
+        Args:
+            args (Any): Positional args passed to ``Calc.get_float_array``.
+            kwargs (Any): Keyword args passed to ``Calc.get_float_array``.
+
+        Returns:
+            FloatTable: See :py:meth:`.Calc.get_float_array`.
+        """
+        return await mAioLo.AioLo.run(mCalc.Calc.get_float_array, *args, **kwargs)
+
+    @staticmethod
+    async def set_array_range(*args: Any, **kwargs: Any) -> None:
+        """
+        Set a 2-Dimensional array of values into a range. See :py:meth:`.Calc.set_array_range`.
+
+        Args:
+            args (Any): Positional args passed to ``Calc.set_array_range``.
+            kwargs (Any): Keyword args passed to ``Calc.set_array_range``.
+        """
+        await mAioLo.AioLo.run(mCalc.Calc.set_array_range, *args, **kwargs)
+
+    @staticmethod
+    async def get_val(*args: Any, **kwargs: Any) -> Any:
+        """
+        Gets the value of a cell. See :py:meth:`.Calc.get_val`.
+
+        Args:
+            args (Any): Positional args passed to ``Calc.get_val``.
+            kwargs (Any): Keyword args passed to ``Calc.get_val``.
+
+        Returns:
+            Any: See :py:meth:`.Calc.get_val`.
+        """
+        return await mAioLo.AioLo.run(mCalc.Calc.get_val, *args, **kwargs)
+
+    @staticmethod
+    async def set_val(*args: Any, **kwargs: Any) -> None:
+        """
+        Sets the value of a cell. See :py:meth:`.Calc.set_val`.
+
+        Args:
+            args (Any): Positional args passed to ``Calc.set_val``.
+            kwargs (Any): Keyword args passed to ``Calc.set_val``.
+        """
+        await mAioLo.AioLo.run(mCalc.Calc.set_val, *args, **kwargs)
+
+    @staticmethod
+    async def get_row(*args: Any, **kwargs: Any) -> List[Any]:
+        """
+        Gets values of a row. See :py:meth:`.Calc.get_row`.
+
+        Args:
+            args (Any): Positional args passed to ``Calc.get_row``.
+            kwargs (Any): Keyword args passed to ``Calc.get_row``.
+
+        Returns:
+            List[Any]: See :py:meth:`.Calc.get_row`.
+        """
+        return await mAioLo.AioLo.run(mCalc.Calc.get_row, *args, **kwargs)
+
+    @staticmethod
+    async def set_row(*args: Any, **kwargs: Any) -> None:
+        """
+        Sets values of a row. See :py:meth:`.Calc.set_row`.
+
+        Args:
+            args (Any): Positional args passed to ``Calc.set_row``.
+            kwargs (Any): Keyword args passed to ``Calc.set_row``.
+        """
+        await mAioLo.AioLo.run(mCalc.Calc.set_row, *args, **kwargs)
+
+    @staticmethod
+    async def get_col(*args: Any, **kwargs: Any) -> List[Any]:
+        """
+        Gets values of a column. See :py:meth:`.Calc.get_col`.
+
+        Args:
+            args (Any): Positional args passed to ``Calc.get_col``.
+            kwargs (Any): Keyword args passed to ``Calc.get_col``.
+
+        Returns:
+            List[Any]: See :py:meth:`.Calc.get_col`.
+        """
+        return await mAioLo.AioLo.run(mCalc.Calc.get_col, *args, **kwargs)
+
+    @staticmethod
+    async def set_col(*args: Any, **kwargs: Any) -> None:
+        """
+        Sets values of a column. See :py:meth:`.Calc.set_col`.
+
+        Args:
+            args (Any): Positional args passed to ``Calc.set_col``.
+            kwargs (Any): Keyword args passed to ``Calc.set_col``.
+        """
+        await mAioLo.AioLo.run(mCalc.Calc.set_col, *args, **kwargs)
@@ -0,0 +1,167 @@
+# coding: utf-8
+from __future__ import annotations
+from typing import Any, Callable, Iterable, TypeVar, TYPE_CHECKING
+
+from ..conn import cache as mCache
+from ..conn import connectors
+from ..conn import office_standby as mStandby
+from ..utils import lo as mLo
+from ..utils.type_var import PathOrStr
+from . import uno_executor as mExec
+
+if TYPE_CHECKING:
+    from com.sun.star.beans import PropertyValue
+    from com.sun.star.frame import XComponentLoader
+    from com.sun.star.frame import XStorable
+    from com.sun.star.lang import XComponent
+
+_T = TypeVar("_T")
+
+
+class AioLo:
+    """
+    Awaitable versions of :py:class:`~.utils.lo.Lo` methods.
+
+    ``Lo`` holds a single global connection. All calls are run on one :py:class:`~.aio.uno_executor.UnoExecutor`
+    so they do not block the event loop and do not run at the same time as each other.
+
+    To process documents on several office instances at once use :py:class:`~.aio.aio_pool.AioOfficePool`.
+
+    Example:
+
+        .. code::
+
+            async def main() -> None:
+                loader = await AioLo.load_office(Lo.ConnectPipe(headless=True))
+                try:
+                    doc = await AioLo.open_doc("report.odt", loader)
+                    await AioLo.save_doc(doc, "report.pdf")
+                    await AioLo.close_doc(doc)
+                finally:
+                    await AioLo.close_office()
+
+    .. versionadded:: 0.8.4
+    """
+
+    _executor = mExec.UnoExecutor(name="ooodev-lo")
+
+    @classmethod
+    def get_executor(cls) -> mExec.UnoExecutor:
+        """
+        Gets executor used for ``Lo`` connection.
+
+        Returns:
+            UnoExecutor: Executor.
+        """
+        return cls._executor
+
+    @classmethod
+    async def run(cls, func: Callable[..., _T], *args: Any, **kwargs: Any) -> _T:
+        """
+        Runs any function that uses the ``Lo`` connection on the ``Lo`` executor.
+
+        Args:
+            func (Callable): Function to run, such as ``Write.get_text_doc``.
+            args (Any): Positional args passed to ``func``.
+            kwargs (Any): Keyword args passed to ``func``.
+
+        Returns:
+            Any: Result of ``func``.
+        """
+        return await cls._executor.run(func, *args, **kwargs)
+
+    @classmethod
+    async def load_office(
+        cls,
+        connector: connectors.ConnectPipe | connectors.ConnectSocket | mStandby.OfficeStandby | None = None,
+        cache_obj: mCache.Cache | None = None,
+        opt: mLo.Lo.Options | None = None,
+    ) -> XComponentLoader:
+        """
+        Loads Office. See :py:meth:`.Lo.load_office`.
+
+        Args:
+            connector (ConnectPipe | ConnectSocket | OfficeStandby | None): Connection information.
+            cache_obj (Cache | None, optional): Cache instance. Defaults to None.
+            opt (Options, optional): Extra Load options.
+
+        Returns:
+            XComponentLoader: component loader
+        """
+        return await cls._executor.run(mLo.Lo.load_office, connector=connector, cache_obj=cache_obj, opt=opt)
+
+    @classmethod
+    async def close_office(cls) -> bool:
+        """
+        Closes the office connection and shuts down executor. See :py:meth:`.Lo.close_office`.
+
+        Returns:
+            bool: True if office is closed; Otherwise, False
+        """
+        try:
+            return await cls._executor.run(mLo.Lo.close_office)
+        finally:
+            cls._executor.shutdown(wait=False)
+
+    @classmethod
+    async def open_doc(
+        cls,
+        fnm: PathOrStr,
+        loader: XComponentLoader | None = None,
+        props: Iterable[PropertyValue] | None = None,
+    ) -> XComponent:
+        """
+        Open a office document. See :py:meth:`.Lo.open_doc`.
+
+        Args:
+            fnm (PathOrStr): path of document to open
+            loader (XComponentLoader, optional): Component Loader
+            props (Iterable[PropertyValue], optional): Properties passed to component loader
+
+        Returns:
+            XComponent: Document
+        """
+        return await cls._executor.run(mLo.Lo.open_doc, fnm=fnm, loader=loader, props=props)
+
+    @classmethod
+    async def save_doc(cls, doc: object, fnm: PathOrStr, password: str = None, format: str = None) -> bool:
+        """
+        Save document. See :py:meth:`.Lo.save_doc`.
+
+        Args:
+            doc (object): Office document.
+            fnm (PathOrStr): file path to save as.
+            password (str, optional): password to save document with.
+            format (str, optional): document format such as 'odt' or 'xml'. Defaults to format of ``fnm`` extension.
+
+        Returns:
+            bool: True if doc is saved; Otherwise False
+        """
+        return await cls._executor.run(mLo.Lo.save_doc, doc=doc, fnm=fnm, password=password, format=format)
+
+    @classmethod
+    async def store_doc_format(cls, store: XStorable, fnm: PathOrStr, format: str, password: str = None) -> bool:
+        """
+        Store document as format. See :py:meth:`.Lo.store_doc_format`.
+
+        Args:
+            store (XStorable): instance that implements XStorable interface.
+            fnm (PathOrStr): Path to save document as.
+            format (str): document format such as 'odt' or 'xml'
+            password (str, optional): Password for document.
+
+        Returns:
+            bool: True if document is stored; Otherwise False
+        """
+        return await cls._executor.run(mLo.Lo.store_doc_format, store=store, fnm=fnm, format=format, password=password)
+
+    @classmethod
+    async def close_doc(cls, doc: object, deliver_ownership: bool = False) -> None:
+        """
+        Closes document. See :py:meth:`.Lo.close_doc`.
+
+        Args:
+            doc (XCloseable): Close-able document
+            deliver_ownership (bool): If ``True`` delegates the ownership of this closing object. Default is ``False``.
+        """
+        await cls._executor.run(mLo.Lo.close_doc, doc=doc, deliver_ownership=deliver_ownership)
@@ -0,0 +1,253 @@
+# coding: utf-8
+from __future__ import annotations
+import asyncio
+import contextlib
+from typing import Any, AsyncGenerator, Callable, Dict, Iterable, TypeVar, TYPE_CHECKING
+
+from ..conn import office_pool as mPool
+from ..utils import file_io as mFileIO
+from ..utils import lo as mLo
+from ..utils import props as mProps
+from ..utils.type_var import PathOrStr
+from . import uno_executor as mExec
+
+from com.sun.star.util import XCloseable
+
+if TYPE_CHECKING:
+    from com.sun.star.beans import PropertyValue
+    from com.sun.star.lang import XComponent
+
+_T = TypeVar("_T")
+
+
+class AioPooledOffice:
+    """
+    Leased office instance of :py:class:`~.aio.aio_pool.AioOfficePool`
+
+    Calls are run on the executor that belongs to the office instance.
+
+    .. versionadded:: 0.8.4
+    """
+
+    def __init__(self, office: mPool.PooledOffice, executor: mExec.UnoExecutor) -> None:
+        """
+        Constructor
+
+        Args:
+            office (PooledOffice): Leased office instance.
+            executor (UnoExecutor): Executor of office instance.
+        """
+        self._office = office
+        self._executor = executor
+
+    async def run(self, func: Callable[..., _T], *args: Any, **kwargs: Any) -> _T:
+        """
+        Runs a function on the executor of this office instance.
+
+        ``func`` must only use objects of this office instance, not the global ``Lo`` connection.
+
+        Args:
+            func (Callable): Function to run.
+            args (Any): Positional args passed to ``func``.
+            kwargs (Any): Keyword args passed to ``func``.
+
+        Returns:
+            Any: Result of ``func``.
+        """
+        return await self._executor.run(func, *args, **kwargs)
+
+    def _open_doc(self, fnm: PathOrStr, props: Iterable[PropertyValue] | None) -> XComponent:
+        if props is None:
+            props = mProps.Props.make_props(Hidden=True)
+        url = mFileIO.FileIO.fnm_to_url(mFileIO.FileIO.get_absolute_path(fnm))
+        doc = self._office.loader.loadComponentFromURL(url, "_blank", 0, props)
+        if doc is None:
+            raise Exception(f"Unable to open the document: {fnm}")
+        return doc
+
+    async def open_doc(self, fnm: PathOrStr, props: Iterable[PropertyValue] | None = None) -> XComponent:
+        """
+        Opens a document in this office instance.
+
+        Args:
+            fnm (PathOrStr): path of document to open.
+            props (Iterable[PropertyValue], optional): Properties passed to component loader. Defaults to hidden.
+
+        Raises:
+            Exception: if unable to open document.
+
+        Returns:
+            XComponent: Document
+        """
+        return await self._executor.run(self._open_doc, fnm, props)
+
+    async def save_doc(self, doc: object, fnm: PathOrStr, password: str = None, format: str = None) -> bool:
+        """
+        Save document. See :py:meth:`.Lo.save_doc`.
+
+        Args:
+            doc (object): Office document.
+            fnm (PathOrStr): file path to save as.
+            password (str, optional): password to save document with.
+            format (str, optional): document format such as 'odt' or 'xml'. Defaults to format of ``fnm`` extension.
+
+        Returns:
+            bool: True if doc is saved; Otherwise False
+        """
+        return await self._executor.run(mLo.Lo.save_doc, doc=doc, fnm=fnm, password=password, format=format)
+
+    async def store_doc_format(self, doc: object, fnm: PathOrStr, format: str, password: str = None) -> bool:
+        """
+        Store document as format. See :py:meth:`.Lo.store_doc_format`.
+
+        Args:
+            doc (object): Office document that implements XStorable interface.
+            fnm (PathOrStr): Path to save document as.
+            format (str): document format such as 'odt' or 'xml'
+            password (str, optional): Password for document.
+
+        Returns:
+            bool: True if document is stored; Otherwise False
+        """
+        return await self._executor.run(mLo.Lo.store_doc_format, store=doc, fnm=fnm, format=format, password=password)
+
+    def _close_doc(self, doc: object) -> None:
+        # Lo.close_doc() would reset the document of the global Lo connection.
+        closeable = mLo.Lo.qi(XCloseable, doc, True)
+        closeable.close(False)
+
+    async def close_doc(self, doc: object) -> None:
+        """
+        Closes document.
+
+        Args:
+            doc (object): Office document that implements XCloseable interface.
+
+        Raises:
+            MissingInterfaceError: if doc does not have XCloseable interface
+        """
+        await self._executor.run(self._close_doc, doc)
+
+    @property
+    def office(self) -> mPool.PooledOffice:
+        """Gets leased office instance"""
+        return self._office
+
+    @property
+    def executor(self) -> mExec.UnoExecutor:
+        """Gets executor of office instance"""
+        return self._executor
+
+
+class AioOfficePool:
+    """
+    Awaitable wrapper of :py:class:`~.conn.office_pool.OfficePool`.
+
+    Each office instance has its own :py:class:`~.aio.uno_executor.UnoExecutor`
+    so documents in different instances are processed at the same time without blocking the event loop.
+
+    Example:
+
+        .. code::
+
+            async def convert(pool: AioOfficePool, fnm: str) -> None:
+                async with pool.lease() as office:
+                    doc = await office.open_doc(fnm)
+                    await office.save_doc(doc, f"{fnm}.pdf")
+                    await office.close_doc(doc)
+
+            async def main(files: List[str]) -> None:
+                async with AioOfficePool(OfficePool(size=4)) as pool:
+                    await asyncio.gather(*(convert(pool, f) for f in files))
+
+    .. versionadded:: 0.8.4
+    """
+
+    def __init__(self, pool: mPool.OfficePool) -> None:
+        """
+        Constructor
+
+        Args:
+            pool (OfficePool): Office pool.
+        """
+        self._pool = pool
+        self._executors: Dict[int, mExec.UnoExecutor] = {}
+        self._sem: asyncio.Semaphore | None = None
+
+    def _get_executor(self, index: int) -> mExec.UnoExecutor:
+        executor = self._executors.get(index, None)
+        if executor is None:
+            executor = mExec.UnoExecutor(name=f"ooodev-pool-{index}")
+            self._executors[index] = executor
+        return executor
+
+    async def start(self) -> None:
+        """
+        Starts all office instances without blocking the event loop.
+        """
+        if self._sem is None:
+            self._sem = asyncio.Semaphore(self._pool.size)
+        await asyncio.get_running_loop().run_in_executor(None, self._pool.start)
+
+    @contextlib.asynccontextmanager
+    async def lease(self) -> AsyncGenerator[AioPooledOffice, None]:
+        """
+        Async context manager that leases an office instance and returns it to the pool when done.
+
+        Waits without blocking the event loop while all instances are leased.
+
+        Raises:
+            NoConnectException: If the instance had failed to restart and restarting it failed again.
+
+        Yields:
+            AsyncGenerator[AioPooledOffice, None]: Leased office instance.
+        """
+        if self._sem is None:
+            await self.start()
+        loop = asyncio.get_running_loop()
+        async with self._sem:
+            # semaphore limits waiting to this pool's own leases, acquire still blocks because
+            # pool may also be used directly, such as by health_check() taking idle instances for a moment.
+            # acquire may restart an instance that failed to restart earlier, run it off the event loop.
+            fut = loop.run_in_executor(None, self._pool.acquire)
+            try:
+                office = await asyncio.shield(fut)
+            except asyncio.CancelledError:
+                # acquire keeps running in its thread, return its instance when it is done.
+                fut.add_done_callback(self._release_abandoned)
+                raise
+            try:
+                yield AioPooledOffice(office=office, executor=self._get_executor(office.index))
+            finally:
+                # release may restart a dead instance, run it off the event loop.
+                await loop.run_in_executor(None, self._pool.release, office)
+
+    def _release_abandoned(self, fut: asyncio.Future) -> None:
+        if fut.cancelled() or fut.exception() is not None:
+            return
+        asyncio.get_running_loop().run_in_executor(None, self._pool.release, fut.result())
+
+    async def close(self) -> None:
+        """
+        Shuts down executors and terminates all office instances.
+        """
+        executors = list(self._executors.values())
+        self._executors.clear()
+        self._sem = None
+        loop = asyncio.get_running_loop()
+        # shutdown waits for pending calls, do not block the event loop.
+        for executor in executors:
+            await loop.run_in_executor(None, executor.shutdown)
+        await loop.run_in_executor(None, self._pool.close)
+
+    @property
+    def pool(self) -> mPool.OfficePool:
+        """Gets wrapped office pool"""
+        return self._pool
+
+    async def __aenter__(self) -> AioOfficePool:
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.close()
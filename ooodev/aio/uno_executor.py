@@ -0,0 +1,75 @@
+# coding: utf-8
+from __future__ import annotations
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, TypeVar
+
+_T = TypeVar("_T")
+
+
+class UnoExecutor:
+    """
+    Runs calls to office on a single dedicated thread.
+
+    Each call made through the bridge blocks until office answers.
+    Awaiting :py:meth:`~.UnoExecutor.run` moves the blocking call off the event loop thread.
+    One worker thread is used so calls for a connection run one at a time and in order,
+    the same as when ``ooodev`` is used synchronously.
+
+    Use one ``UnoExecutor`` per office connection.
+
+    .. versionadded:: 0.8.4
+    """
+
+    def __init__(self, name: str = "ooodev-uno") -> None:
+        """
+        Constructor
+
+        Args:
+            name (str, optional): Name prefix of executor thread. Defaults to ``ooodev-uno``.
+        """
+        self._name = name
+        self._executor: ThreadPoolExecutor | None = None
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=self._name)
+        return self._executor
+
+    async def run(self, func: Callable[..., _T], *args: Any, **kwargs: Any) -> _T:
+        """
+        Runs ``func`` on executor thread.
+
+        Args:
+            func (Callable): Function to run.
+            args (Any): Positional args passed to ``func``.
+            kwargs (Any): Keyword args passed to ``func``.
+
+        Returns:
+            Any: Result of ``func``.
+        """
+        loop = asyncio.get_running_loop()
+        if kwargs:
+            func = functools.partial(func, **kwargs)
+        return await loop.run_in_executor(self._get_executor(), func, *args)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Shuts down executor thread.
+
+        Executor is recreated if :py:meth:`~.UnoExecutor.run` is called again.
+
+        Args:
+            wait (bool, optional): If ``True`` blocks until pending calls are done. Defaults to ``True``.
+        """
+        executor = self._executor
+        self._executor = None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+    async def __aenter__(self) -> UnoExecutor:
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.shutdown()
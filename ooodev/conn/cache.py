@@ -1,18 +1,100 @@
 # coding: utf-8
 from __future__ import annotations
+import errno
+import fnmatch
+import hashlib
+import json
 import os
+import time
+from enum import Enum
 from pathlib import Path
 from shutil import copytree
 import shutil
 import tempfile
+from typing import Dict, NamedTuple, Sequence, Tuple
 from ..utils.type_var import PathOrStr
 from ..utils import sys_info
 from ..cfg import config
 
+_FICLONE = 0x40049409  # linux ioctl, clone file (reflink)
+_MANIFEST_NAME = ".ooodev_manifest.json"
+_MANIFEST_VERSION = 1
+
+
+class CopyStats(NamedTuple):
+    """
+    Profile copy statistics
+
+    .. versionadded:: 0.8.4
+    """
+
+    seconds: float
+    """Time taken to copy profile in seconds"""
+    copied: int
+    """Number of files copied"""
+    linked: int
+    """Number of files hard linked or reflinked"""
+
+
+def _reflink(src: str, dst: str) -> bool:
+    # clones src to dst using copy on write. Returns False if not supported.
+    try:
+        import fcntl
+    except ImportError:
+        return False
+    try:
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+    except OSError:
+        try:
+            os.remove(dst)
+        except OSError:
+            pass
+        return False
+    shutil.copystat(src, dst)
+    return True
+
+
+def _file_sha256(fnm: str) -> str:
+    h = hashlib.sha256()
+    with open(fnm, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
 
 class Cache:
     """Office Profile Cache Manager"""
 
+    class LinkModeKind(str, Enum):
+        """
+        How files are copied from cache to profile
+
+        .. versionadded:: 0.8.4
+        """
+
+        COPY = "copy"
+        """Every file is copied"""
+        REFLINK = "reflink"
+        """Every file is reflinked (copy on write) when the file system supports it; Otherwise, copied."""
+        HARDLINK = "hardlink"
+        """
+        Files matching :py:attr:`~.Cache.HARDLINK_PATTERNS` are hard linked,
+        all other files are reflinked when the file system supports it; Otherwise, copied.
+        """
+
+    HARDLINK_PATTERNS: Tuple[str, ...] = (
+        "user/fonts/*",
+        "user/config/*.zip",
+        "user/config/*.soc",
+    )
+    """
+    Patterns of profile file paths, relative to the ``user`` dir parent, that office only reads.
+
+    Only these files are hard linked. Writing to a hard link would also change the cached file,
+    which may be the user's real office profile.
+    """
+
     def __init__(self, **kwargs) -> None:
         """
         Cache Constructor
@@ -23,10 +105,23 @@ class Cache:
                 Default is searched for in known locations.
             working_dir (PathOrStr, optional): sets the working dir to use.
                 This is the dir that LO profile will be copied to. Defaults to a newly generated temp dir.
+            link_mode (LinkModeKind | str, optional): How files are copied from cache to profile.
+                Default ``LinkModeKind.COPY``.
+            hardlink_patterns (Sequence[str], optional): Patterns of file paths that are hard linked.
+                Default :py:attr:`~.Cache.HARDLINK_PATTERNS`.
+            validate_hash (bool, optional): If ``True`` cached files are validated against manifest using file hashes;
+                Otherwise, file size and modified time are used. Default ``False``.
+
+        .. versionchanged:: 0.8.4
+            Added ``link_mode``, ``hardlink_patterns`` and ``validate_hash`` keyword args.
         """
         self._use_cache = bool(kwargs.get("use_cache", True))
         self._profile_dir_name = "profile"
         self._profile_cached = False
+        self._link_mode = Cache.LinkModeKind(kwargs.get("link_mode", Cache.LinkModeKind.COPY))
+        self._hardlink_patterns = tuple(kwargs.get("hardlink_patterns", Cache.HARDLINK_PATTERNS))
+        self._validate_hash = bool(kwargs.get("validate_hash", False))
+        self._copy_stats = CopyStats(seconds=0.0, copied=0, linked=0)
         cache_path = kwargs.get("cache_path", None)
         if cache_path is not None:
             self.cache_path = cache_path
@@ -39,6 +134,7 @@ class Cache:
         # see: https://www.howtogeek.com/289587/how-to-find-your-libreoffice-profile-folder-in-windows-macos-and-linux/
         cache_path = None
         platform = sys_info.SysInfo.get_platform()
+
         def get_path(ver: str):
             result = None
             if platform == sys_info.SysInfo.PlatformEnum.LINUX:
@@ -66,6 +162,9 @@ class Cache:
         """
         Copies user profile into cache path if it has not already been cached.
 
+        A manifest of the cached files is written to the cache path.
+        The manifest is used to validate the cache each time it is copied to a profile.
+
         Ignored if :py:attr:`~Cache.use_cache` is ``False``
         """
         # copy_cache_to_profile is called before this method
@@ -75,6 +174,7 @@ class Cache:
             return
         if self._profile_cached is False:
             copytree(self.user_profile, self.cache_path)
+            self._write_manifest()
         return
 
     def copy_cache_to_profile(self) -> None:
@@ -82,6 +182,12 @@ class Cache:
         Copies cached profile to profile dir set in
         :py:attr:`~.Cache.user_profile`
 
+        Files are copied, reflinked or hard linked depending on :py:attr:`~.Cache.link_mode`.
+        Time taken is available in :py:attr:`~.Cache.copy_stats`.
+
+        If the cache has a manifest that no longer matches the cached files then the cache is
+        discarded and will be recreated by :py:meth:`~.Cache.cache_profile`.
+
         Ignored if :py:attr:`~Cache.use_cache` is ``False``
         """
         # this method is called before cache_profile.
@@ -89,8 +195,14 @@ class Cache:
             return
         if self.cache_path is None:
             return
+        start = time.perf_counter()
+        copied = 0
+        linked = 0
+        if self.cache_path.exists() and self.cache_path.is_dir() and not self.is_cache_valid():
+            # manifest exists so this cache was created by Cache and can be removed.
+            shutil.rmtree(self.cache_path)
         if self.cache_path.exists() and self.cache_path.is_dir():
-            copytree(self.cache_path, self.user_profile)
+            copied, linked = self._link_tree(self.cache_path, self.user_profile)
             self._profile_cached = True
         else:
             # create the dir.
@@ -98,6 +210,108 @@ class Cache:
             # the profile into this dir.
             os.mkdir(self.user_profile)
             self._profile_cached = False
+        self._copy_stats = CopyStats(seconds=time.perf_counter() - start, copied=copied, linked=linked)
+
+    def _is_hardlink_safe(self, rel: str) -> bool:
+        # rel is posix path relative to cache path, cache path may be the profile dir or its parent.
+        return any(
+            fnmatch.fnmatch(rel, pattern) or fnmatch.fnmatch(rel, f"*/{pattern}")
+            for pattern in self._hardlink_patterns
+        )
+
+    def _link_tree(self, src: Path, dst: Path) -> Tuple[int, int]:
+        # copies src tree to dst using links where possible. Returns (copied, linked)
+        copied = 0
+        linked = 0
+        can_reflink = self._link_mode != Cache.LinkModeKind.COPY
+        can_hardlink = self._link_mode == Cache.LinkModeKind.HARDLINK
+        for root, dirs, files in os.walk(src):
+            rel = os.path.relpath(root, src)
+            dst_root = os.path.join(dst, rel) if rel != "." else str(dst)
+            os.makedirs(dst_root, exist_ok=True)
+            for name in files:
+                if name == _MANIFEST_NAME and rel == ".":
+                    continue
+                src_fnm = os.path.join(root, name)
+                dst_fnm = os.path.join(dst_root, name)
+                if (
+                    can_hardlink
+                    and not os.path.islink(src_fnm)
+                    and self._is_hardlink_safe(os.path.relpath(src_fnm, src).replace(os.sep, "/"))
+                ):
+                    try:
+                        os.link(src_fnm, dst_fnm)
+                        linked += 1
+                        continue
+                    except OSError as e:
+                        if e.errno in (errno.EXDEV, errno.EPERM, errno.EMLINK, errno.ENOTSUP):
+                            can_hardlink = False
+                if can_reflink:
+                    if _reflink(src_fnm, dst_fnm):
+                        linked += 1
+                        continue
+                    # file system does not support reflink, do not try again.
+                    can_reflink = False
+                shutil.copy2(src_fnm, dst_fnm)
+                copied += 1
+        return (copied, linked)
+
+    def _build_manifest(self, hashes: bool) -> Dict[str, list]:
+        files = {}
+        root_path = str(self.cache_path)
+        for root, _, names in os.walk(root_path):
+            for name in names:
+                fnm = os.path.join(root, name)
+                rel = os.path.relpath(fnm, root_path).replace(os.sep, "/")
+                if rel == _MANIFEST_NAME:
+                    continue
+                st = os.stat(fnm)
+                entry = [st.st_size, st.st_mtime_ns]
+                if hashes:
+                    entry.append(_file_sha256(fnm))
+                files[rel] = entry
+        return files
+
+    def _write_manifest(self) -> None:
+        manifest = {"version": _MANIFEST_VERSION, "files": self._build_manifest(True)}
+        with open(Path(self.cache_path, _MANIFEST_NAME), "w", encoding="utf-8") as f:
+            json.dump(manifest, f)
+
+    def is_cache_valid(self) -> bool:
+        """
+        Gets if cached profile matches its manifest.
+
+        A cache without a manifest, such as an existing office profile, is always considered valid.
+
+        Returns:
+            bool: ``False`` if cache has a manifest and files have changed, been added or removed; Otherwise, ``True``.
+
+        .. versionadded:: 0.8.4
+        """
+        if self.cache_path is None:
+            return True
+        manifest_path = Path(self.cache_path, _MANIFEST_NAME)
+        if not manifest_path.exists():
+            return True
+        try:
+            with open(manifest_path, "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+            if manifest.get("version", None) != _MANIFEST_VERSION:
+                return False
+            expected = manifest["files"]
+            actual = self._build_manifest(self._validate_hash)
+        except Exception:
+            return False
+        if expected.keys() != actual.keys():
+            return False
+        for rel, entry in actual.items():
+            exp = expected[rel]
+            if self._validate_hash:
+                if entry[0] != exp[0] or entry[2] != exp[2]:
+                    return False
+            elif entry[0] != exp[0] or entry[1] != exp[1]:
+                return False
+        return True
 
     def del_working_dir(self):
         """
@@ -154,6 +368,50 @@ class Cache:
     def working_dir(self, value: PathOrStr):
         self._working_dir = Path(value)
 
+    @property
+    def link_mode(self) -> Cache.LinkModeKind:
+        """
+        Gets/Sets how files are copied from cache to profile. Default is ``LinkModeKind.COPY``
+
+        .. versionadded:: 0.8.4
+        """
+        return self._link_mode
+
+    @link_mode.setter
+    def link_mode(self, value: Cache.LinkModeKind | str) -> None:
+        self._link_mode = Cache.LinkModeKind(value)
+
+    def clone(self) -> Cache:
+        """
+        Gets a new ``Cache`` with the same settings and cache path as this instance.
+
+        The new instance gets its own working dir.
+        Used when starting many office instances that share the same cached profile.
+
+        Returns:
+            Cache: New cache instance.
+
+        .. versionadded:: 0.8.4
+        """
+        c = Cache(
+            use_cache=self._use_cache,
+            link_mode=self._link_mode,
+            hardlink_patterns=self._hardlink_patterns,
+            validate_hash=self._validate_hash,
+        )
+        if self.cache_path is not None:
+            c.cache_path = self.cache_path
+        return c
+
+    @property
+    def copy_stats(self) -> CopyStats:
+        """
+        Gets statistics of last :py:meth:`~.Cache.copy_cache_to_profile` call.
+
+        .. versionadded:: 0.8.4
+        """
+        return self._copy_stats
+
     @property
     def use_cache(self) -> bool:
         """Gets/Sets if cache is used. Default is ``True``"""
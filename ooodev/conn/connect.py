@@ -1,11 +1,13 @@
 # coding: utf-8
 from __future__ import annotations
 import os
+import random
+import socket
 import time
 from abc import ABC, abstractmethod
 import subprocess
 import signal
-from typing import List, TYPE_CHECKING, cast
+from typing import List, NamedTuple, TYPE_CHECKING, cast
 import time
 import shutil
 import uno
@@ -25,6 +27,29 @@ if TYPE_CHECKING:
     from com.sun.star.uno import XComponentContext
 
 
+class ConnectTimings(NamedTuple):
+    """
+    Time in seconds spent in each phase of connecting to office.
+
+    .. versionadded:: 0.8.4
+    """
+
+    profile_copy: float = 0.0
+    """Copying cached profile into working dir"""
+    process_start: float = 0.0
+    """Starting soffice process"""
+    wait_ready: float = 0.0
+    """Waiting for soffice to accept connections"""
+    bridge: float = 0.0
+    """Creating bridge and getting remote context, successful attempt only"""
+    profile_cache: float = 0.0
+    """Caching profile"""
+    attempts: int = 0
+    """Number of bridge connection attempts"""
+    total: float = 0.0
+    """Total time of connect"""
+
+
 class ConnectBase(ABC):
     """Base Abstract Class for all connections to LO"""
 
@@ -65,9 +90,15 @@ class LoBridgeCommon(ConnectBase):
         self._soffice_process = None
         self._bridge_component = None
         self._platform = SysInfo.get_platform()
-        self._environment = os.environ
+        # copy so instances do not share TMPDIR, see OfficePool
+        self._environment = os.environ.copy()
         self._timeout = 30.0
-        self._conn_try_sleep = 0.2
+        # first retry delay. Delay doubles on each failed attempt, up to _conn_max_sleep, with jitter.
+        self._conn_try_sleep = 0.05
+        self._conn_max_sleep = 0.5
+        # when probe reports not ready, still attempt a bridge every n probes in case probe is wrong.
+        self._probe_bridge_every = 4
+        self._timings = ConnectTimings()
         if cache_obj is None:
             self._cache = cache.Cache(use_cache=False)
         else:
@@ -83,43 +114,112 @@ class LoBridgeCommon(ConnectBase):
     def _get_bridge(self, local_factory: XMultiComponentFactory, local_ctx: XComponentContext) -> XBridge:
         ...
 
-    def _connect(self):
-        conn_str = self._get_connection_str()
+    def _probe_ready(self) -> bool | None:
+        """
+        Checks if office is accepting connections without creating a bridge.
 
-        end_time = time.time() + self._timeout
-        last_ex = None
-        while end_time > time.time():
-            try:
-                localContext = cast("XComponentContext", uno.getComponentContext())
-                # resolver = cast("XMultiComponentFactory",localContext.ServiceManager.createInstanceWithContext(
-                #     "com.sun.star.bridge.UnoUrlResolver", localContext
-                # ))
+        Returns:
+            bool | None: ``True`` if ready, ``False`` if not ready, ``None`` if readiness can not be determined.
+        """
+        return None
 
-                localFactory = localContext.getServiceManager()
+    def _is_process_alive(self) -> bool:
+        """
+        Gets if soffice process started by this instance may still be running.
 
-                bridge = self._get_bridge(local_factory=localFactory, local_ctx=localContext)
+        Returns:
+            bool: ``False`` if process has exited with an error or pid no longer exist; Otherwise, ``True``.
+        """
+        if self._soffice_process is None:
+            return True
+        code = self._soffice_process.poll()
+        if code is not None and code != 0:
+            return False
+        pid = self.get_soffice_pid()
+        if pid is not None and self._platform != SysInfo.PlatformEnum.WINDOWS:
+            return self._check_pid(pid)
+        return True
 
-                self._bridge_component = bridge.queryInterface(uno.getTypeByName("com.sun.star.lang.XComponent"))
+    def _try_bridge(self) -> None:
+        localContext = cast("XComponentContext", uno.getComponentContext())
+        localFactory = localContext.getServiceManager()
 
-                # smgr = resolver.resolve(conn_str)
-                smgr = cast(
-                    "XMultiComponentFactory",
-                    bridge.getInstance("StarOffice.ServiceManager").queryInterface(
-                        uno.getTypeByName("com.sun.star.lang.XMultiComponentFactory")
-                    ),
-                )
-                props = cast("XPropertySet", smgr.queryInterface(uno.getTypeByName("com.sun.star.beans.XPropertySet")))
+        bridge = self._get_bridge(local_factory=localFactory, local_ctx=localContext)
 
-                self._ctx = props.getPropertyValue("DefaultContext")
-                last_ex = None
+        self._bridge_component = bridge.queryInterface(uno.getTypeByName("com.sun.star.lang.XComponent"))
+
+        smgr = cast(
+            "XMultiComponentFactory",
+            bridge.getInstance("StarOffice.ServiceManager").queryInterface(
+                uno.getTypeByName("com.sun.star.lang.XMultiComponentFactory")
+            ),
+        )
+        props = cast("XPropertySet", smgr.queryInterface(uno.getTypeByName("com.sun.star.beans.XPropertySet")))
+
+        self._ctx = props.getPropertyValue("DefaultContext")
+
+    def _connect(self):
+        # Retries with exponential backoff and jitter until office accepts a bridge or _timeout expires.
+        # Fails early if the soffice process has died.
+        start = time.perf_counter()
+        end_time = start + self._timeout
+        delay = self._conn_try_sleep
+        attempts = 0
+        probes = 0
+        bridge_time = 0.0
+        last_ex = None
+        while True:
+            ready = self._probe_ready()
+            if ready is False:
+                probes += 1
+            if ready is not False or probes % self._probe_bridge_every == 0:
+                attempts += 1
+                bridge_start = time.perf_counter()
+                try:
+                    self._try_bridge()
+                    bridge_time = time.perf_counter() - bridge_start
+                    last_ex = None
+                    break
+                except NoConnectException as e:
+                    last_ex = e
+            if not self._is_process_alive():
+                last_ex = NoConnectException("soffice process exited before accepting a connection", None)
+                break
+            now = time.perf_counter()
+            if now >= end_time:
+                if last_ex is None:
+                    last_ex = NoConnectException(f"soffice not ready after {self._timeout} seconds", None)
                 break
-            except NoConnectException as e:
-                last_ex = e
-                time.sleep(self._conn_try_sleep)
+            time.sleep(min(delay * random.uniform(0.5, 1.0), end_time - now))
+            delay = min(delay * 2, self._conn_max_sleep)
 
+        total = time.perf_counter() - start
+        self._timings = self._timings._replace(wait_ready=total - bridge_time, bridge=bridge_time, attempts=attempts)
         if last_ex is not None:
             raise last_ex
 
+    def _connect_office(self) -> None:
+        # shared connect sequence for pipe and socket connections, records timings.
+        start = time.perf_counter()
+        self._timings = ConnectTimings()
+        self._cache.copy_cache_to_profile()
+        mark = time.perf_counter()
+        profile_copy = mark - start
+        if self._connector.start_office:
+            self._popen()
+        process_start = time.perf_counter() - mark
+        self._timings = self._timings._replace(profile_copy=profile_copy, process_start=process_start)
+        try:
+            self._connect()
+        except NoConnectException as e:
+            if self._connector.start_office:
+                self.kill_soffice()
+            raise e
+        mark = time.perf_counter()
+        self._cache.cache_profile()
+        end = time.perf_counter()
+        self._timings = self._timings._replace(profile_cache=end - mark, total=end - start)
+
     def _popen_from_args(self, args: List[str], shutdown: bool):
         if shutdown == True:
             if self._platform == SysInfo.PlatformEnum.WINDOWS:
@@ -236,6 +336,15 @@ class LoBridgeCommon(ConnectBase):
         """
         return self._cache
     
+    @property
+    def connect_timings(self) -> ConnectTimings:
+        """
+        Gets time spent in each phase of the last connect.
+
+        .. versionadded:: 0.8.4
+        """
+        return self._timings
+
     @property
     def bridge_component(self) -> XComponent:
         return self._bridge_component
@@ -287,6 +396,16 @@ class LoPipeStart(LoBridgeCommon):
     def _get_connection_str(self) -> str:
         return self._connector.get_connnection_str()
 
+    def _probe_ready(self) -> bool | None:
+        # on unix a named pipe is a unix domain socket file created by office when it starts accepting.
+        if self._platform == SysInfo.PlatformEnum.WINDOWS:
+            return None
+        name = f"OSL_PIPE_{os.getuid()}_{self._connector.pipe}"
+        for dirname in ("/tmp", "/var/tmp"):
+            if os.path.exists(os.path.join(dirname, name)):
+                return True
+        return False
+
     def connect(self) -> None:
         """
         Connects to office using a pipe
@@ -294,16 +413,7 @@ class LoPipeStart(LoBridgeCommon):
         Raises:
             NoConnectException: If unable to connect
         """
-        self._cache.copy_cache_to_profile()
-        if self._connector.start_office:
-            self._popen()
-        try:
-            self._connect()
-        except NoConnectException as e:
-            if self._connector.start_office:
-                self.kill_soffice()
-            raise e
-        self._cache.cache_profile()
+        self._connect_office()
 
     def _get_bridge(self, local_factory: XMultiComponentFactory, local_ctx: XComponentContext) -> XBridge:
         connector = cast(
@@ -368,23 +478,21 @@ class LoSocketStart(LoBridgeCommon):
     def _get_connection_str(self) -> str:
         return self._connector.get_connnection_str()
 
+    def _probe_ready(self) -> bool | None:
+        try:
+            with socket.create_connection((self._connector.host, self._connector.port), timeout=0.5):
+                return True
+        except OSError:
+            return False
+
     def connect(self) -> None:
         """
-        Connects to office using a pipe
+        Connects to office using a socket
 
         Raises:
             NoConnectException: If unable to connect
         """
-        self._cache.copy_cache_to_profile()
-        if self._connector.start_office:
-            self._popen()
-        try:
-            self._connect()
-        except NoConnectException as e:
-            if self._connector.start_office:
-                self.kill_soffice()
-            raise e
-        self._cache.cache_profile()
+        self._connect_office()
 
     def _get_bridge(self, local_factory: XMultiComponentFactory, local_ctx: XComponentContext) -> XBridge:
         connector = cast(
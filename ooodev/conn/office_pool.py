@@ -0,0 +1,459 @@
+# coding: utf-8
+from __future__ import annotations
+import contextlib
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Generator, Iterable, List, NamedTuple, TypeVar, TYPE_CHECKING
+import os
+from pathlib import Path
+import uno
+
+from . import cache as mCache
+from . import connectors
+from . import office_util as mOfficeUtil
+from .connect import LoBridgeCommon
+from ..utils.type_var import PathOrStr
+
+from ooo.dyn.beans.property_value import PropertyValue
+
+if TYPE_CHECKING:
+    from com.sun.star.frame import XComponentLoader
+    from com.sun.star.lang import XComponent
+    from com.sun.star.frame import XDesktop
+    from com.sun.star.uno import XComponentContext
+
+_T = TypeVar("_T")
+
+
+class PooledOffice:
+    """
+    A single office instance of :py:class:`~.conn.office_pool.OfficePool`
+
+    Each instance runs its own soffice process with its own profile.
+
+    .. versionadded:: 0.8.4
+    """
+
+    def __init__(self, index: int, conn: LoBridgeCommon) -> None:
+        """
+        Constructor
+
+        Args:
+            index (int): Index of instance in pool.
+            conn (LoBridgeCommon): Connected bridge.
+        """
+        self._index = index
+        self._conn = conn
+        self._desktop = None
+        self._loader = None
+
+    def is_alive(self) -> bool:
+        """
+        Gets if office instance is still responding.
+
+        Returns:
+            bool: ``True`` if office responds; Otherwise, ``False``.
+        """
+        return mOfficeUtil.is_alive(self._conn)
+
+    def make_connector(self) -> connectors.ConnectPipe | connectors.ConnectSocket:
+        """
+        Gets a new connector that connects to this instance without starting office.
+
+        Use in a worker process to connect to a leased instance, such as
+        ``Lo.load_office(office.make_connector())``.
+
+        Returns:
+            ConnectPipe | ConnectSocket: Connector.
+        """
+        conn = self._conn.connector
+        if isinstance(conn, connectors.ConnectSocket):
+            return connectors.ConnectSocket(host=conn.host, port=conn.port, start_office=False)
+        return connectors.ConnectPipe(pipe=conn.pipe, start_office=False)
+
+    @contextlib.contextmanager
+    def open_doc(self, fnm: PathOrStr) -> Generator[XComponent, None, None]:
+        """
+        Context manager that loads a document hidden in this instance and closes it when done.
+
+        :py:meth:`Lo.open_doc() <.utils.lo.Lo.open_doc>` is not used because it sets the global ``Lo`` document.
+
+        Args:
+            fnm (PathOrStr): Document to load.
+
+        Raises:
+            Exception: If document could not be loaded.
+
+        Yields:
+            Generator[XComponent, None, None]: Loaded document.
+        """
+        url = Path(fnm).expanduser().absolute().as_uri()
+        doc = self.loader.loadComponentFromURL(url, "_blank", 0, (PropertyValue(Name="Hidden", Value=True),))
+        if doc is None:
+            raise Exception(f"Unable to open the document: {fnm}")
+        try:
+            yield doc
+        finally:
+            try:
+                doc.queryInterface(uno.getTypeByName("com.sun.star.util.XCloseable")).close(False)
+            except Exception:
+                pass
+
+    def _terminate(self) -> None:
+        try:
+            if self._desktop is not None:
+                self._desktop.terminate()
+        except Exception:
+            pass
+        mOfficeUtil.terminate(self._conn)
+        self._desktop = None
+        self._loader = None
+
+    @property
+    def index(self) -> int:
+        """Gets index of instance in pool"""
+        return self._index
+
+    @property
+    def conn(self) -> LoBridgeCommon:
+        """Gets connection of instance"""
+        return self._conn
+
+    @property
+    def ctx(self) -> XComponentContext:
+        """Gets remote component context of instance"""
+        return self._conn.ctx
+
+    @property
+    def desktop(self) -> XDesktop:
+        """Gets desktop of instance"""
+        if self._desktop is None:
+            ctx = self._conn.ctx
+            desktop = ctx.getServiceManager().createInstanceWithContext("com.sun.star.frame.Desktop", ctx)
+            self._desktop = desktop.queryInterface(uno.getTypeByName("com.sun.star.frame.XDesktop"))
+        return self._desktop
+
+    @property
+    def loader(self) -> XComponentLoader:
+        """Gets component loader of instance, used to load documents."""
+        if self._loader is None:
+            self._loader = self.desktop.queryInterface(uno.getTypeByName("com.sun.star.frame.XComponentLoader"))
+        return self._loader
+
+
+class _RestartPending(NamedTuple):
+    # takes the place of an instance that could not be restarted, restart is tried again on acquire.
+    index: int
+    error: Exception
+
+
+class OfficePool:
+    """
+    Pool of office instances for processing documents in parallel.
+
+    Each instance runs its own headless soffice process with its own copy of the cached profile.
+    Instances are leased to one worker at a time. When an instance is returned it is health checked
+    and restarted if it is no longer responding. If the restart fails the restart is tried again
+    the next time the instance is acquired, the error is available from :py:attr:`~.OfficePool.last_error`.
+
+    ``Lo`` is a static class that holds a single connection. Workers using a pooled instance must use
+    the leased instance :py:attr:`~.PooledOffice.loader` and :py:attr:`~.PooledOffice.ctx`
+    rather than ``Lo`` methods that use the global connection.
+    A worker process can call ``Lo.load_office(office.make_connector())`` to use ``Lo`` with a leased instance.
+
+    Example:
+
+        .. code::
+
+            def convert(pool: OfficePool, fnm: str) -> None:
+                with pool.lease() as office:
+                    doc = office.loader.loadComponentFromURL(FileIO.fnm_to_url(fnm), "_blank", 0, ())
+                    ...
+                    doc.close(True)
+
+            with OfficePool(size=4) as pool:
+                with ThreadPoolExecutor(max_workers=4) as ex:
+                    list(ex.map(lambda f: convert(pool, f), files))
+
+    .. versionadded:: 0.8.4
+    """
+
+    def __init__(
+        self,
+        size: int = 0,
+        connector: Callable[[int], connectors.ConnectPipe | connectors.ConnectSocket] | None = None,
+        cache_obj: mCache.Cache | None = None,
+    ) -> None:
+        """
+        Constructor
+
+        Args:
+            size (int, optional): Number of office instances. Defaults to number of cpu's.
+            connector (Callable[[int], ConnectPipe | ConnectSocket], optional): Callable that gets a new connector
+                for the instance index passed to it. When using sockets each instance must have its own port.
+                Defaults to a headless ``ConnectPipe`` with a unique pipe name.
+            cache_obj (Cache, optional): Cache used as the source profile for all instances.
+                Each instance copies the profile into its own working dir. Defaults to a new ``Cache``.
+        """
+        if size < 1:
+            size = os.cpu_count() or 1
+        self._size = size
+        if connector is None:
+            self._connector = lambda i: connectors.ConnectPipe(headless=True)
+        else:
+            self._connector = connector
+        if cache_obj is None:
+            cache_obj = mCache.Cache()
+        self._cache_template = cache_obj
+        # running instances keyed by index, an instance that failed to restart has no entry.
+        self._offices: Dict[int, PooledOffice] = {}
+        self._idle: queue.Queue[PooledOffice | _RestartPending] = queue.Queue()
+        self._lock = threading.Lock()
+        self._started = False
+        self._last_error: Exception | None = None
+
+    def _start_office(self, index: int) -> PooledOffice:
+        # each instance gets its own working dir, the cached profile is shared.
+        conn = mOfficeUtil.start_office(self._connector(index), self._cache_template.clone())
+        return PooledOffice(index=index, conn=conn)
+
+    def start(self) -> None:
+        """
+        Starts all office instances.
+
+        The first instance is started alone so it can populate the profile cache if needed,
+        remaining instances are started in parallel.
+
+        Raises:
+            NoConnectException: If unable to connect to an instance.
+        """
+        with self._lock:
+            if self._started:
+                return
+            offices = [self._start_office(0)]
+            try:
+                if self._size > 1:
+                    with ThreadPoolExecutor(max_workers=self._size - 1) as ex:
+                        offices.extend(ex.map(self._start_office, range(1, self._size)))
+            except Exception:
+                for office in offices:
+                    office._terminate()
+                raise
+            self._offices = {office.index: office for office in offices}
+            self._last_error = None
+            for office in offices:
+                self._idle.put(office)
+            self._started = True
+
+    def acquire(self, timeout: float | None = None) -> PooledOffice:
+        """
+        Gets an idle office instance. Blocks until one is available.
+
+        Args:
+            timeout (float, optional): Seconds to wait. Defaults to waiting forever.
+
+        Raises:
+            TimeoutError: If no instance became available within ``timeout``.
+            NoConnectException: If the instance had failed to restart and restarting it failed again.
+
+        Returns:
+            PooledOffice: Office instance. Must be returned with :py:meth:`~.OfficePool.release`.
+        """
+        if not self._started:
+            self.start()
+        try:
+            item = self._idle.get(timeout=timeout)
+        except queue.Empty:
+            raise TimeoutError("No office instance available") from None
+        if isinstance(item, PooledOffice):
+            return item
+        result = self._try_start(item.index)
+        if isinstance(result, _RestartPending):
+            # keep the place of the instance so the pool does not shrink.
+            self._idle.put(result)
+            raise result.error
+        return result
+
+    def release(self, office: PooledOffice) -> None:
+        """
+        Returns an office instance to the pool.
+
+        The instance is health checked and restarted if it is no longer responding.
+        This method does not raise if restarting fails, the restart is tried again when the instance is acquired.
+
+        Args:
+            office (PooledOffice): Instance obtained from :py:meth:`~.OfficePool.acquire`.
+        """
+        if not self._started:
+            office._terminate()
+            return
+        if office.is_alive():
+            self._idle.put(office)
+        else:
+            self._idle.put(self._restart(office))
+
+    @contextlib.contextmanager
+    def lease(self, timeout: float | None = None) -> Generator[PooledOffice, None, None]:
+        """
+        Context manager that acquires an office instance and releases it when done.
+
+        Args:
+            timeout (float, optional): Seconds to wait for an instance. Defaults to waiting forever.
+
+        Raises:
+            TimeoutError: If no instance became available within ``timeout``.
+
+        Yields:
+            Generator[PooledOffice, None, None]: Office instance.
+        """
+        office = self.acquire(timeout=timeout)
+        try:
+            yield office
+        finally:
+            self.release(office)
+
+    def _restart(self, office: PooledOffice) -> PooledOffice | _RestartPending:
+        with self._lock:
+            if self._offices.get(office.index, None) is office:
+                del self._offices[office.index]
+        office._terminate()
+        return self._try_start(office.index)
+
+    def _try_start(self, index: int) -> PooledOffice | _RestartPending:
+        # never raises, on error returns an item that takes the place of the instance.
+        try:
+            new_office = self._start_office(index)
+        except Exception as e:
+            self._last_error = e
+            return _RestartPending(index=index, error=e)
+        with self._lock:
+            self._offices[index] = new_office
+        return new_office
+
+    def health_check(self) -> int:
+        """
+        Checks all idle instances and restarts any that are no longer responding.
+
+        Instances that failed to restart earlier are restarted as well.
+        Restart errors are not raised, see :py:attr:`~.OfficePool.last_error`.
+
+        Returns:
+            int: Number of instances restarted.
+        """
+        restarted = 0
+        checked: List[PooledOffice | _RestartPending] = []
+        while True:
+            try:
+                item = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            if isinstance(item, _RestartPending):
+                item = self._try_start(item.index)
+            elif not item.is_alive():
+                item = self._restart(item)
+            else:
+                checked.append(item)
+                continue
+            if isinstance(item, PooledOffice):
+                restarted += 1
+            checked.append(item)
+        for office in checked:
+            self._idle.put(office)
+        return restarted
+
+    def close(self) -> None:
+        """
+        Terminates all office instances and deletes their working dirs.
+        """
+        with self._lock:
+            offices = list(self._offices.values())
+            self._offices = {}
+            self._started = False
+        while True:
+            try:
+                self._idle.get_nowait()
+            except queue.Empty:
+                break
+        for office in offices:
+            office._terminate()
+
+    @property
+    def size(self) -> int:
+        """Gets number of office instances in pool"""
+        return self._size
+
+    @property
+    def offices(self) -> List[PooledOffice]:
+        """Gets all running office instances in pool, leased or not"""
+        with self._lock:
+            return [self._offices[i] for i in sorted(self._offices)]
+
+    @property
+    def last_error(self) -> Exception | None:
+        """Gets the last error raised while restarting an instance, if any"""
+        return self._last_error
+
+    def __enter__(self) -> OfficePool:
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+
+def run_jobs(pool: OfficePool, items: Iterable[_T], func: Callable[[_T], None], name: str = "ooodev-pool") -> None:
+    """
+    Calls ``func`` for each item using one worker thread for each office instance of ``pool``.
+
+    Items are read as they are needed so ``items`` can be a generator over a very large number of items.
+    ``func`` is responsible for leasing an office instance from ``pool``.
+
+    If ``func`` raises, no more items are read. Workers that are running finish their current item,
+    then the first error is raised. Workers never stop early so reading items can not block on a full queue.
+
+    Args:
+        pool (OfficePool): Started office pool.
+        items (Iterable[_T]): Items to process.
+        func (Callable[[_T], None]): Called with each item from a worker thread.
+        name (str, optional): Name prefix of worker threads.
+
+    Raises:
+        Exception: First error raised by ``func`` or while reading ``items``.
+
+    .. versionadded:: 0.8.4
+    """
+    jobs: queue.Queue[Any] = queue.Queue(maxsize=pool.size * 2)
+    errors: List[Exception] = []
+    stop = threading.Event()
+    done = object()
+
+    def work() -> None:
+        while True:
+            item = jobs.get()
+            if item is done:
+                return
+            if stop.is_set():
+                # keep taking items so the producer never blocks.
+                continue
+            try:
+                func(item)
+            except Exception as e:
+                errors.append(e)
+                stop.set()
+
+    threads = [threading.Thread(target=work, name=f"{name}-{i}", daemon=True) for i in range(pool.size)]
+    try:
+        for t in threads:
+            t.start()
+        for item in items:
+            if stop.is_set():
+                break
+            jobs.put(item)
+    finally:
+        for _ in threads:
+            jobs.put(done)
+        for t in threads:
+            t.join()
+    if errors:
+        raise errors[0]
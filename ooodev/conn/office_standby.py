@@ -0,0 +1,202 @@
+# coding: utf-8
+from __future__ import annotations
+import queue
+import threading
+import time
+from typing import Callable, List
+
+from . import cache as mCache
+from . import connectors
+from . import office_util as mOfficeUtil
+from .connect import LoBridgeCommon
+
+
+class OfficeStandby:
+    """
+    Keeps started and connected office instances on standby.
+
+    Starting office is the slowest part of connecting. ``OfficeStandby`` starts instances ahead of time,
+    each with its own copy of the cached profile. Passing an ``OfficeStandby`` to :py:meth:`.Lo.load_office`
+    hands a standby instance to ``Lo`` instead of starting a new office.
+    Each time an instance is taken a replacement is started in the background.
+
+    Example:
+
+        .. code::
+
+            with OfficeStandby(size=1) as standby:
+                for fnm in files:
+                    loader = Lo.load_office(standby)
+                    doc = Lo.open_doc(fnm, loader)
+                    ...
+                    Lo.close_office()
+
+    .. versionadded:: 0.8.4
+    """
+
+    def __init__(
+        self,
+        size: int = 1,
+        connector: Callable[[], connectors.ConnectPipe | connectors.ConnectSocket] | None = None,
+        cache_obj: mCache.Cache | None = None,
+    ) -> None:
+        """
+        Constructor
+
+        Args:
+            size (int, optional): Number of instances to keep on standby. Defaults to ``1``.
+            connector (Callable[[], ConnectPipe | ConnectSocket], optional): Callable that gets a new connector
+                for each instance started. When using sockets each instance must have its own port.
+                Defaults to a headless ``ConnectPipe`` with a unique pipe name.
+            cache_obj (Cache, optional): Cache used as the source profile for all instances.
+                Each instance copies the profile into its own working dir. Defaults to a new ``Cache``.
+        """
+        self._size = max(1, size)
+        if connector is None:
+            self._connector = lambda: connectors.ConnectPipe(headless=True)
+        else:
+            self._connector = connector
+        if cache_obj is None:
+            cache_obj = mCache.Cache()
+        self._cache_template = cache_obj
+        # holds connected instances or the exception raised while starting an instance.
+        self._ready: queue.Queue[LoBridgeCommon | Exception] = queue.Queue()
+        self._threads: List[threading.Thread] = []
+        self._lock = threading.Lock()
+        self._started = False
+        self._closed = False
+
+    def _start_office(self) -> LoBridgeCommon:
+        # each instance gets its own working dir, the cached profile is shared.
+        return mOfficeUtil.start_office(self._connector(), self._cache_template.clone())
+
+    def _replenish(self) -> None:
+        try:
+            conn = self._start_office()
+        except Exception as e:
+            self._ready.put(e)
+            return
+        if self._closed:
+            mOfficeUtil.terminate(conn)
+            return
+        self._ready.put(conn)
+
+    def _replenish_async(self) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            self._threads = [t for t in self._threads if t.is_alive()]
+            t = threading.Thread(target=self._replenish, name="ooodev-office-standby", daemon=True)
+            self._threads.append(t)
+            t.start()
+
+    def start(self, wait: bool = False) -> None:
+        """
+        Starts standby instances in the background.
+
+        The first instance is started alone so it can populate the profile cache if needed.
+
+        Args:
+            wait (bool, optional): If ``True`` blocks until the first instance is ready. Defaults to ``False``.
+
+        Raises:
+            NoConnectException: If ``wait`` is ``True`` and unable to connect to first instance.
+        """
+        with self._lock:
+            if self._started:
+                return
+            self._started = True
+            self._closed = False
+        if wait:
+            self._ready.put(self._start_office())
+            self._replenish_rest()
+            return
+        with self._lock:
+            t = threading.Thread(target=self._start_all, name="ooodev-office-standby", daemon=True)
+            self._threads.append(t)
+            t.start()
+
+    def _start_all(self) -> None:
+        self._replenish()
+        self._replenish_rest()
+
+    def _replenish_rest(self) -> None:
+        for _ in range(self._size - 1):
+            self._replenish_async()
+
+    def take(self, timeout: float | None = None) -> LoBridgeCommon:
+        """
+        Gets a connected office instance and starts a replacement in the background.
+
+        The instance is no longer managed by ``OfficeStandby``. Caller is responsible for terminating it,
+        :py:meth:`.Lo.close_office` does this when the instance was passed to :py:meth:`.Lo.load_office`.
+
+        Args:
+            timeout (float, optional): Seconds to wait for an instance. Defaults to waiting forever.
+                The timeout includes time spent waiting for replacements of instances that died while on standby.
+
+        Raises:
+            TimeoutError: If no instance became ready within ``timeout``.
+            NoConnectException: If starting the standby instance failed.
+
+        Returns:
+            LoBridgeCommon: Connected office instance.
+        """
+        if self._closed:
+            raise RuntimeError("OfficeStandby is closed")
+        if not self._started:
+            self.start()
+        deadline = None if timeout is None else time.monotonic() + timeout
+        remaining = timeout
+        while True:
+            try:
+                item = self._ready.get(timeout=remaining)
+            except queue.Empty:
+                raise TimeoutError("No standby office instance available") from None
+            self._replenish_async()
+            if isinstance(item, Exception):
+                raise item
+            if mOfficeUtil.is_alive(item):
+                return item
+            # instance died while on standby, replacement is already started.
+            mOfficeUtil.terminate(item)
+            if deadline is not None:
+                remaining = max(0.0, deadline - time.monotonic())
+
+    def close(self) -> None:
+        """
+        Terminates all standby instances and deletes their working dirs.
+
+        Instances that have been taken are not affected.
+        """
+        with self._lock:
+            self._closed = True
+            self._started = False
+            threads = self._threads
+            self._threads = []
+        for t in threads:
+            t.join()
+        while True:
+            try:
+                item = self._ready.get_nowait()
+            except queue.Empty:
+                break
+            if not isinstance(item, Exception):
+                mOfficeUtil.terminate(item)
+
+    @property
+    def size(self) -> int:
+        """Gets number of instances kept on standby"""
+        return self._size
+
+    @property
+    def ready_count(self) -> int:
+        """Gets approximate number of instances ready to be taken"""
+        return self._ready.qsize()
+
+    def __enter__(self) -> OfficeStandby:
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
@@ -0,0 +1,77 @@
+# coding: utf-8
+"""Helpers for starting and stopping office instances that are not managed by ``Lo``"""
+from __future__ import annotations
+
+from . import cache as mCache
+from . import connectors
+from .connect import LoBridgeCommon, LoPipeStart, LoSocketStart
+
+
+def start_office(
+    connector: connectors.ConnectPipe | connectors.ConnectSocket, cache_obj: mCache.Cache
+) -> LoBridgeCommon:
+    """
+    Starts and connects to a new office instance.
+
+    Args:
+        connector (ConnectPipe | ConnectSocket): Connector of the new instance.
+        cache_obj (Cache): Cache of the new instance. Use :py:meth:`.Cache.clone` so each instance
+            has its own working dir.
+
+    Raises:
+        NoConnectException: If unable to connect to office.
+
+    Returns:
+        LoBridgeCommon: Connected bridge.
+
+    .. versionadded:: 0.8.4
+    """
+    if isinstance(connector, connectors.ConnectSocket):
+        conn = LoSocketStart(connector=connector, cache_obj=cache_obj)
+    else:
+        conn = LoPipeStart(connector=connector, cache_obj=cache_obj)
+    conn.connect()
+    return conn
+
+
+def is_alive(conn: LoBridgeCommon) -> bool:
+    """
+    Gets if an office instance is still responding.
+
+    Args:
+        conn (LoBridgeCommon): Connected bridge.
+
+    Returns:
+        bool: ``True`` if office responds; Otherwise, ``False``.
+
+    .. versionadded:: 0.8.4
+    """
+    try:
+        ctx = conn.ctx
+        if ctx is None:
+            return False
+        # round trip to office, raises if bridge is gone.
+        return ctx.getServiceManager() is not None
+    except Exception:
+        return False
+
+
+def terminate(conn: LoBridgeCommon) -> None:
+    """
+    Kills an office instance and deletes its working dir.
+
+    Errors are ignored, office may already be gone.
+
+    Args:
+        conn (LoBridgeCommon): Connected bridge.
+
+    .. versionadded:: 0.8.4
+    """
+    try:
+        conn.kill_soffice()
+    except Exception:
+        pass
+    try:
+        conn.del_working_dir()
+    except Exception:
+        pass
@@ -20,6 +20,11 @@ class _Events(object):
     """
 
     _instance = None
+    # subscription index shared by all event classes: event name -> number of registered callbacks.
+    # Counts may be higher than actual when a callback has gone out of scope, never lower.
+    _subscriptions: Dict[str, int] = {}
+    # set when an observer that is not indexed is added, every event must then be dispatched.
+    _dispatch_all = False
 
     def __new__(cls, *args, **kwargs):
         if not cls._instance:
@@ -43,6 +48,43 @@ class _Events(object):
             self._callbacks[event_name] = [ref(callback)]
         else:
             self._callbacks[event_name].append(ref(callback))
+        self._subscribe(event_name)
+
+    def has_listeners(self, event_name: str) -> bool:
+        """
+        Gets if any callback may be registered for an event name.
+
+        Callers can use this to avoid creating event args when there is no one to receive them.
+
+        Args:
+            event_name (str): Event name.
+
+        Returns:
+            bool: ``True`` if event may have listeners; Otherwise, ``False``.
+
+        .. versionadded:: 0.8.4
+        """
+        return _Events._dispatch_all or event_name in _Events._subscriptions
+
+    @staticmethod
+    def _subscribe(event_name: str) -> None:
+        subs = _Events._subscriptions
+        subs[event_name] = subs.get(event_name, 0) + 1
+
+    @staticmethod
+    def _unsubscribe(event_name: str, count: int = 1) -> None:
+        subs = _Events._subscriptions
+        remaining = subs.get(event_name, 0) - count
+        if remaining > 0:
+            subs[event_name] = remaining
+        else:
+            subs.pop(event_name, None)
+
+    @staticmethod
+    def _index_observer(observer: event_observer.EventObserver) -> None:
+        # observers that do not report their callbacks to the index could handle any event.
+        if not getattr(observer, "_indexed_events", False):
+            _Events._dispatch_all = True
 
     def trigger(self, event_name: str, event_args: EventArgs, *args, **kwargs) -> None:
         """
@@ -54,6 +96,9 @@ class _Events(object):
             args (Any, optional): Optional positional args to pass to callback
             kwargs (Any, optional): Optional keyword args to pass to callback
         """
+        if not (_Events._dispatch_all or event_name in _Events._subscriptions):
+            # no callback registered for event on this or any observer.
+            return
         if self._callbacks is not None and event_name in self._callbacks:
             cleanup = None
             for i, callback in enumerate(self._callbacks[event_name]):
@@ -77,6 +122,7 @@ class _Events(object):
                 cleanup.reverse()
                 for i in cleanup:
                     self._callbacks[event_name].pop(i)
+                self._unsubscribe(event_name, len(cleanup))
                 if len(self._callbacks[event_name]) == 0:
                     del self._callbacks[event_name]
         self._update_observers(event_name, event_args)
@@ -104,4 +150,5 @@ class _Events(object):
         if self._observers is None:
             self._observers = []
         for observer in args:
+            self._index_observer(observer)
             self._observers.append(ref(observer))
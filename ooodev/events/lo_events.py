@@ -29,9 +29,22 @@ class EventArg(NamedTuple):
 class _event_base(object):
     """Base events class"""
 
+    # callbacks are reported to event_singleton._Events subscription index.
+    _indexed_events = True
+
     def __init__(self) -> None:
         self._callbacks = None
 
+    def __del__(self) -> None:
+        # remove callbacks of this instance from subscription index.
+        try:
+            if self._callbacks:
+                for event_name, callbacks in self._callbacks.items():
+                    event_singleton._Events._unsubscribe(event_name, len(callbacks))
+        except Exception:
+            # module may already be unloaded at interpreter exit.
+            pass
+
     def on(self, event_name: str, callback: EventCallback):
         """
         Registers an event
@@ -47,6 +60,7 @@ class _event_base(object):
             self._callbacks[event_name] = [ref(callback)]
         else:
             self._callbacks[event_name].append(ref(callback))
+        event_singleton._Events._subscribe(event_name)
 
     def remove(self, event_name: str, callback: EventCallback) -> bool:
         """
@@ -67,6 +81,7 @@ class _event_base(object):
             # cb = cast(Dict[str, List[EventCallback]], self._callbacks)
             try:
                 self._callbacks[event_name].remove(ref(callback))
+                event_singleton._Events._unsubscribe(event_name)
                 result = True
             except ValueError:
                 pass
@@ -111,6 +126,7 @@ class _event_base(object):
                 cleanup.reverse()
                 for i in cleanup:
                     self._callbacks[event_name].pop(i)
+                event_singleton._Events._unsubscribe(event_name, len(cleanup))
                 if len(self._callbacks[event_name]) == 0:
                     del self._callbacks[event_name]
 
@@ -192,6 +208,7 @@ class LoEvents(_event_base):
         if self._observers is None:
             self._observers = []
         for observer in args:
+            event_singleton._Events._index_observer(observer)
             self._observers.append(ref(observer))
 
     def trigger(self, event_name: str, event_args: EventArgs):
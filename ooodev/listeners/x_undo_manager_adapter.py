@@ -0,0 +1,111 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+from ..mock import mock_g
+
+if mock_g.DOCS_BUILDING:
+    from ..mock import unohelper
+else:
+    import unohelper
+
+from com.sun.star.document import XUndoManagerListener
+
+if TYPE_CHECKING:
+    from com.sun.star.document import UndoManagerEvent
+    from com.sun.star.lang import EventObject
+
+
+class XUndoManagerAdapter(unohelper.Base, XUndoManagerListener):
+    """
+    makes it possible to receive events from an undo manager.
+
+    This class is meant a parent class.
+
+    See Also:
+        `API XUndoManagerListener <https://api.libreoffice.org/docs/idl/ref/interfacecom_1_1sun_1_1star_1_1document_1_1XUndoManagerListener.html>`_
+
+    .. versionadded:: 0.8.4
+    """
+
+    def undoActionAdded(self, event: UndoManagerEvent) -> None:
+        """
+        is called when an undo action is added to the undo stack.
+
+        Note that the action must not necessarily be the new top element of the stack: In case there's an open
+        Undo context, UndoManagerEvent.UndoContextDepth will be greater 0, and the newly added action will be
+        subordinate of the context action.
+        """
+        pass
+
+    def actionUndone(self, event: UndoManagerEvent) -> None:
+        """
+        is called when the top-most action of the undo stack has been undone.
+        """
+        pass
+
+    def actionRedone(self, event: UndoManagerEvent) -> None:
+        """
+        is called when the top-most action of the Redo stack has been re-applied.
+        """
+        pass
+
+    def allActionsCleared(self, event: EventObject) -> None:
+        """
+        is called when both the Undo and the Redo stack have been cleared from all Undo actions.
+        """
+        pass
+
+    def redoActionsCleared(self, event: EventObject) -> None:
+        """
+        is called when the Redo stack has been cleared.
+        """
+        pass
+
+    def resetAll(self, event: EventObject) -> None:
+        """
+        called when the complete undo manager has been reset
+        """
+        pass
+
+    def enteredContext(self, event: UndoManagerEvent) -> None:
+        """
+        is called when a new Undo context has been entered.
+        """
+        pass
+
+    def enteredHiddenContext(self, event: UndoManagerEvent) -> None:
+        """
+        is called when a new hidden Undo context has been entered.
+        """
+        pass
+
+    def leftContext(self, event: UndoManagerEvent) -> None:
+        """
+        is called when an Undo context has been left.
+        """
+        pass
+
+    def leftHiddenContext(self, event: UndoManagerEvent) -> None:
+        """
+        is called when a hidden Undo context has been left.
+        """
+        pass
+
+    def cancelledContext(self, event: UndoManagerEvent) -> None:
+        """
+        is called when an Undo context has been left, but no actions have been added within this context.
+        """
+        pass
+
+    def disposing(self, event: EventObject) -> None:
+        """
+        gets called when the broadcaster is about to be disposed.
+
+        All listeners and all other objects, which reference the broadcaster
+        should release the reference to the source. No method should be invoked
+        anymore on this object ( including XComponent.removeEventListener() ).
+
+        This method is called for every listener registration of derived listener
+        interfaced, not only for registrations at XComponent.
+        """
+        # from com.sun.star.lang.XEventListener
+        pass
@@ -3,10 +3,11 @@
 # See Also: https://fivedots.coe.psu.ac.th/~ad/jlop/
 # region Imports
 from __future__ import annotations
+from concurrent.futures import ThreadPoolExecutor
 from enum import IntEnum, IntFlag, Enum
 import numbers
 import re
-from typing import Any, List, Tuple, cast, overload, Sequence, TYPE_CHECKING
+from typing import Any, Generator, Iterable, List, Tuple, cast, overload, Sequence, TYPE_CHECKING
 import uno
 
 # from ..mock import mock_g
@@ -20,17 +21,18 @@ from com.sun.star.container import XNamed
 from com.sun.star.frame import XModel
 from com.sun.star.lang import Locale
 from com.sun.star.lang import XComponent
+from com.sun.star.sheet import FormulaResult  # const
 from com.sun.star.sheet import SolverConstraint  # struct
 from com.sun.star.sheet import XCellAddressable
 from com.sun.star.sheet import XCellRangeAddressable
 from com.sun.star.sheet import XCellRangeData
+from com.sun.star.sheet import XCellRangeFormula
 from com.sun.star.sheet import XCellRangeMovement
 from com.sun.star.sheet import XCellRangesQuery
 from com.sun.star.sheet import XCellSeries
 from com.sun.star.sheet import XDataPilotTable
 from com.sun.star.sheet import XDataPilotTablesSupplier
 from com.sun.star.sheet import XFunctionAccess
-from com.sun.star.sheet import XFunctionDescriptions
 from com.sun.star.sheet import XHeaderFooterContent
 from com.sun.star.sheet import XRecentFunctions
 from com.sun.star.sheet import XScenario
@@ -58,6 +60,7 @@ from com.sun.star.util import XNumberFormatsSupplier
 from com.sun.star.util import XNumberFormatTypes
 
 if TYPE_CHECKING:
+    import numpy as np
     from com.sun.star.beans import XPropertySet
     from com.sun.star.frame import XComponentLoader
     from com.sun.star.frame import XController
@@ -88,6 +91,7 @@ from ooo.dyn.awt.size import Size
 
 from ..exceptions import ex as mEx
 from ..formatters.formatter_table import FormatterTable
+from ..utils import function_catalog as mFnCat
 from ..utils import gui as mGui
 from ..utils import info as mInfo
 from ..utils import lo as mLo
@@ -98,6 +102,8 @@ from ..utils.color import CommonColor, Color
 from ..utils.data_type import range_obj as mRngObj
 from ..utils.data_type import range_values as mRngValues
 from ..utils.data_type import cell_obj as mCellObj
+from ..utils.data_type import cell_addr as mCellAddr
+from ..utils.data_type import range_addr as mRngAddr
 from ..utils.gen_util import ArgsHelper, Util as GenUtil
 from ..utils.type_var import PathOrStr, Row, Column, Table, TupleArray, FloatList, FloatTable
 
@@ -355,9 +361,33 @@ class Calc:
     # region --------------- sheet methods -----------------------------
 
     # region    get_sheet()
+    @staticmethod
+    def _get_sheet_by_index(doc: XSpreadsheetDocument, index: int) -> XSpreadsheet:
+        try:
+            xsheets_idx = mLo.Lo.qi(XIndexAccess, doc.getSheets(), True)
+            return mLo.Lo.qi(XSpreadsheet, xsheets_idx.getByIndex(index), raise_err=True)
+        except Exception as e:
+            raise Exception(f"Could not access spreadsheet: {index}") from e
+
+    @staticmethod
+    def _get_sheet_by_name(doc: XSpreadsheetDocument, sheet_name: str) -> XSpreadsheet:
+        try:
+            return mLo.Lo.qi(XSpreadsheet, doc.getSheets().getByName(sheet_name), raise_err=True)
+        except Exception as e:
+            raise Exception(f"Could not access spreadsheet: '{sheet_name}'") from e
+
+    @staticmethod
+    def _has_sheet_listeners() -> bool:
+        events = _Events()
+        return events.has_listeners(CalcNamedEvent.SHEET_GETTING) or events.has_listeners(CalcNamedEvent.SHEET_GET)
+
     @staticmethod
     def _get_sheet_index(doc: XSpreadsheetDocument, index: int) -> XSpreadsheet:
         """return the spreadsheet with the specified index (0-based)"""
+        if not Calc._has_sheet_listeners():
+            # no need to create event args.
+            return Calc._get_sheet_by_index(doc, index)
+
         cargs = SheetCancelArgs(Calc.get_sheet.__qualname__)
         cargs.index = index
         cargs.name = None
@@ -367,19 +397,17 @@ class Calc:
         if cargs.cancel:
             mEx.CancelEventError(cargs)
 
-        index = cargs.index
-        sheets = cargs.doc.getSheets()
-        try:
-            xsheets_idx = mLo.Lo.qi(XIndexAccess, sheets, True)
-            sheet = mLo.Lo.qi(XSpreadsheet, xsheets_idx.getByIndex(index), raise_err=True)
-            _Events().trigger(CalcNamedEvent.SHEET_GET, SheetArgs.from_args(cargs))
-            return sheet
-        except Exception as e:
-            raise Exception(f"Could not access spreadsheet: {index}") from e
+        sheet = Calc._get_sheet_by_index(cargs.doc, cargs.index)
+        _Events().trigger(CalcNamedEvent.SHEET_GET, SheetArgs.from_args(cargs))
+        return sheet
 
     @staticmethod
     def _get_sheet_name(doc: XSpreadsheetDocument, sheet_name: str) -> XSpreadsheet:
         """return the spreadsheet with the specified index (0-based)"""
+        if not Calc._has_sheet_listeners():
+            # no need to create event args.
+            return Calc._get_sheet_by_name(doc, sheet_name)
+
         cargs = SheetCancelArgs(Calc.get_sheet.__qualname__)
         cargs.name = sheet_name
         cargs.index = None
@@ -387,14 +415,9 @@ class Calc:
         _Events().trigger(CalcNamedEvent.SHEET_GETTING, cargs)
         if cargs.cancel:
             mEx.CancelEventError(cargs)
-        sheet_name = cargs.name
-        sheets = cargs.doc.getSheets()
-        try:
-            sheet = mLo.Lo.qi(XSpreadsheet, sheets.getByName(sheet_name), raise_err=True)
-            _Events().trigger(CalcNamedEvent.SHEET_GET, SheetArgs.from_args(cargs))
-            return sheet
-        except Exception as e:
-            raise Exception(f"Could not access spreadsheet: '{sheet_name}'") from e
+        sheet = Calc._get_sheet_by_name(cargs.doc, cargs.name)
+        _Events().trigger(CalcNamedEvent.SHEET_GET, SheetArgs.from_args(cargs))
+        return sheet
 
     @overload
     @classmethod
@@ -2772,6 +2795,101 @@ class Calc:
             return
         cr_data.setDataArray(values)
 
+    # region write_rows()
+
+    @classmethod
+    def _write_rows_block(
+        cls, sheet: XSpreadsheet, col_start: int, row_start: int, block: List[Tuple[Any, ...]]
+    ) -> None:
+        cell_range = cls._get_cell_range_col_row(
+            sheet=sheet,
+            start_col=col_start,
+            start_row=row_start,
+            end_col=col_start + len(block[0]) - 1,
+            end_row=row_start + len(block) - 1,
+        )
+        cr_data = mLo.Lo.qi(XCellRangeData, cell_range, raise_err=True)
+        cr_data.setDataArray(tuple(block))
+
+    @classmethod
+    def write_rows(
+        cls,
+        sheet: XSpreadsheet,
+        cell_name: str | mCellObj.CellObj,
+        rows: Iterable[Row],
+        chunk_rows: int = 10_000,
+        lock_controllers: bool = True,
+    ) -> int:
+        """
+        Writes rows of data into spreadsheet from any iterable of rows.
+
+        Rows are buffered into blocks of ``chunk_rows`` and each block is written using a single
+        ``setDataArray()`` call. The full table never needs to be held in memory which makes this method
+        suitable for writing rows produced by a generator.
+
+        Args:
+            sheet (XSpreadsheet): Spreadsheet
+            cell_name (str | CellObj): Top left cell to begin writing such as 'A1'
+            rows (Iterable[Row]): Rows of data. All rows must have the same number of columns.
+            chunk_rows (int, optional): Number of rows written with each call. Defaults to ``10_000``.
+            lock_controllers (bool, optional): If ``True`` then controllers are locked while writing. Defaults to ``True``.
+
+        Raises:
+            ValueError: If ``chunk_rows`` is less than ``1``.
+            ValueError: If a row does not have the same number of columns as the first row.
+            MissingInterfaceError: if interface is missing
+
+        Returns:
+            int: Number of rows written.
+
+        Example:
+            .. code-block:: python
+
+                def gen_rows():
+                    for i in range(1_000_000):
+                        yield (i, i * 2, f"Item {i}")
+
+                count = Calc.write_rows(sheet, "A1", gen_rows(), chunk_rows=20_000)
+
+        See Also:
+            - :py:meth:`~.Calc.set_array`
+            - :py:meth:`~.Calc.iter_rows`
+
+        .. versionadded:: 0.8.4
+        """
+        if chunk_rows < 1:
+            raise ValueError(f"chunk_rows must be 1 or greater. Got: {chunk_rows}")
+        pos = cls.get_cell_position(cell_name)
+        col_start = pos.X
+        row_start = pos.Y
+        col_len = -1
+        written = 0
+        block: List[Tuple[Any, ...]] = []
+        locked = mLo.Lo.lock_controllers() if lock_controllers else False
+        try:
+            for row in rows:
+                row = tuple(row)
+                if col_len < 0:
+                    col_len = len(row)
+                    if col_len == 0:
+                        raise ValueError("Rows must contain at least one column")
+                elif len(row) != col_len:
+                    raise ValueError(f"Row {written + len(block)} has {len(row)} columns. Expected {col_len} columns.")
+                block.append(row)
+                if len(block) == chunk_rows:
+                    cls._write_rows_block(sheet=sheet, col_start=col_start, row_start=row_start + written, block=block)
+                    written += len(block)
+                    block = []
+            if block:
+                cls._write_rows_block(sheet=sheet, col_start=col_start, row_start=row_start + written, block=block)
+                written += len(block)
+        finally:
+            if locked:
+                mLo.Lo.unlock_controllers()
+        return written
+
+    # endregion write_rows()
+
     # region set_array_cell()
 
     @classmethod
@@ -2932,6 +3050,92 @@ class Calc:
 
     # endregion get_array()
 
+    # region iter_rows()
+
+    @classmethod
+    def _get_chunk_array(
+        cls, sheet: XSpreadsheet, col_start: int, row_start: int, col_end: int, row_end: int
+    ) -> TupleArray:
+        cell_range = cls._get_cell_range_col_row(
+            sheet=sheet, start_col=col_start, start_row=row_start, end_col=col_end, end_row=row_end
+        )
+        cr_data = mLo.Lo.qi(XCellRangeData, cell_range, raise_err=True)
+        return cr_data.getDataArray()
+
+    @classmethod
+    def iter_rows(
+        cls,
+        sheet: XSpreadsheet,
+        chunk_rows: int = 10_000,
+        cr_addr: CellRangeAddress | None = None,
+        prefetch: bool = False,
+    ) -> Generator[Tuple[Any, ...], None, None]:
+        """
+        Iterates the rows of a sheet used range, reading data from spreadsheet in blocks of rows.
+
+        Only one block of rows (two when ``prefetch`` is ``True``) is held in memory at a time
+        which keeps memory bounded for very large sheets.
+
+        Args:
+            sheet (XSpreadsheet): Spreadsheet
+            chunk_rows (int, optional): Number of rows read in each block. Defaults to ``10_000``.
+            cr_addr (CellRangeAddress, optional): Range to iterate. Defaults to used range of ``sheet``.
+            prefetch (bool, optional): If ``True`` then the next block is read on a background thread
+                while the current block is being processed. Defaults to ``False``.
+
+        Raises:
+            ValueError: If ``chunk_rows`` is less than ``1``.
+            MissingInterfaceError: if interface is missing
+
+        Yields:
+            Generator[Tuple[Any, ...], None, None]: Each row of data as a tuple.
+
+        Example:
+            .. code-block:: python
+
+                for row in Calc.iter_rows(sheet, chunk_rows=5_000):
+                    process(row)
+
+        See Also:
+            - :py:meth:`~.Calc.get_array`
+            - :py:meth:`~.Calc.find_used_range`
+
+        .. versionadded:: 0.8.4
+        """
+        if chunk_rows < 1:
+            raise ValueError(f"chunk_rows must be 1 or greater. Got: {chunk_rows}")
+        if cr_addr is None:
+            used_range = cls.find_used_range(sheet)
+            cr_addr = mLo.Lo.qi(XCellRangeAddressable, used_range, True).getRangeAddress()
+
+        col_start = cr_addr.StartColumn
+        col_end = cr_addr.EndColumn
+        starts = range(cr_addr.StartRow, cr_addr.EndRow + 1, chunk_rows)
+
+        def get_chunk(row_start: int) -> TupleArray:
+            row_end = min(row_start + chunk_rows - 1, cr_addr.EndRow)
+            return cls._get_chunk_array(
+                sheet=sheet, col_start=col_start, row_start=row_start, col_end=col_end, row_end=row_end
+            )
+
+        if not prefetch:
+            for row_start in starts:
+                yield from get_chunk(row_start)
+            return
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            future = None
+            for row_start in starts:
+                if future is None:
+                    future = executor.submit(get_chunk, row_start)
+                data = future.result()
+                next_start = row_start + chunk_rows
+                future = executor.submit(get_chunk, next_start) if next_start <= cr_addr.EndRow else None
+                yield from data
+                data = None
+
+    # endregion iter_rows()
+
     # region print_array()
 
     @overload
@@ -3118,6 +3322,136 @@ class Calc:
 
     # endregion convert_to_floats()
 
+    # region    get_ndarray()
+
+    @staticmethod
+    def _convert_to_ndarray(vals: Sequence[Sequence[object]]) -> np.ma.MaskedArray:
+        try:
+            import numpy as np
+        except ImportError as e:
+            raise Exception("get_ndarray() requires numpy python package") from e
+        row_len = len(vals)
+        if row_len == 0:
+            return np.ma.masked_array(np.empty((0, 0), dtype=np.float64))
+        # getDataArray() returns numbers as float and text as str.
+        # Empty cells are returned as empty strings so they are masked along with text cells.
+        # One object array is built in a single pass and the mask is computed in a C loop.
+        objs = np.array(vals, dtype=object)
+        mask = np.frompyfunc(lambda v: isinstance(v, str), 1, 1)(objs).astype(bool)
+        if mask.any():
+            data = np.where(mask, np.nan, objs).astype(np.float64)
+        else:
+            data = objs.astype(np.float64)
+        return np.ma.masked_array(data, mask=mask)
+
+    @overload
+    @classmethod
+    def get_ndarray(cls, cell_range: XCellRange) -> np.ma.MaskedArray:
+        ...
+
+    @overload
+    @classmethod
+    def get_ndarray(cls, sheet: XSpreadsheet, range_name: str) -> np.ma.MaskedArray:
+        ...
+
+    @overload
+    @classmethod
+    def get_ndarray(cls, sheet: XSpreadsheet, range_obj: mRngObj.RangeObj) -> np.ma.MaskedArray:
+        ...
+
+    @overload
+    @classmethod
+    def get_ndarray(cls, sheet: XSpreadsheet, cell_obj: mCellObj.CellObj) -> np.ma.MaskedArray:
+        ...
+
+    @classmethod
+    def get_ndarray(cls, *args, **kwargs) -> np.ma.MaskedArray:
+        """
+        Gets a 2-Dimensional NumPy array of floats.
+
+        Data is read from spreadsheet using a single ``getDataArray()`` call and converted directly
+        into a ``float64`` array. Empty and text cells are masked.
+
+        Args:
+            cell_range (XCellRange): Cell range to get data from.
+            sheet (XSpreadsheet): Spreadsheet to get the float values from.
+            range_name (str): Range to get array of floats from such as 'A1:E18'
+            range_obj (RangeObj): Range object
+            cell_obj (CellObj): Cell Object
+
+        Raises:
+            MissingInterfaceError: if interface is missing
+            Exception: If numpy python package is not available
+
+        Returns:
+            MaskedArray: 2-Dimensional masked array of floats. Masked elements have a data value of ``nan``.
+
+        Note:
+            Requires `numpy <https://numpy.org/>`_ python package.
+
+        See Also:
+            - :py:meth:`~.Calc.get_ndarray_cols`
+            - :py:meth:`~.Calc.get_float_array`
+
+        .. versionadded:: 0.8.4
+        """
+        return cls._convert_to_ndarray(cls.get_array(*args, **kwargs))
+
+    @overload
+    @classmethod
+    def get_ndarray_cols(cls, cell_range: XCellRange) -> List[np.ma.MaskedArray]:
+        ...
+
+    @overload
+    @classmethod
+    def get_ndarray_cols(cls, sheet: XSpreadsheet, range_name: str) -> List[np.ma.MaskedArray]:
+        ...
+
+    @overload
+    @classmethod
+    def get_ndarray_cols(cls, sheet: XSpreadsheet, range_obj: mRngObj.RangeObj) -> List[np.ma.MaskedArray]:
+        ...
+
+    @overload
+    @classmethod
+    def get_ndarray_cols(cls, sheet: XSpreadsheet, cell_obj: mCellObj.CellObj) -> List[np.ma.MaskedArray]:
+        ...
+
+    @classmethod
+    def get_ndarray_cols(cls, *args, **kwargs) -> List[np.ma.MaskedArray]:
+        """
+        Gets the columns of a range as a list of 1-Dimensional NumPy arrays of floats.
+
+        Range is read using a single ``getDataArray()`` call.
+        Each column is stored contiguously in memory. Empty and text cells are masked.
+
+        Args:
+            cell_range (XCellRange): Cell range to get data from.
+            sheet (XSpreadsheet): Spreadsheet to get the float values from.
+            range_name (str): Range to get array of floats from such as 'A1:E18'
+            range_obj (RangeObj): Range object
+            cell_obj (CellObj): Cell Object
+
+        Raises:
+            MissingInterfaceError: if interface is missing
+            Exception: If numpy python package is not available
+
+        Returns:
+            List[MaskedArray]: One masked array for each column in range.
+
+        Note:
+            Requires `numpy <https://numpy.org/>`_ python package.
+
+        See Also:
+            :py:meth:`~.Calc.get_ndarray`
+
+        .. versionadded:: 0.8.4
+        """
+        arr = cls._convert_to_ndarray(cls.get_array(*args, **kwargs))
+        return list(arr.T.copy())
+
+    # endregion get_ndarray()
+
     # endregion ------------- set/get values in 2D array --------------
 
     # region --------------- set/get rows and columns ------------------
@@ -4892,43 +5226,62 @@ class Calc:
         """
         ...
 
+    @overload
+    @staticmethod
+    def is_equal_addresses(
+        addr1: mCellAddr.CellAddr | mRngAddr.RangeAddr, addr2: mCellAddr.CellAddr | mRngAddr.RangeAddr
+    ) -> bool:
+        """
+        Gets if two instances of CellAddr or RangeAddr are equal
+
+        Args:
+            addr1 (CellAddr | RangeAddr): Cell address or range address
+            addr2 (CellAddr | RangeAddr): Cell address or range address
+
+        Returns:
+            bool: True if equal; Otherwise, False
+        """
+        ...
+
     @staticmethod
     def is_equal_addresses(addr1: object, addr2: object) -> bool:
         """
         Gets if two instances of CellRangeAddress are equal
 
         Args:
-            addr1 (CellAddress | CellRangeAddress): Cell address or cell range address
-            addr2 (CellAddress | CellRangeAddress): Cell address or cell range address
+            addr1 (CellAddress | CellRangeAddress | CellAddr | RangeAddr): Cell address or cell range address
+            addr2 (CellAddress | CellRangeAddress | CellAddr | RangeAddr): Cell address or cell range address
 
         Returns:
             bool: True if equal; Otherwise, False
+
+        Note:
+            A ``CellAddress`` is equal to a ``CellAddr`` with the same values and
+            a ``CellRangeAddress`` is equal to a ``RangeAddr`` with the same values.
+
+        .. versionchanged:: 0.8.4
+            Added support for ``CellAddr`` and ``RangeAddr``.
         """
         if addr1 is None or addr2 is None:
             return False
-        try:
-            is_same_type = addr1.typeName == addr2.typeName
-            if not is_same_type:
-                return False
-        except AttributeError:
+
+        def to_key(addr: Any) -> tuple | None:
+            if isinstance(addr, (mCellAddr.CellAddr, mRngAddr.RangeAddr)):
+                return (type(addr), addr.key)
+            type_name = getattr(addr, "typeName", None)
+            if type_name == "com.sun.star.table.CellAddress":
+                return (mCellAddr.CellAddr, (addr.Sheet, addr.Row, addr.Column))
+            if type_name == "com.sun.star.table.CellRangeAddress":
+                return (
+                    mRngAddr.RangeAddr,
+                    (addr.Sheet, addr.StartRow, addr.StartColumn, addr.EndRow, addr.EndColumn),
+                )
+            return None
+
+        key1 = to_key(addr1)
+        if key1 is None:
             return False
-        if mInfo.Info.is_type_struct(addr1, "com.sun.star.table.CellAddress"):
-            # when cast is used with an import the is not available at runtime must be quoted.
-            a = cast("CellAddress", addr1)
-            b = cast("CellAddress", addr2)
-            return a.Sheet == b.Sheet and a.Column == b.Column and a.Row == b.Row
-        if mInfo.Info.is_type_struct(addr1, "com.sun.star.table.CellRangeAddress"):
-            # when cast is used with an import the is not available at runtime must be quoted.
-            a = cast("CellRangeAddress", addr1)
-            b = cast("CellRangeAddress", addr2)
-            return (
-                a.Sheet == b.Sheet
-                and a.StartColumn == b.StartColumn
-                and a.StartRow == b.StartRow
-                and a.EndColumn == b.EndColumn
-                and a.EndRow == b.EndRow
-            )
-        return False
+        return key1 == to_key(addr2)
 
     # endregion  is_equal_addresses()
 
@@ -5537,6 +5890,39 @@ class Calc:
             return None
         return crs
 
+    @classmethod
+    def find_all_addresses(
+        cls, srch: XSearchable, sd: XSearchDescriptor, unique: bool = True
+    ) -> List[mRngAddr.RangeAddr]:
+        """
+        Searches spreadsheet and returns the addresses of the cell ranges that match search criteria.
+
+        Args:
+            srch (XSearchable): Searchable object
+            sd (XSearchDescriptor): Search description
+            unique (bool, optional): If ``True`` duplicate addresses are removed. Default ``True``.
+
+        Returns:
+            List[RangeAddr]: Range addresses in the order found. Empty list if there are no matches.
+
+        Note:
+            ``RangeAddr`` instances are hashable and ordered and can be used as ``dict`` keys or in a ``set``.
+            Use :py:meth:`.RangeAddr.to_uno` to get a ``CellRangeAddress``.
+
+        See Also:
+            :py:meth:`~.Calc.find_all`
+
+        .. versionadded:: 0.8.4
+        """
+        crs = cls.find_all(srch=srch, sd=sd)
+        if not crs:
+            return []
+        addrs = [mRngAddr.RangeAddr.from_cell_range(cr) for cr in crs]
+        if unique:
+            # dict keeps insertion order
+            return list(dict.fromkeys(addrs))
+        return addrs
+
     # endregion ------------ search ------------------------------------
 
     # region --------------- cell decoration ---------------------------
@@ -6546,7 +6932,7 @@ class Calc:
         return 0.0
 
     @staticmethod
-    def call_fun(func_name: str, *args: any) -> object:
+    def call_fun(func_name: str, *args: any, validate: bool = False) -> object:
         """
         Execute a Calc function by its (English) name and based on the given arguments
 
@@ -6555,46 +6941,212 @@ class Calc:
             args: (any): the arguments of the called function.
                 Each argument must be either a string, a numeric value
                 or a sequence of sequences ( tuples or list ) combining those types.
+            validate (bool, optional): If ``True`` the number of arguments is checked with
+                :py:meth:`.FunctionCatalog.validate_args` before the function is called. Default ``False``.
 
         Returns:
             object: The (string or numeric) value or the array of arrays returned by the call to the function
                 When the arguments contain arrays, the function is executed as an array function
                 Wrong arguments generate an error
+
+        .. versionchanged:: 0.8.4
+            Added ``validate`` keyword arg.
         """
         args_len = len(args)
         if args_len == 0:
             arg = ()
         else:
             arg = args
+        if validate:
+            try:
+                mFnCat.FunctionCatalog.validate_args(func_name, arg)
+            except Exception as e:
+                mLo.Lo.print(f"Could not invoke function '{func_name.upper()}'")
+                mLo.Lo.print(f"    {e}")
+                return None
         try:
-            fa = mLo.Lo.create_instance_mcf(XFunctionAccess, "com.sun.star.sheet.FunctionAccess", raise_err=True)
+            fa = mLo.Lo.get_cached_service(XFunctionAccess, "com.sun.star.sheet.FunctionAccess", raise_err=True)
             return fa.callFunction(func_name.upper(), arg)
         except Exception as e:
             mLo.Lo.print(f"Could not invoke function '{func_name.upper()}'")
             mLo.Lo.print(f"    {e}")
         return None
 
+    # region    call_fun_batch()
+    @overload
+    @classmethod
+    def call_fun_batch(cls, func_name: str, arg_sets: Iterable[Sequence[Any]]) -> List[Any]:
+        ...
+
+    @overload
+    @classmethod
+    def call_fun_batch(cls, func_name: str, arg_sets: Iterable[Sequence[Any]], doc: XSpreadsheetDocument) -> List[Any]:
+        ...
+
+    @overload
+    @classmethod
+    def call_fun_batch(
+        cls, func_name: str, arg_sets: Iterable[Sequence[Any]], doc: XSpreadsheetDocument | None, as_ndarray: bool
+    ) -> List[Any] | np.ma.MaskedArray:
+        ...
+
+    @classmethod
+    def call_fun_batch(
+        cls,
+        func_name: str,
+        arg_sets: Iterable[Sequence[Any]],
+        doc: XSpreadsheetDocument | None = None,
+        as_ndarray: bool = False,
+    ) -> List[Any] | np.ma.MaskedArray:
+        """
+        Evaluates a Calc function for many sets of arguments.
+
+        When ``doc`` is passed, argument sets that only contain numbers are evaluated on a temporary sheet
+        with a few calls to office no matter how many argument sets there are.
+        Arguments are written with one ``setDataArray()``, a formula per argument set is written with one
+        ``setFormulaArray()`` and results are read with one ``getDataArray()``. The temporary sheet is then removed.
+
+        All other argument sets are evaluated with a single reused ``FunctionAccess`` service, the same as
+        :py:meth:`~.Calc.call_fun`. On a sheet arguments are cell references and functions treat text and empty
+        cells differently than values, for instance ``SUM`` ignores a referenced text ``"5"``.
+        Routing sets with text or ``None`` to ``FunctionAccess`` keeps results the same as ``call_fun()``.
+
+        Args:
+            func_name (str): the English name of the function to execute such as ``PMT``.
+            arg_sets (Iterable[Sequence[Any]]): Arguments for each evaluation.
+                Each set is the arguments that would be passed to :py:meth:`~.Calc.call_fun`.
+            doc (XSpreadsheetDocument, optional): Document used to add temporary sheet.
+            as_ndarray (bool, optional): If ``True`` result is a numpy masked array of floats,
+                values that are not numbers are masked. Default ``False``.
+
+        Raises:
+            Exception: If ``as_ndarray`` is ``True`` and numpy python package is not available
+
+        Returns:
+            List[Any] | MaskedArray: Result of each evaluation in the same order as ``arg_sets``.
+            Result is ``None`` for an evaluation that failed or resulted in an error.
+
+        Example:
+
+            .. code::
+
+                # payment for each rate, periods and amount
+                params = [(rate / 12, 60, 20_000) for rate in (0.03, 0.04, 0.05)]
+                payments = Calc.call_fun_batch("PMT", params, doc)
+
+        See Also:
+            :py:meth:`~.Calc.call_fun`
+
+        .. versionadded:: 0.8.4
+        """
+        sets = [tuple(a) for a in arg_sets]
+        if doc is None:
+            results = cls._call_fun_batch_fa(func_name, sets)
+        else:
+            # only numbers are the same passed as a value or as a cell reference.
+            is_num = [all(isinstance(arg, (int, float)) for arg in a) for a in sets]
+            if all(is_num):
+                results = cls._call_fun_batch_sheet(func_name, sets, doc)
+            else:
+                num_results = iter(cls._call_fun_batch_sheet(func_name, [a for a, n in zip(sets, is_num) if n], doc))
+                fa_results = iter(cls._call_fun_batch_fa(func_name, [a for a, n in zip(sets, is_num) if not n]))
+                results = [next(num_results) if n else next(fa_results) for n in is_num]
+        if as_ndarray:
+            if not results:
+                try:
+                    import numpy as np
+                except ImportError as e:
+                    raise Exception("call_fun_batch() requires numpy python package") from e
+                return np.ma.masked_array(np.empty(0, dtype=np.float64))
+            # None, text and array results, such as from a matrix function, are masked.
+            return cls._convert_to_ndarray([[v if isinstance(v, (int, float)) else ""] for v in results])[:, 0]
+        return results
+
+    @staticmethod
+    def _call_fun_batch_fa(func_name: str, sets: List[Tuple[Any, ...]]) -> List[Any]:
+        name = func_name.upper()
+        fa = mLo.Lo.get_cached_service(XFunctionAccess, "com.sun.star.sheet.FunctionAccess", raise_err=True)
+        results = []
+        for args in sets:
+            try:
+                results.append(fa.callFunction(name, args))
+            except Exception as e:
+                mLo.Lo.print(f"Could not invoke function '{name}' with args {args}")
+                mLo.Lo.print(f"    {e}")
+                results.append(None)
+        return results
+
+    @staticmethod
+    def _call_fun_batch_sheet(func_name: str, sets: List[Tuple[Any, ...]], doc: XSpreadsheetDocument) -> List[Any]:
+        # all arguments must be numbers, see call_fun_batch().
+        name = func_name.upper()
+        results: List[Any] = []
+        if not sets:
+            return results
+        sheets = doc.getSheets()
+        sheet_name = "__ooodev_fun_batch"
+        i = 1
+        while sheets.hasByName(sheet_name):
+            sheet_name = f"__ooodev_fun_batch{i}"
+            i += 1
+        # sheet api is used directly so that temporary sheet does not trigger sheet events.
+        sheets.insertNewByName(sheet_name, len(sheets.getElementNames()))
+        try:
+            sheet = mLo.Lo.qi(XSpreadsheet, sheets.getByName(sheet_name), True)
+            chunk_size = mTblHelper.MAX_ROW
+            for start in range(0, len(sets), chunk_size):
+                chunk = sets[start : start + chunk_size]
+                rows = len(chunk)
+                width = max(len(a) for a in chunk)
+                if width > 0:
+                    data = tuple(tuple(float(v) for v in a) + ("",) * (width - len(a)) for a in chunk)
+                    arg_rng = mLo.Lo.qi(XCellRangeData, sheet.getCellRangeByPosition(0, 0, width - 1, rows - 1), True)
+                    arg_rng.setDataArray(data)
+                formulas = []
+                for row, a in enumerate(chunk):
+                    refs = ";".join(
+                        mTblHelper.TableHelper.make_cell_name(row=row, col=col, zero_index=True)
+                        for col in range(len(a))
+                    )
+                    formulas.append((f"={name}({refs})",))
+                res_rng = sheet.getCellRangeByPosition(width, 0, width, rows - 1)
+                mLo.Lo.qi(XCellRangeFormula, res_rng, True).setFormulaArray(tuple(formulas))
+                values = [row[0] for row in mLo.Lo.qi(XCellRangeData, res_rng, True).getDataArray()]
+                # cells with errors are returned as values, find them so they can be set to None.
+                err_ranges = mLo.Lo.qi(XCellRangesQuery, res_rng, True).queryFormulaCells(FormulaResult.ERROR)
+                for addr in err_ranges.getRangeAddresses():
+                    for row in range(addr.StartRow, addr.EndRow + 1):
+                        values[row] = None
+                results.extend(values)
+                if start + chunk_size < len(sets):
+                    sheet.getCellRangeByPosition(0, 0, width, rows - 1).clearContents(
+                        CellFlagsEnum.VALUE | CellFlagsEnum.STRING | CellFlagsEnum.FORMULA
+                    )
+        finally:
+            sheets.removeByName(sheet_name)
+        return results
+
+    # endregion call_fun_batch()
+
     @staticmethod
     def get_function_names() -> List[str] | None:
-        funcs_desc = mLo.Lo.create_instance_mcf(XFunctionDescriptions, "com.sun.star.sheet.FunctionDescriptions")
-        if funcs_desc is None:
+        """
+        Gets sorted names of all Calc functions.
+
+        Returns:
+            List[str] | None: Function names or ``None`` if no functions were found.
+
+        .. versionchanged:: 0.8.4
+            Names are read from :py:class:`~.function_catalog.FunctionCatalog`.
+        """
+        try:
+            nms = list(mFnCat.FunctionCatalog.get_names())
+        except Exception:
             mLo.Lo.print("No function descriptions were found")
             return None
-
-        nms: List[str] = []
-        for i in range(funcs_desc.getCount()):
-            try:
-                props = cast(Sequence[PropertyValue], funcs_desc.getByIndex(i))
-                for p in props:
-                    if p.Name == "Name":
-                        nms.append(str(p.Value))
-                        break
-            except Exception:
-                continue
         if len(nms) == 0:
             mLo.Lo.print("No function names were found")
             return None
-        nms.sort()
         return nms
 
     # region    find_function()
@@ -6603,41 +7155,19 @@ class Calc:
     def _find_function_by_name(func_nm: str) -> Tuple[PropertyValue] | None:
         if not func_nm:
             raise ValueError("Invalid arg, please supply a function name to find.")
-        try:
-            func_desc = mLo.Lo.create_instance_mcf(
-                XFunctionDescriptions, "com.sun.star.sheet.FunctionDescriptions", raise_err=True
-            )
-        except Exception as e:
-            raise Exception("No function descriptions were found") from e
-
-        for i in range(func_desc.getCount()):
-            try:
-                props = cast(Sequence[PropertyValue], func_desc.getByIndex(i))
-                for p in props:
-                    if p.Name == "Name" and str(p.Value) == func_nm:
-                        return tuple(props)
-            except Exception:
-                continue
-        mLo.Lo.print(f"Function '{func_nm}' not found")
-        return None
+        info = mFnCat.FunctionCatalog.find(func_nm)
+        if info is None:
+            mLo.Lo.print(f"Function '{func_nm}' not found")
+            return None
+        return info.props
 
     @staticmethod
     def _find_function_by_idx(idx: int) -> Tuple[PropertyValue] | None:
-        if idx < 0:
-            raise IndexError("Negative index in not allowed.")
-        try:
-            func_desc = mLo.Lo.create_instance_mcf(
-                XFunctionDescriptions, "com.sun.star.sheet.FunctionDescriptions", raise_err=True
-            )
-        except Exception as e:
-            raise Exception("No function descriptions were found") from e
-
-        try:
-            return tuple(func_desc.getByIndex(idx))
-        except Exception as e:
+        info = mFnCat.FunctionCatalog.get(idx)
+        if info is None:
             mLo.Lo.print(f"Could not access function description {idx}")
-            mLo.Lo.print(f"    {e}")
-        return None
+            return None
+        return info.props
 
     @overload
     @staticmethod
@@ -3,8 +3,10 @@
 # See Also: https://fivedots.coe.psu.ac.th/~ad/jlop/
 # region Imports
 from __future__ import annotations
-from typing import TYPE_CHECKING, Iterable, List, overload
+from typing import Any, TYPE_CHECKING, Generator, Iterable, List, Sequence, Tuple, overload
+import itertools
 import re
+from functools import cmp_to_key
 import uno
 
 from ..exceptions import ex as mEx
@@ -13,6 +15,7 @@ from ..utils import info as mInfo
 from ..utils import file_io as mFileIO
 from ..utils import props as mProps
 from ..utils.table_helper import TableHelper
+from ..utils.data_type.text_item import TextItem as TextItem, TextItemKind as TextItemKind
 from ..utils.color import CommonColor, Color
 from ..utils.type_var import PathOrStr, Table, DocOrCursor
 from ..utils import images_lo as mImgLo
@@ -49,8 +52,10 @@ from com.sun.star.linguistic2 import XLinguServiceManager
 from com.sun.star.linguistic2 import XProofreader
 from com.sun.star.linguistic2 import XSearchableDictionaryList
 from com.sun.star.linguistic2 import XSpellChecker
+from com.sun.star.sheet import XCellRangeData
 from com.sun.star.style import NumberingType  # const
 from com.sun.star.table import BorderLine  # struct
+from com.sun.star.table import XCellRange
 from com.sun.star.text import HoriOrientation
 from com.sun.star.text import VertOrientation
 from com.sun.star.text import XBookmarksSupplier
@@ -61,8 +66,10 @@ from com.sun.star.text import XTextContent
 from com.sun.star.text import XTextDocument
 from com.sun.star.text import XTextField
 from com.sun.star.text import XTextFrame
+from com.sun.star.text import XTextFramesSupplier
 from com.sun.star.text import XTextGraphicObjectsSupplier
 from com.sun.star.text import XTextRange
+from com.sun.star.text import XTextRangeCompare
 from com.sun.star.text import XTextTable
 from com.sun.star.text import XTextViewCursor
 from com.sun.star.uno import Exception as UnoException
@@ -175,6 +182,179 @@ class Write(mSel.Selection):
 
     # endregion Selection Overloads
 
+    class TextBuffer:
+        """
+        Context manager that buffers text written to a document.
+
+        Text, line breaks, paragraph breaks and styled runs are collected in python and written to the document
+        in large chunks, each chunk with a single call to office. Style runs are applied after their chunk is written.
+        When ``text_doc`` is passed its controllers are locked while the context is active.
+
+        Buffer is flushed when it holds more than ``max_chars`` characters, when :py:meth:`~.Write.TextBuffer.flush`
+        is called and when the context exits. Do not write to ``cursor`` by other means before flushing.
+
+        Example:
+
+            .. code::
+
+                with Write.TextBuffer(cursor, text_doc=doc) as buf:
+                    buf.append_para("Report", ParaStyleName="Heading 1")
+                    for line in lines:
+                        buf.append_para(line)
+                    buf.append("Bold text", CharWeight=FontWeight.BOLD)
+                    buf.end_paragraph()
+
+        .. versionadded:: 0.8.4
+        """
+
+        def __init__(
+            self, cursor: XTextCursor, max_chars: int = 100_000, text_doc: XTextDocument | None = None
+        ) -> None:
+            """
+            Constructor
+
+            Args:
+                cursor (XTextCursor): Text Cursor to write to. Text is appended at the end of cursor.
+                max_chars (int, optional): Number of buffered characters that triggers a flush. Defaults to ``100_000``.
+                text_doc (XTextDocument, optional): Document that ``cursor`` belongs to.
+                    If passed, its controllers are locked while context is active.
+
+            Raises:
+                MissingInterfaceError: If ``text_doc`` does not implement ``XModel`` interface.
+            """
+            self._cursor = cursor
+            self._max_chars = max(1, max_chars)
+            self._model = None if text_doc is None else mLo.Lo.qi(XModel, text_doc, True)
+            self._locked = False
+            self._parts: List[str] = []
+            # style runs as (start, length, props), start and length in utf-16 units of buffered text.
+            self._runs: List[Tuple[int, int, dict]] = []
+            self._size = 0
+            self._chars = 0
+
+        def __enter__(self) -> Write.TextBuffer:
+            if self._model is not None:
+                self._model.lockControllers()
+                self._locked = True
+            return self
+
+        def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+            try:
+                self.flush()
+            finally:
+                if self._locked:
+                    self._model.unlockControllers()
+                    self._locked = False
+
+        @staticmethod
+        def _doc_len(text: str) -> int:
+            # office counts characters as utf-16 units
+            if text.isascii():
+                return len(text)
+            return len(text.encode("utf-16-le")) // 2
+
+        def _add(self, text: str, props: dict) -> None:
+            if not text:
+                return
+            size = self._doc_len(text)
+            if props:
+                self._runs.append((self._size, size, props))
+            self._parts.append(text)
+            self._size += size
+            self._chars += len(text)
+            if self._chars >= self._max_chars:
+                self.flush()
+
+        def append(self, text: str, **props: Any) -> None:
+            """
+            Appends text.
+
+            Args:
+                text (str): Text to append.
+                props (Any, optional): Properties to set on the appended text, such as ``CharWeight``.
+            """
+            self._add(text, props)
+
+        def append_line(self, text: str = "", **props: Any) -> None:
+            """
+            Appends text and then a line break.
+
+            Args:
+                text (str, optional): Text to append.
+                props (Any, optional): Properties to set on the appended text.
+            """
+            self.append(text, **props)
+            self._add("\n", {})
+
+        def append_para(self, text: str = "", **props: Any) -> None:
+            """
+            Appends text and then a paragraph break.
+
+            Args:
+                text (str, optional): Text to append.
+                props (Any, optional): Properties to set on the appended text,
+                    paragraph properties such as ``ParaStyleName`` apply to the paragraph.
+            """
+            if text:
+                self.append(text, **props)
+            elif props:
+                # empty paragraph, props are set on a collapsed cursor at the paragraph break.
+                self._runs.append((self._size, 0, props))
+            self._add("\r", {})
+
+        def end_line(self) -> None:
+            """
+            Appends a line break.
+            """
+            self._add("\n", {})
+
+        def end_paragraph(self) -> None:
+            """
+            Appends a paragraph break.
+            """
+            self._add("\r", {})
+
+        def flush(self) -> None:
+            """
+            Writes buffered text to document.
+            """
+            if not self._parts:
+                return
+            text = "".join(self._parts)
+            runs = self._runs
+            self._parts = []
+            self._runs = []
+            self._size = 0
+            self._chars = 0
+
+            cursor = self._cursor
+            # setString() selects the inserted text, each carriage return becomes a paragraph break.
+            cursor.setString(text)
+            if runs:
+                # runs are in text order, a single cursor moves forward from one run to the next.
+                run_cursor = cursor.getText().createTextCursorByRange(cursor.getStart())
+                pos = 0
+                for run_start, run_len, props in runs:
+                    self._go_right(run_cursor, run_start - pos, False)
+                    self._go_right(run_cursor, run_len, True)
+                    mProps.Props.set(run_cursor, **props)
+                    run_cursor.collapseToEnd()
+                    pos = run_start + run_len
+            cursor.gotoEnd(False)
+
+        @staticmethod
+        def _go_right(cursor: XTextCursor, count: int, select: bool) -> None:
+            # goRight() takes a short
+            while count > 0:
+                step = min(count, 32767)
+                cursor.goRight(step, select)
+                count -= step
+
+        @property
+        def buffered(self) -> int:
+            """Gets number of characters waiting to be written"""
+            return self._chars
+
     # region ------------- doc / open / close /create/ etc -------------
 
     # region open_doc()
@@ -698,6 +878,9 @@ class Write(mSel.Selection):
 
         Returns:
             int: page count
+
+        See Also:
+            :py:func:`~.doc_stats.get_doc_stats` gets page count without a controller.
         """
         model = mLo.Lo.qi(XModel, text_doc, True)
         xcontroller = model.getCurrentController()
@@ -1011,6 +1194,154 @@ class Write(mSel.Selection):
             raise mEx.MissingInterfaceError(XEnumerationAccess)
         return enum_access.createEnumeration()
 
+    @classmethod
+    def iter_text_items(
+        cls, text_doc: XTextDocument, include_tables: bool = True, include_frames: bool = True
+    ) -> Generator[TextItem, None, None]:
+        """
+        Iterates the paragraphs, tables and frames of a document in document order.
+
+        Items are read from office one at a time as the generator advances, the text of the document
+        is never held in memory as a whole. This keeps memory constant for very large documents.
+
+        Frames are yielded after the paragraph that holds their anchor, whatever the anchor type.
+        Frames anchored to a page, to another frame or to text outside the document body, such as a table cell,
+        are yielded after all other items.
+
+        Args:
+            text_doc (XTextDocument): Text Document
+            include_tables (bool, optional): If ``True`` text tables are included. Defaults to ``True``.
+            include_frames (bool, optional): If ``True`` text frames are included. Defaults to ``True``.
+                While frames are left to place, looking for them adds a call to office for each paragraph.
+
+        Raises:
+            MissingInterfaceError: If document text does not implement XEnumerationAccess interface
+
+        Yields:
+            Generator[TextItem, None, None]: Each paragraph, table and frame with its offset and style name.
+
+        Example:
+            .. code-block:: python
+
+                for item in Write.iter_text_items(doc):
+                    if item.kind == TextItemKind.PARAGRAPH:
+                        index.add(item.offset, item.text)
+
+        See Also:
+            - :py:meth:`~.Write.get_all_text`
+            - :py:meth:`~.Write.get_enumeration`
+
+        .. versionadded:: 0.8.4
+        """
+
+        def doc_len(text: str) -> int:
+            if text.isascii():
+                return len(text)
+            return len(text.encode("utf-16-le")) // 2
+
+        index = 0
+        offset = 0
+
+        def make_item(kind: TextItemKind, text: str, style_name: str, name: str, obj: Any) -> TextItem:
+            nonlocal index, offset
+            item = TextItem(
+                kind=kind, index=index, offset=offset, text=text, style_name=style_name, name=name, obj=obj
+            )
+            index += 1
+            # each item is followed by a single separator
+            offset += doc_len(text) + 1
+            return item
+
+        def frame_item(frame: Any) -> TextItem:
+            return make_item(
+                kind=TextItemKind.FRAME,
+                text=frame.getString(),
+                style_name=cls._get_prop_str(frame, "FrameStyleName"),
+                name=frame.getName(),
+                obj=frame,
+            )
+
+        # frames anchored in body text as (anchor, frame), sorted by anchor position.
+        body_frames: List[Tuple[XTextRange, Any]] = []
+        other_frames: List[Any] = []
+        compare = None
+        if include_frames:
+            supplier = mLo.Lo.qi(XTextFramesSupplier, text_doc)
+            if supplier is not None:
+                xtext = text_doc.getText()
+                compare = mLo.Lo.qi(XTextRangeCompare, xtext, True)
+                text_start = xtext.getStart()
+                frames = supplier.getTextFrames()
+                for name in frames.getElementNames():
+                    frame = frames.getByName(name)
+                    anchor = None
+                    if frame.getPropertyValue("AnchorType") != TextContentAnchorType.AT_PAGE:
+                        anchor = frame.getAnchor()
+                        try:
+                            compare.compareRegionStarts(anchor, text_start)
+                        except Exception:
+                            # anchor is in another frame, a table cell or a header
+                            anchor = None
+                    if anchor is None:
+                        other_frames.append(frame)
+                    else:
+                        body_frames.append((anchor, frame))
+                # compareRegionStarts() returns 1 when first range comes before second range.
+                body_frames.sort(key=cmp_to_key(lambda a, b: -compare.compareRegionStarts(a[0], b[0])))
+        frame_idx = 0
+
+        enum = cls.get_enumeration(text_doc)
+        while enum.hasMoreElements():
+            el = enum.nextElement()
+            if el.supportsService("com.sun.star.text.TextTable"):
+                if include_tables:
+                    yield make_item(
+                        kind=TextItemKind.TABLE,
+                        text=cls._get_table_text(el),
+                        style_name=cls._get_prop_str(el, "TableTemplateName"),
+                        name=el.getName(),
+                        obj=el,
+                    )
+                continue
+            yield make_item(
+                kind=TextItemKind.PARAGRAPH,
+                text=el.getString(),
+                style_name=cls._get_prop_str(el, "ParaStyleName"),
+                name="",
+                obj=el,
+            )
+            if frame_idx < len(body_frames):
+                para_end = el.getEnd()
+                while (
+                    frame_idx < len(body_frames)
+                    and compare.compareRegionStarts(body_frames[frame_idx][0], para_end) >= 0
+                ):
+                    yield frame_item(body_frames[frame_idx][1])
+                    frame_idx += 1
+
+        for _, frame in body_frames[frame_idx:]:
+            yield frame_item(frame)
+        for frame in other_frames:
+            yield frame_item(frame)
+
+    @staticmethod
+    def _get_prop_str(obj: Any, name: str) -> str:
+        try:
+            val = obj.getPropertyValue(name)
+        except Exception:
+            return ""
+        return "" if val is None else str(val)
+
+    @staticmethod
+    def _get_table_text(table: XTextTable) -> str:
+        try:
+            data = mLo.Lo.qi(XCellRangeData, table, True).getDataArray()
+            return "\n".join("\t".join(str(val) for val in row) for row in data)
+        except Exception:
+            # tables with split or merged cells do not support data arrays.
+            pass
+        return "\n".join(table.getCellByName(name).getString() for name in table.getCellNames())
+
     # endregion ---------- extract text from document ------------------
 
     # region ------------- text cursor property methods ----------------
@@ -1831,33 +2162,10 @@ class Write(mSel.Selection):
         tbl_bg_color = cargs.event_data["tbl_bg_color"]
         tbl_fg_color = cargs.event_data["tbl_fg_color"]
 
-        def make_cell_name(row: int, col: int) -> str:
-            return TableHelper.make_cell_name(row=row + 1, col=col + 1)
-
-        def set_cell_header(cell_name: str, data: str, table: XTextTable) -> None:
-            cell_text = mLo.Lo.qi(XText, table.getCellByName(cell_name), True)
-            if header_fg_color is not None:
-                text_cursor = cell_text.createTextCursor()
-                mProps.Props.set(text_cursor, CharColor=header_fg_color)
-
-            cell_text.setString(str(data))
-
-        def set_cell_text(cell_name: str, data: str, table: XTextTable) -> None:
-            cell_text = mLo.Lo.qi(XText, table.getCellByName(cell_name), True)
-            if tbl_fg_color is not None:
-                text_cursor = cell_text.createTextCursor()
-                mProps.Props.set(text_cursor, CharColor=tbl_fg_color)
-            cell_text.setString(str(data))
-
         num_rows = len(table_data)
         if num_rows == 0:
             raise ValueError("table_data has no values")
-        try:
-            table = mLo.Lo.create_instance_msf(XTextTable, "com.sun.star.text.TextTable")
-            if table is None:
-                raise ValueError("Null Value")
-        except Exception as e:
-            raise mEx.CreateInstanceMsfError(XTextTable, "com.sun.star.text.TextTable")
+        table = cls._create_text_table()
 
         try:
             num_cols = len(table_data[0])
@@ -1868,35 +2176,162 @@ class Write(mSel.Selection):
             cls._append_text_content(cursor, table)
             cls.end_paragraph(cursor)
 
-            table_props = mLo.Lo.qi(XPropertySet, table, True)
-
-            # set table properties
-            if header_bg_color is not None or tbl_bg_color is not None:
-                table_props.setPropertyValue("BackTransparent", False)  # not transparent
-            if tbl_bg_color is not None:
-                table_props.setPropertyValue("BackColor", tbl_bg_color)
-
-            # set color of first row (i.e. the header)
-            if header_bg_color is not None:
-                rows = table.getRows()
-                mProps.Props.set(rows.getByIndex(0), BackColor=header_bg_color)
-
-            #  write table header
-            row_data = table_data[0]
-            for x in range(num_cols):
-                set_cell_header(make_cell_name(0, x), row_data[x], table)
-                # e.g. "A1", "B1", "C1", etc
-
-            # insert table body
-            for y in range(1, num_rows):  # start in 2nd row
-                row_data = table_data[y]
-                for x in range(num_cols):
-                    set_cell_text(make_cell_name(y, x), row_data[x], table)
+            cls._set_table_colors(table=table, header_bg_color=header_bg_color, tbl_bg_color=tbl_bg_color)
+
+            # write all cells with one call for the header and one call for the body
+            cls._set_table_rows(table=table, row=0, rows=table_data[:1], num_cols=num_cols, fg_color=header_fg_color)
+            if num_rows > 1:
+                cls._set_table_rows(table=table, row=1, rows=table_data[1:], num_cols=num_cols, fg_color=tbl_fg_color)
         except Exception as e:
             raise Exception("Table insertion failed:") from e
         _Events().trigger(WriteNamedEvent.TABLE_ADDED, EventArgs.from_args(cargs))
         return True
 
+    @classmethod
+    def add_table_stream(
+        cls,
+        cursor: XTextCursor,
+        rows: Iterable[Sequence[Any]],
+        block_size: int = 500,
+        header_bg_color: Color | None = CommonColor.DARK_BLUE,
+        header_fg_color: Color | None = CommonColor.WHITE,
+        tbl_bg_color: Color | None = CommonColor.LIGHT_BLUE,
+        tbl_fg_color: Color | None = CommonColor.BLACK,
+    ) -> bool:
+        """
+        Adds a table from rows that are read as they are needed.
+
+        Same as :py:meth:`~.Write.add_table` except rows are appended to the table in blocks of ``block_size`` rows,
+        so ``rows`` can be a generator for a table that is too large to build in memory.
+
+        The first row is treated as a header and sets the number of columns.
+        Shorter rows are padded with empty cells, longer rows are truncated.
+
+        Args:
+            cursor (XTextCursor): Text Cursor
+            rows (Iterable[Sequence[Any]]): Table rows with the first row containing column names.
+            block_size (int, optional): Number of rows written to the table at a time. Defaults to ``500``.
+            header_bg_color (Color | None, optional): Table header background color. Set to None to ignore header color. Defaults to CommonColor.DARK_BLUE.
+            header_fg_color (Color | None, optional): Table header foreground color. Set to None to ignore header color. Defaults to CommonColor.WHITE.
+            tbl_bg_color (Color | None, optional): Table background color. Set to None to ignore background color. Defaults to CommonColor.LIGHT_BLUE.
+            tbl_fg_color (Color | None, optional): Table background color. Set to None to ignore background color. Defaults to CommonColor.BLACK.
+
+        Raises:
+            ValueError: If rows is empty or ``block_size`` is less than ``1``
+            CreateInstanceMsfError: If unable to create instance of text.TextTable
+            Exception: If unable to add table
+
+        Returns:
+            bool: True if table is added; Otherwise, False
+
+        :events:
+            .. cssclass:: lo_event
+
+                - :py:attr:`~.events.write_named_event.WriteNamedEvent.TABLE_ADDING` :eventref:`src-docs-event-cancel`
+                - :py:attr:`~.events.write_named_event.WriteNamedEvent.TABLE_ADDED` :eventref:`src-docs-event`
+
+        Note:
+           Event args ``event_data`` is a dictionary containing all method args.
+
+        See Also:
+            :py:meth:`~.Write.add_table`
+
+        .. versionadded:: 0.8.4
+        """
+        if block_size < 1:
+            raise ValueError("block_size must be at least 1")
+
+        cargs = CancelEventArgs(Write.add_table_stream.__qualname__)
+        cargs.event_data = {
+            "cursor": cursor,
+            "rows": rows,
+            "block_size": block_size,
+            "header_bg_color": header_bg_color,
+            "header_fg_color": header_fg_color,
+            "tbl_bg_color": tbl_bg_color,
+            "tbl_fg_color": tbl_fg_color,
+        }
+        _Events().trigger(WriteNamedEvent.TABLE_ADDING, cargs)
+        if cargs.cancel:
+            return False
+
+        header_bg_color = cargs.event_data["header_bg_color"]
+        header_fg_color = cargs.event_data["header_fg_color"]
+        tbl_bg_color = cargs.event_data["tbl_bg_color"]
+        tbl_fg_color = cargs.event_data["tbl_fg_color"]
+
+        row_iter = iter(rows)
+        header = next(row_iter, None)
+        if header is None:
+            raise ValueError("rows has no values")
+        num_cols = len(header)
+        block = list(itertools.islice(row_iter, block_size))
+        table = cls._create_text_table()
+
+        try:
+            table.initialize(len(block) + 1, num_cols)
+            cls._append_text_content(cursor, table)
+            cls.end_paragraph(cursor)
+
+            cls._set_table_colors(table=table, header_bg_color=header_bg_color, tbl_bg_color=tbl_bg_color)
+            cls._set_table_rows(table=table, row=0, rows=(header,), num_cols=num_cols, fg_color=header_fg_color)
+
+            row = 1
+            table_rows = table.getRows()
+            while block:
+                if row > 1:
+                    table_rows.insertByIndex(row, len(block))
+                cls._set_table_rows(table=table, row=row, rows=block, num_cols=num_cols, fg_color=tbl_fg_color)
+                row += len(block)
+                block = list(itertools.islice(row_iter, block_size))
+            mLo.Lo.print(f"Created table rows: {row}, cols: {num_cols}")
+        except Exception as e:
+            raise Exception("Table insertion failed:") from e
+        _Events().trigger(WriteNamedEvent.TABLE_ADDED, EventArgs.from_args(cargs))
+        return True
+
+    @staticmethod
+    def _create_text_table() -> XTextTable:
+        try:
+            table = mLo.Lo.create_instance_msf(XTextTable, "com.sun.star.text.TextTable")
+            if table is None:
+                raise ValueError("Null Value")
+        except Exception as e:
+            raise mEx.CreateInstanceMsfError(XTextTable, "com.sun.star.text.TextTable")
+        return table
+
+    @staticmethod
+    def _set_table_colors(table: XTextTable, header_bg_color: Color | None, tbl_bg_color: Color | None) -> None:
+        table_props = mLo.Lo.qi(XPropertySet, table, True)
+
+        # set table properties
+        if header_bg_color is not None or tbl_bg_color is not None:
+            table_props.setPropertyValue("BackTransparent", False)  # not transparent
+        if tbl_bg_color is not None:
+            table_props.setPropertyValue("BackColor", tbl_bg_color)
+
+        # set color of first row (i.e. the header)
+        if header_bg_color is not None:
+            rows = table.getRows()
+            mProps.Props.set(rows.getByIndex(0), BackColor=header_bg_color)
+
+    @staticmethod
+    def _set_table_rows(
+        table: XTextTable, row: int, rows: Sequence[Sequence[Any]], num_cols: int, fg_color: Color | None
+    ) -> None:
+        # writes rows starting at zero based row with a single setDataArray() call
+        # and sets text color of all rows with a single property set.
+        if not rows or num_cols < 1:
+            return
+        data = tuple(
+            tuple(str(val) for val in row_data[:num_cols]) + ("",) * (num_cols - len(row_data)) for row_data in rows
+        )
+        # Writer names columns A-Z then a-z, positions avoid building cell names.
+        cell_rng = mLo.Lo.qi(XCellRange, table, True).getCellRangeByPosition(0, row, num_cols - 1, row + len(data) - 1)
+        mLo.Lo.qi(XCellRangeData, cell_rng, True).setDataArray(data)
+        if fg_color is not None:
+            mProps.Props.set(cell_rng, CharColor=fg_color)
+
     # region    add_image_link()
 
     @overload
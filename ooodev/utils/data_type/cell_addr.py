@@ -0,0 +1,146 @@
+from __future__ import annotations
+from typing import Any, Tuple, TYPE_CHECKING
+
+import uno
+from ooo.dyn.table.cell_address import CellAddress
+
+if TYPE_CHECKING:
+    from com.sun.star.table import XCell
+
+
+class CellAddr:
+    """
+    Compact, hashable and ordered cell address.
+
+    Values are zero-based and match the fields of ``CellAddress``.
+    A ``CellAddress`` struct is only created when :py:meth:`~.CellAddr.to_uno` is called.
+
+    Instances are immutable and can be used as ``dict`` keys or in a ``set``.
+    Ordering is by sheet, then row, then column.
+
+    .. versionadded:: 0.8.4
+    """
+
+    __slots__ = ("_key", "_hash")
+
+    def __init__(self, col: int, row: int, sheet_idx: int = 0) -> None:
+        """
+        Constructor
+
+        Args:
+            col (int): Zero-based column index.
+            row (int): Zero-based row index.
+            sheet_idx (int, optional): Zero-based sheet index. Defaults to ``0``.
+        """
+        key = (sheet_idx, row, col)
+        object.__setattr__(self, "_key", key)
+        object.__setattr__(self, "_hash", hash(key))
+
+    @staticmethod
+    def from_uno(addr: CellAddress) -> CellAddr:
+        """
+        Gets a ``CellAddr`` from a ``CellAddress``
+
+        Args:
+            addr (CellAddress): Cell Address.
+
+        Returns:
+            CellAddr: Cell address.
+        """
+        return CellAddr(col=addr.Column, row=addr.Row, sheet_idx=addr.Sheet)
+
+    @staticmethod
+    def from_cell(cell: XCell) -> CellAddr:
+        """
+        Gets a ``CellAddr`` from a cell.
+
+        Args:
+            cell (XCell): Cell.
+
+        Raises:
+            MissingInterfaceError: If ``cell`` does not implement ``XCellAddressable``
+
+        Returns:
+            CellAddr: Cell address.
+        """
+        from com.sun.star.sheet import XCellAddressable
+        from .. import lo as mLo
+
+        addr = mLo.Lo.qi(XCellAddressable, cell, True)
+        return CellAddr.from_uno(addr.getCellAddress())
+
+    def to_uno(self) -> CellAddress:
+        """
+        Gets a new ``CellAddress`` struct for this address.
+
+        Returns:
+            CellAddress: Cell Address.
+        """
+        sheet, row, col = self._key
+        return CellAddress(Sheet=sheet, Column=col, Row=row)
+
+    @property
+    def key(self) -> Tuple[int, int, int]:
+        """Gets ``(sheet_idx, row, col)``. Used for equality and ordering."""
+        return self._key
+
+    @property
+    def col(self) -> int:
+        """Gets zero-based column index."""
+        return self._key[2]
+
+    @property
+    def row(self) -> int:
+        """Gets zero-based row index."""
+        return self._key[1]
+
+    @property
+    def sheet_idx(self) -> int:
+        """Gets zero-based sheet index."""
+        return self._key[0]
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __reduce__(self) -> Tuple[type, tuple]:
+        # rebuild through constructor, copy and pickle can not set slots of an immutable instance.
+        sheet, row, col = self._key
+        return (CellAddr, (col, row, sheet))
+
+    def __copy__(self) -> CellAddr:
+        return self
+
+    def __deepcopy__(self, memo: dict) -> CellAddr:
+        return self
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, CellAddr):
+            return self._hash == other._hash and self._key == other._key
+        return NotImplemented
+
+    def __lt__(self, other: CellAddr) -> bool:
+        if isinstance(other, CellAddr):
+            return self._key < other._key
+        return NotImplemented
+
+    def __le__(self, other: CellAddr) -> bool:
+        if isinstance(other, CellAddr):
+            return self._key <= other._key
+        return NotImplemented
+
+    def __gt__(self, other: CellAddr) -> bool:
+        if isinstance(other, CellAddr):
+            return self._key > other._key
+        return NotImplemented
+
+    def __ge__(self, other: CellAddr) -> bool:
+        if isinstance(other, CellAddr):
+            return self._key >= other._key
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        sheet, row, col = self._key
+        return f"CellAddr(col={col}, row={row}, sheet_idx={sheet})"
@@ -4,8 +4,8 @@ from dataclasses import dataclass, field
 from . import col_obj as mCol
 from . import range_obj as mRngObj
 from . import row_obj as mRow
+from . import sheet_context as mSheetCtx
 from .. import table_helper as mTb
-from ...office import calc as mCalc
 
 from ooo.dyn.table.cell_address import CellAddress
 
@@ -15,7 +15,13 @@ class CellObj:
     """
     Cell Parts
 
+    When ``sheet_idx`` is omitted the active sheet index is used.
+    Use :py:class:`~.sheet_context.SheetContext` to supply the sheet index without calling office.
+
     .. versionadded:: 0.8.2
+
+    .. versionchanged:: 0.8.4
+        Sheet index is resolved by :py:class:`~.sheet_context.SheetContext` when a context is active.
     """
 
     col: str
@@ -26,19 +32,17 @@ class CellObj:
     """Sheet index that this cell value belongs to"""
     range_obj: mRngObj.RangeObj | None = field(repr=False, hash=False, default=None)
     """Range Object that instance is part of"""
+    _resolve: bool = field(repr=False, hash=False, compare=False, default=True)
+    # False keeps a negative sheet_idx unresolved, such as for an unknown sheet name.
 
     def __post_init__(self):
         object.__setattr__(self, "col", self.col.upper())
-        if self.sheet_idx < 0:
+        if self.sheet_idx < 0 and self._resolve:
             if self.range_obj:
                 if self.range_obj.sheet_idx >= 0:
                     object.__setattr__(self, "sheet_idx", self.range_obj.sheet_idx)
             else:
-                try:
-                    idx = mCalc.Calc.get_sheet_index()
-                    object.__setattr__(self, "sheet_idx", idx)
-                except:
-                    pass
+                object.__setattr__(self, "sheet_idx", mSheetCtx.resolve_active_index())
 
     @staticmethod
     def from_cell(cell_val: str | CellAddress) -> CellObj:
@@ -53,17 +57,20 @@ class CellObj:
 
         Note:
             If a range name such as ``A23:G45`` or ``Sheet1.A23:G45`` then only the first cell is used.
+
+            When a :py:class:`~.sheet_context.SheetContext` is active sheet names are resolved by the context.
+
+            When ``cell_val`` contains a sheet name that can not be resolved then ``sheet_idx`` is ``-1``.
         """
         if isinstance(cell_val, str):
             # split will cover if a range is passed in, return first cell
             parts = mTb.TableHelper.get_cell_parts(cell_val)
             idx = -1
             if parts.sheet:
-                try:
-                    sheet = mCalc.Calc.get_sheet(doc=mCalc.Calc.open_doc(), sheet_name=parts.sheet)
-                    idx = mCalc.Calc.get_sheet_index(sheet=sheet)
-                except:
-                    pass
+                idx = mSheetCtx.resolve_sheet_index(parts.sheet)
+                if idx < 0:
+                    # unknown sheet name must not fall back to active sheet index.
+                    return CellObj(col=parts.col, row=parts.row, sheet_idx=-1, _resolve=False)
             return CellObj(col=parts.col, row=parts.row, sheet_idx=idx)
 
         # CellAddress
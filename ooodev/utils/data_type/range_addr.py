@@ -0,0 +1,195 @@
+from __future__ import annotations
+from typing import Any, Tuple, TYPE_CHECKING
+
+import uno
+from ooo.dyn.table.cell_range_address import CellRangeAddress
+
+from . import cell_addr as mCellAddr
+
+if TYPE_CHECKING:
+    from com.sun.star.table import XCellRange
+
+
+class RangeAddr:
+    """
+    Compact, hashable and ordered cell range address.
+
+    Values are zero-based and match the fields of ``CellRangeAddress``.
+    A ``CellRangeAddress`` struct is only created when :py:meth:`~.RangeAddr.to_uno` is called.
+
+    Instances are immutable and can be used as ``dict`` keys or in a ``set``,
+    such as removing duplicate ranges returned by :py:meth:`.Calc.find_all`.
+    Ordering is by sheet, then start row, start column, end row and end column.
+
+    .. versionadded:: 0.8.4
+    """
+
+    __slots__ = ("_key", "_hash")
+
+    def __init__(self, col_start: int, row_start: int, col_end: int, row_end: int, sheet_idx: int = 0) -> None:
+        """
+        Constructor
+
+        Args:
+            col_start (int): Zero-based start column index.
+            row_start (int): Zero-based start row index.
+            col_end (int): Zero-based end column index.
+            row_end (int): Zero-based end row index.
+            sheet_idx (int, optional): Zero-based sheet index. Defaults to ``0``.
+        """
+        key = (sheet_idx, row_start, col_start, row_end, col_end)
+        object.__setattr__(self, "_key", key)
+        object.__setattr__(self, "_hash", hash(key))
+
+    @staticmethod
+    def from_uno(addr: CellRangeAddress) -> RangeAddr:
+        """
+        Gets a ``RangeAddr`` from a ``CellRangeAddress``
+
+        Args:
+            addr (CellRangeAddress): Cell Range Address.
+
+        Returns:
+            RangeAddr: Range address.
+        """
+        return RangeAddr(
+            col_start=addr.StartColumn,
+            row_start=addr.StartRow,
+            col_end=addr.EndColumn,
+            row_end=addr.EndRow,
+            sheet_idx=addr.Sheet,
+        )
+
+    @staticmethod
+    def from_cell_range(cell_range: XCellRange) -> RangeAddr:
+        """
+        Gets a ``RangeAddr`` from a cell range.
+
+        Args:
+            cell_range (XCellRange): Cell Range.
+
+        Raises:
+            MissingInterfaceError: If ``cell_range`` does not implement ``XCellRangeAddressable``
+
+        Returns:
+            RangeAddr: Range address.
+        """
+        from com.sun.star.sheet import XCellRangeAddressable
+        from .. import lo as mLo
+
+        addr = mLo.Lo.qi(XCellRangeAddressable, cell_range, True)
+        return RangeAddr.from_uno(addr.getRangeAddress())
+
+    def to_uno(self) -> CellRangeAddress:
+        """
+        Gets a new ``CellRangeAddress`` struct for this address.
+
+        Returns:
+            CellRangeAddress: Cell Range Address.
+        """
+        sheet, row_start, col_start, row_end, col_end = self._key
+        return CellRangeAddress(
+            Sheet=sheet, StartColumn=col_start, StartRow=row_start, EndColumn=col_end, EndRow=row_end
+        )
+
+    def contains(self, addr: mCellAddr.CellAddr) -> bool:
+        """
+        Gets if a cell address is inside this range.
+
+        Args:
+            addr (CellAddr): Cell address.
+
+        Returns:
+            bool: ``True`` if ``addr`` is inside this range; Otherwise, ``False``.
+        """
+        sheet, row_start, col_start, row_end, col_end = self._key
+        return addr.sheet_idx == sheet and row_start <= addr.row <= row_end and col_start <= addr.col <= col_end
+
+    @property
+    def key(self) -> Tuple[int, int, int, int, int]:
+        """Gets ``(sheet_idx, row_start, col_start, row_end, col_end)``. Used for equality and ordering."""
+        return self._key
+
+    @property
+    def start(self) -> mCellAddr.CellAddr:
+        """Gets start cell address."""
+        return mCellAddr.CellAddr(col=self._key[2], row=self._key[1], sheet_idx=self._key[0])
+
+    @property
+    def end(self) -> mCellAddr.CellAddr:
+        """Gets end cell address."""
+        return mCellAddr.CellAddr(col=self._key[4], row=self._key[3], sheet_idx=self._key[0])
+
+    @property
+    def col_start(self) -> int:
+        """Gets zero-based start column index."""
+        return self._key[2]
+
+    @property
+    def row_start(self) -> int:
+        """Gets zero-based start row index."""
+        return self._key[1]
+
+    @property
+    def col_end(self) -> int:
+        """Gets zero-based end column index."""
+        return self._key[4]
+
+    @property
+    def row_end(self) -> int:
+        """Gets zero-based end row index."""
+        return self._key[3]
+
+    @property
+    def sheet_idx(self) -> int:
+        """Gets zero-based sheet index."""
+        return self._key[0]
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __reduce__(self) -> Tuple[type, tuple]:
+        # rebuild through constructor, copy and pickle can not set slots of an immutable instance.
+        sheet, row_start, col_start, row_end, col_end = self._key
+        return (RangeAddr, (col_start, row_start, col_end, row_end, sheet))
+
+    def __copy__(self) -> RangeAddr:
+        return self
+
+    def __deepcopy__(self, memo: dict) -> RangeAddr:
+        return self
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, RangeAddr):
+            return self._hash == other._hash and self._key == other._key
+        return NotImplemented
+
+    def __lt__(self, other: RangeAddr) -> bool:
+        if isinstance(other, RangeAddr):
+            return self._key < other._key
+        return NotImplemented
+
+    def __le__(self, other: RangeAddr) -> bool:
+        if isinstance(other, RangeAddr):
+            return self._key <= other._key
+        return NotImplemented
+
+    def __gt__(self, other: RangeAddr) -> bool:
+        if isinstance(other, RangeAddr):
+            return self._key > other._key
+        return NotImplemented
+
+    def __ge__(self, other: RangeAddr) -> bool:
+        if isinstance(other, RangeAddr):
+            return self._key >= other._key
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        sheet, row_start, col_start, row_end, col_end = self._key
+        return (
+            f"RangeAddr(col_start={col_start}, row_start={row_start}, "
+            f"col_end={col_end}, row_end={row_end}, sheet_idx={sheet})"
+        )
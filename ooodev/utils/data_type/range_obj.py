@@ -3,8 +3,8 @@ from dataclasses import dataclass, field
 from . import cell_obj as mCo
 from . import range_values as mRngValues
 from . import cell_obj as mCell
+from . import sheet_context as mSheetCtx
 from .. import table_helper as mTb
-from ...office import calc as mCalc
 from ..decorator import enforce
 
 import uno
@@ -17,7 +17,13 @@ class RangeObj:
     """
     Range Parts
 
+    When ``sheet_idx`` is omitted the active sheet index is used.
+    Use :py:class:`~.sheet_context.SheetContext` to supply the sheet index without calling office.
+
     .. versionadded:: 0.8.2
+
+    .. versionchanged:: 0.8.4
+        Sheet index is resolved by :py:class:`~.sheet_context.SheetContext` when a context is active.
     """
 
     col_start: str
@@ -39,14 +45,12 @@ class RangeObj:
         object.__setattr__(self, "col_start", self.col_start.upper())
         object.__setattr__(self, "col_end", self.col_end.upper())
 
-        object.__setattr__(self, "start", mCo.CellObj.from_cell(f"{self.col_start}{self.row_start}"))
-        object.__setattr__(self, "end", mCo.CellObj.from_cell(f"{self.col_end}{self.row_end}"))
         if self.sheet_idx < 0:
-            try:
-                idx = mCalc.Calc.get_sheet_index()
-                object.__setattr__(self, "sheet_idx", idx)
-            except:
-                pass
+            object.__setattr__(self, "sheet_idx", mSheetCtx.resolve_active_index())
+        object.__setattr__(
+            self, "start", mCo.CellObj(col=self.col_start, row=self.row_start, sheet_idx=self.sheet_idx)
+        )
+        object.__setattr__(self, "end", mCo.CellObj(col=self.col_end, row=self.row_end, sheet_idx=self.sheet_idx))
 
     @staticmethod
     def from_range(range_val: str | mRngValues.RangeValues | CellRangeAddress) -> RangeObj:
@@ -80,8 +84,7 @@ class RangeObj:
             sheet_name = parts.sheet
             sheet_idx = -1
             if sheet_name:
-                sheet = mCalc.Calc.get_sheet(doc=mCalc.Calc.open_doc(), sheet_name=sheet_name)
-                sheet_idx = mCalc.Calc.get_sheet_index(sheet)
+                sheet_idx = mSheetCtx.resolve_sheet_index(sheet_name, raise_err=True)
 
         return RangeObj(
             col_start=col_start, row_start=row_start, col_end=col_end, row_end=row_end, sheet_idx=sheet_idx
@@ -241,15 +244,9 @@ class RangeObj:
         try:
             return self._sheet_name
         except AttributeError:
-            name = ""
-            if self.sheet_idx < 0:
-                return name
-            try:
-                sheet = mCalc.Calc.get_sheet(doc=mCalc.Calc.open_doc(), index=self.sheet_idx)
-                name = mCalc.Calc.get_sheet_name(sheet=sheet)
+            name = mSheetCtx.resolve_sheet_name(self.sheet_idx)
+            if name:
                 object.__setattr__(self, "_sheet_name", name)
-            except:
-                pass
         return name
 
     @property
@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from typing import overload
 from . import range_obj as mRngObj
 from .. import table_helper as mTb
-from ...office import calc as mCalc
+from . import sheet_context as mSheetCtx
 from ..decorator import enforce
 
 import uno
@@ -32,11 +32,7 @@ class RangeValues:
 
     def __post_init__(self):
         if self.sheet_idx < 0:
-            try:
-                idx = mCalc.Calc.get_sheet_index()
-                object.__setattr__(self, "sheet_idx", idx)
-            except:
-                pass
+            object.__setattr__(self, "sheet_idx", mSheetCtx.resolve_active_index())
 
     def __eq__(self, other: object) -> bool:
         if isinstance(other, RangeValues):
@@ -100,8 +96,7 @@ class RangeValues:
             sheet_name = parts.sheet
             sheet_idx = -1
             if sheet_name:
-                sheet = mCalc.Calc.get_sheet(doc=mCalc.Calc.open_doc(), sheet_name=sheet_name)
-                sheet_idx = mCalc.Calc.get_sheet_index(sheet)
+                sheet_idx = mSheetCtx.resolve_sheet_index(sheet_name, raise_err=True)
         else:
             # CellRange
             col_start = range_val.StartColumn
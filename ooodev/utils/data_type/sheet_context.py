@@ -0,0 +1,217 @@
+from __future__ import annotations
+import threading
+from typing import Dict, List, Sequence, TYPE_CHECKING
+
+from ...office import calc as mCalc
+
+if TYPE_CHECKING:
+    from com.sun.star.sheet import XSpreadsheetDocument
+
+
+class SheetContext:
+    """
+    Context manager that supplies sheet information to ``CellObj``, ``RangeObj`` and ``RangeValues``.
+
+    By default when a ``CellObj``, ``RangeObj`` or ``RangeValues`` is created without a sheet index
+    the active sheet index is looked up in office. When a cell or range name contains a sheet name
+    such as ``Sheet1.A1`` the sheet index is also looked up in office.
+
+    While a ``SheetContext`` is active these lookups are answered by the context instead and no calls
+    are made to office. This makes constructing large numbers of objects a pure python operation.
+
+    Contexts are thread local and may be nested.
+
+    Example:
+
+        .. code-block:: python
+
+            # resolve all sheet information once
+            with SheetContext.from_doc(doc):
+                cells = [CellObj.from_idx(col_idx=0, row_idx=i) for i in range(100_000)]
+
+            # offline, sheet index is left unresolved (-1)
+            with SheetContext():
+                rng = RangeObj.from_range("A1:D20")
+
+    .. versionadded:: 0.8.4
+    """
+
+    _local = threading.local()
+
+    def __init__(self, sheet_idx: int = -1, sheet_names: Sequence[str] | None = None) -> None:
+        """
+        Constructor
+
+        Args:
+            sheet_idx (int, optional): Sheet index assigned to objects created without a sheet index.
+                Defaults to ``-1`` which leaves the sheet index unresolved.
+            sheet_names (Sequence[str], optional): Sheet names in index order.
+                Used to resolve sheet names without calling office. Defaults to ``None``.
+        """
+        self._sheet_idx = sheet_idx
+        self._sheet_names = tuple(sheet_names) if sheet_names else ()
+        self._name_map: Dict[str, int] = {name: i for i, name in enumerate(self._sheet_names)}
+
+    @classmethod
+    def from_doc(cls, doc: XSpreadsheetDocument | None = None) -> SheetContext:
+        """
+        Gets a context populated from a document.
+
+        The active sheet index and sheet names are read from office once.
+
+        Args:
+            doc (XSpreadsheetDocument, optional): Spreadsheet Document. Defaults to current document.
+
+        Returns:
+            SheetContext: Sheet context.
+        """
+        if doc is None:
+            doc = mCalc.Calc.open_doc()
+        names = mCalc.Calc.get_sheet_names(doc)
+        idx = mCalc.Calc.get_sheet_index(mCalc.Calc.get_active_sheet(doc))
+        return cls(sheet_idx=idx, sheet_names=names)
+
+    @classmethod
+    def _get_stack(cls) -> List[SheetContext]:
+        try:
+            return cls._local.stack
+        except AttributeError:
+            cls._local.stack = []
+        return cls._local.stack
+
+    @classmethod
+    def current(cls) -> SheetContext | None:
+        """
+        Gets the active context for the current thread.
+
+        Returns:
+            SheetContext | None: Active context if any; Otherwise, ``None``.
+        """
+        stack = cls._get_stack()
+        return stack[-1] if stack else None
+
+    def get_sheet_index(self, sheet_name: str) -> int:
+        """
+        Gets sheet index for a sheet name.
+
+        Args:
+            sheet_name (str): Sheet name
+
+        Returns:
+            int: Sheet index if name is known to context; Otherwise, ``-1``
+        """
+        return self._name_map.get(sheet_name, -1)
+
+    def get_sheet_name(self, sheet_idx: int) -> str:
+        """
+        Gets sheet name for a sheet index.
+
+        Args:
+            sheet_idx (int): Sheet index
+
+        Returns:
+            str: Sheet name if index is known to context; Otherwise, empty string.
+        """
+        if 0 <= sheet_idx < len(self._sheet_names):
+            return self._sheet_names[sheet_idx]
+        return ""
+
+    @property
+    def sheet_idx(self) -> int:
+        """Gets the sheet index assigned to objects created without a sheet index."""
+        return self._sheet_idx
+
+    @property
+    def sheet_names(self) -> tuple:
+        """Gets sheet names known to this context."""
+        return self._sheet_names
+
+    def __enter__(self) -> SheetContext:
+        self._get_stack().append(self)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        stack = self._get_stack()
+        if stack and stack[-1] is self:
+            stack.pop()
+        elif self in stack:
+            stack.remove(self)
+
+
+def resolve_active_index() -> int:
+    """
+    Gets the sheet index for objects created without a sheet index.
+
+    Uses the current :py:class:`SheetContext` if any; Otherwise, active sheet index is looked up in office.
+
+    Returns:
+        int: Sheet index or ``-1`` if it can not be resolved.
+
+    .. versionadded:: 0.8.4
+    """
+    ctx = SheetContext.current()
+    if ctx is not None:
+        return ctx.sheet_idx
+    try:
+        return mCalc.Calc.get_sheet_index()
+    except Exception:
+        return -1
+
+
+def resolve_sheet_index(sheet_name: str, raise_err: bool = False) -> int:
+    """
+    Gets the sheet index for a sheet name.
+
+    Uses the current :py:class:`SheetContext` if any; Otherwise, sheet is looked up in office.
+
+    Args:
+        sheet_name (str): Sheet name.
+        raise_err (bool, optional): If ``True`` then an error is raised if sheet can not be resolved. Default ``False``.
+
+    Raises:
+        ValueError: If ``raise_err`` is ``True`` and sheet name is not known to current context.
+
+    Returns:
+        int: Sheet index or ``-1`` if it can not be resolved.
+
+    .. versionadded:: 0.8.4
+    """
+    ctx = SheetContext.current()
+    if ctx is not None:
+        idx = ctx.get_sheet_index(sheet_name)
+        if idx < 0 and raise_err:
+            raise ValueError(f"Sheet '{sheet_name}' not found in sheet context")
+        return idx
+    try:
+        sheet = mCalc.Calc.get_sheet(doc=mCalc.Calc.open_doc(), sheet_name=sheet_name)
+        return mCalc.Calc.get_sheet_index(sheet=sheet)
+    except Exception:
+        if raise_err:
+            raise
+        return -1
+
+
+def resolve_sheet_name(sheet_idx: int) -> str:
+    """
+    Gets the sheet name for a sheet index.
+
+    Uses the current :py:class:`SheetContext` if any; Otherwise, sheet is looked up in office.
+
+    Args:
+        sheet_idx (int): Sheet index.
+
+    Returns:
+        str: Sheet name or empty string if it can not be resolved.
+
+    .. versionadded:: 0.8.4
+    """
+    if sheet_idx < 0:
+        return ""
+    ctx = SheetContext.current()
+    if ctx is not None:
+        return ctx.get_sheet_name(sheet_idx)
+    try:
+        sheet = mCalc.Calc.get_sheet(doc=mCalc.Calc.open_doc(), index=sheet_idx)
+        return mCalc.Calc.get_sheet_name(sheet=sheet)
+    except Exception:
+        return ""
@@ -0,0 +1,50 @@
+from __future__ import annotations
+from enum import Enum
+from typing import Any, NamedTuple
+
+
+class TextItemKind(str, Enum):
+    """
+    Kind of :py:class:`~.text_item.TextItem`
+
+    .. versionadded:: 0.8.4
+    """
+
+    PARAGRAPH = "PARAGRAPH"
+    """Paragraph of text"""
+    TABLE = "TABLE"
+    """Text table"""
+    FRAME = "FRAME"
+    """Text frame"""
+
+    def __str__(self) -> str:
+        return self.value
+
+
+class TextItem(NamedTuple):
+    """
+    Paragraph, table or frame of a Writer document as yielded by :py:meth:`.Write.iter_text_items`
+
+    .. versionadded:: 0.8.4
+    """
+
+    kind: TextItemKind
+    """Kind of item"""
+    index: int
+    """Zero based position of item in iteration order"""
+    offset: int
+    """
+    Offset of item text in the text of all items, where each item text is followed by a single separator.
+    Counted in UTF-16 units, the same way office counts characters.
+    """
+    text: str
+    """
+    Text of item.
+    Table cells are separated by a tab and table rows by a new line.
+    """
+    style_name: str
+    """Paragraph style name for paragraphs, table template name for tables and frame style name for frames"""
+    name: str
+    """Table or frame name. Empty for paragraphs"""
+    obj: Any
+    """Office object of item such as ``com.sun.star.text.Paragraph``"""
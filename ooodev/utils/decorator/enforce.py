@@ -13,6 +13,9 @@ def enforce_types(callable):
     """
     # https://stackoverflow.com/questions/50563546/validating-detailed-types-in-python-dataclasses
     spec = inspect.getfullargspec(callable)
+    # string annotations are located on first use, locate() imports modules and is slow.
+    # not done when decorating because annotated types may not be importable yet.
+    located = {}
 
     def check_types(*args, **kwargs):
         parameters = dict(zip(spec.args, args))
@@ -25,7 +28,11 @@ def enforce_types(callable):
                     # then type will be a string.
                     # locate will convert the string to type in most cases
                     # https://stackoverflow.com/questions/11775460/lexical-cast-from-string-to-type
-                    type_hint = locate(type_hint)
+                    try:
+                        type_hint = located[name]
+                    except KeyError:
+                        type_hint = locate(type_hint)
+                        located[name] = type_hint
 
                 if isinstance(type_hint, typing._SpecialForm):
                     # No check for typing.Any, typing.Union, typing.ClassVar (without parameters)
@@ -0,0 +1,294 @@
+# coding: utf-8
+from __future__ import annotations
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, Iterable, NamedTuple, Set, Tuple
+
+from ..conn import cache as mCache
+from ..conn import connectors
+from ..conn import office_pool as mPool
+from . import file_io as mFileIO
+from . import lo as mLo
+from .type_var import PathOrStr
+
+from com.sun.star.frame import XStorable
+
+
+class ConvertResult(NamedTuple):
+    """
+    Result of converting a single file
+
+    .. versionadded:: 0.8.4
+    """
+
+    src: str
+    """Input file"""
+    dst: str
+    """Output file"""
+    ok: bool
+    """``True`` if file was converted"""
+    seconds: float
+    """Time taken to convert file including retries"""
+    attempts: int
+    """Number of attempts, more than one if office crashed while converting"""
+    error: str = ""
+    """Error message if conversion failed"""
+
+
+class ConvertSummary(NamedTuple):
+    """
+    Summary of a :py:func:`~.doc_convert.convert_many` run
+
+    .. versionadded:: 0.8.4
+    """
+
+    converted: int
+    """Number of files converted"""
+    failed: int
+    """Number of files that failed to convert"""
+    skipped: int
+    """Number of files skipped because manifest shows they are already converted"""
+    seconds: float
+    """Total time of run"""
+
+    @property
+    def files_per_sec(self) -> float:
+        """Gets number of files converted per second"""
+        if self.seconds <= 0.0:
+            return 0.0
+        return self.converted / self.seconds
+
+
+class ConvertManifest:
+    """
+    Append only record of converted files used to resume a conversion run.
+
+    Each result is written to the manifest file as a single json line as soon as it is known,
+    so a run that is killed can continue where it stopped.
+
+    .. versionadded:: 0.8.4
+    """
+
+    def __init__(self, fnm: PathOrStr) -> None:
+        """
+        Constructor
+
+        Args:
+            fnm (PathOrStr): Manifest file. Created if it does not exist.
+        """
+        self._fnm = Path(fnm)
+        self._lock = threading.Lock()
+        self._done: Dict[str, str] = {}
+        if self._fnm.exists():
+            with open(self._fnm, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        # last line of a killed run may be incomplete.
+                        continue
+                    if entry.get("ok", False):
+                        self._done[entry["src"]] = entry["dst"]
+                    else:
+                        self._done.pop(entry.get("src", ""), None)
+
+    def is_done(self, src: str) -> bool:
+        """
+        Gets if ``src`` has been converted and its output still exist.
+
+        Args:
+            src (str): Input file.
+
+        Returns:
+            bool: ``True`` if converted; Otherwise, ``False``.
+        """
+        dst = self._done.get(src, None)
+        if dst is None:
+            return False
+        return os.path.exists(dst)
+
+    def add(self, result: ConvertResult) -> None:
+        """
+        Records a result.
+
+        Args:
+            result (ConvertResult): Result of converting a file.
+        """
+        line = json.dumps(result._asdict())
+        with self._lock:
+            with open(self._fnm, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+                f.flush()
+            if result.ok:
+                self._done[result.src] = result.dst
+            else:
+                self._done.pop(result.src, None)
+
+    @property
+    def fnm(self) -> Path:
+        """Gets manifest file"""
+        return self._fnm
+
+
+def _convert_one(office: mPool.PooledOffice, src: str, dst: str, filter_name: str | None) -> None:
+    # converts a single file in office instance.
+    with office.open_doc(src) as doc:
+        if filter_name is None:
+            if not mLo.Lo.save_doc(doc, dst):
+                raise Exception(f"Unable to save the document: {dst}")
+        else:
+            store = mLo.Lo.qi(XStorable, doc, True)
+            if not mLo.Lo.store_doc_format(store, dst, filter_name):
+                raise Exception(f"Unable to save the document: {dst}")
+
+
+def convert_many(
+    inputs: Iterable[PathOrStr],
+    out_dir: PathOrStr,
+    fmt: str,
+    workers: int = 0,
+    *,
+    filter_name: str | None = None,
+    manifest: PathOrStr | None = None,
+    retries: int = 2,
+    src_root: PathOrStr | None = None,
+    connector: Callable[[int], connectors.ConnectPipe | connectors.ConnectSocket] | None = None,
+    cache_obj: mCache.Cache | None = None,
+    on_result: Callable[[ConvertResult], None] | None = None,
+) -> ConvertSummary:
+    """
+    Converts many documents using several office instances.
+
+    Inputs are read as they are needed so ``inputs`` can be a generator over a very large number of files.
+    Each worker uses its own office instance of an :py:class:`~.conn.office_pool.OfficePool`.
+    If an office instance crashes while converting, it is restarted and the file is tried again.
+
+    Output file name is the input file name with the extension changed to ``fmt``.
+    When ``src_root`` is given the path of the input relative to ``src_root`` is kept in ``out_dir``,
+    so files with the same name in different directories do not overwrite each other.
+    An input whose output file is already used by another input of the same run,
+    such as ``report.doc`` and ``report.docx``, fails and is not converted.
+
+    Args:
+        inputs (Iterable[PathOrStr]): Files to convert.
+        out_dir (PathOrStr): Directory to write converted files to. Created if it does not exist.
+        fmt (str): Extension of converted files such as ``pdf`` or ``docx``.
+        workers (int, optional): Number of office instances. Defaults to number of cpu's.
+        filter_name (str, optional): Export filter name such as ``writer_pdf_Export``.
+            Defaults to filter from :py:meth:`.Lo.ext_to_format` for ``fmt`` and the document type.
+        manifest (PathOrStr, optional): Manifest file. When given, files recorded as converted are skipped and
+            each result is appended, making the run resumable.
+        retries (int, optional): Number of times a file is tried again after office crashed. Defaults to ``2``.
+        src_root (PathOrStr, optional): Root directory of inputs. When given, output files mirror the input
+            directory structure below ``src_root``. An input that is not below ``src_root`` fails.
+        connector (Callable[[int], ConnectPipe | ConnectSocket], optional): Gets connector for each office instance.
+            See :py:class:`~.conn.office_pool.OfficePool`.
+        cache_obj (Cache, optional): Profile cache for office instances.
+        on_result (Callable[[ConvertResult], None], optional): Called with the result of each file as it completes.
+            Called from worker threads.
+
+    Raises:
+        Exception: Error raised by ``on_result`` or while writing to ``manifest``. No more files are converted.
+
+    Returns:
+        ConvertSummary: Summary of run including throughput.
+
+    Example:
+
+        .. code::
+
+            summary = convert_many(Path("in").glob("*.docx"), "out", "pdf", workers=4, manifest="out/manifest.jsonl")
+            print(f"{summary.converted} files, {summary.files_per_sec:.1f} files/sec")
+
+    .. versionadded:: 0.8.4
+    """
+    start = time.perf_counter()
+    out_path = Path(out_dir)
+    out_path.mkdir(parents=True, exist_ok=True)
+    root_path = None if src_root is None else mFileIO.FileIO.get_absolute_path(src_root)
+    ext = fmt.lstrip(".")
+    mf = None if manifest is None else ConvertManifest(manifest)
+
+    pool = mPool.OfficePool(size=workers, connector=connector, cache_obj=cache_obj)
+    lock = threading.Lock()
+    counts = {"converted": 0, "failed": 0, "skipped": 0}
+    # output files of this run, keyed by normalized path so differently cased names collide on any os.
+    claimed: Set[str] = set()
+
+    def get_dst(src: str) -> Tuple[str, str]:
+        # returns (dst, error)
+        src_path = Path(src)
+        if root_path is None:
+            dst = out_path / f"{src_path.stem}.{ext}"
+        else:
+            try:
+                rel = src_path.relative_to(root_path)
+            except ValueError:
+                return ("", f"Input is not below src_root: {src}")
+            dst = out_path / rel.with_suffix(f".{ext}")
+        key = os.path.normcase(os.path.normpath(dst))
+        if key in claimed:
+            return (str(dst), f"Output file is used by another input: {dst}")
+        claimed.add(key)
+        return (str(dst), "")
+
+    def convert(src: str, dst: str) -> ConvertResult:
+        Path(dst).parent.mkdir(parents=True, exist_ok=True)
+        file_start = time.perf_counter()
+        attempts = 0
+        while True:
+            attempts += 1
+            office = pool.acquire()
+            try:
+                _convert_one(office, src, dst, filter_name)
+                return ConvertResult(src, dst, True, time.perf_counter() - file_start, attempts)
+            except Exception as e:
+                crashed = not office.is_alive()
+                if not crashed or attempts > retries:
+                    return ConvertResult(src, dst, False, time.perf_counter() - file_start, attempts, str(e))
+            finally:
+                # a crashed office instance is restarted by release.
+                pool.release(office)
+
+    def pending() -> Iterable[Tuple[str, str, str]]:
+        for item in inputs:
+            src = str(mFileIO.FileIO.get_absolute_path(item))
+            if mf is not None and mf.is_done(src):
+                counts["skipped"] += 1
+                continue
+            dst, error = get_dst(src)
+            yield (src, dst, error)
+
+    def work(job: Tuple[str, str, str]) -> None:
+        src, dst, error = job
+        if error:
+            result = ConvertResult(src, dst, False, 0.0, 0, error)
+        else:
+            try:
+                result = convert(src, dst)
+            except Exception as e:
+                # office could not be restarted.
+                result = ConvertResult(src, dst, False, 0.0, 0, str(e))
+        with lock:
+            counts["converted" if result.ok else "failed"] += 1
+        # errors of manifest or on_result are raised by run_jobs() once workers stop.
+        if mf is not None:
+            mf.add(result)
+        if on_result is not None:
+            on_result(result)
+
+    pool.start()
+    try:
+        mPool.run_jobs(pool, pending(), work, name="ooodev-convert")
+    finally:
+        pool.close()
+
+    return ConvertSummary(
+        converted=counts["converted"],
+        failed=counts["failed"],
+        skipped=counts["skipped"],
+        seconds=time.perf_counter() - start,
+    )
@@ -0,0 +1,261 @@
+# coding: utf-8
+from __future__ import annotations
+import threading
+import weakref
+from typing import Dict, NamedTuple, TYPE_CHECKING
+
+import uno
+from com.sun.star.beans import XMultiPropertySet
+from com.sun.star.document import XDocumentPropertiesSupplier
+from com.sun.star.document import XUndoManagerSupplier
+from com.sun.star.util import XModifyBroadcaster
+
+from . import lo as mLo
+from ..listeners.x_modify_adapter import XModifyAdapter
+from ..listeners.x_undo_manager_adapter import XUndoManagerAdapter
+
+if TYPE_CHECKING:
+    from com.sun.star.document import UndoManagerEvent
+    from com.sun.star.document import XUndoManager
+    from com.sun.star.lang import EventObject
+    from com.sun.star.lang import XComponent
+
+# text document properties that recount statistics when read.
+_UPDATE_PROPS = ("CharacterCount", "ParagraphCount", "WordCount")
+
+
+class DocStats(NamedTuple):
+    """
+    Document statistics
+
+    Values that do not apply to a document type are ``0``.
+
+    .. versionadded:: 0.8.4
+    """
+
+    pages: int
+    """Number of pages"""
+    paragraphs: int
+    """Number of paragraphs"""
+    words: int
+    """Number of words"""
+    characters: int
+    """Number of characters"""
+    non_whitespace_characters: int
+    """Number of characters that are not white space"""
+    tables: int
+    """Number of tables"""
+    images: int
+    """Number of images"""
+    objects: int
+    """Number of embedded objects"""
+    values: Dict[str, int]
+    """All statistics reported by office, such as ``PageCount`` and ``CellCount``"""
+
+
+def get_doc_stats(doc: XComponent, update: bool = True) -> DocStats:
+    """
+    Gets document statistics.
+
+    Statistics are read from the document properties ``DocumentStatistics`` in a single call.
+    Unlike :py:meth:`.Write.get_page_count` no controller or view is needed so this works for hidden documents.
+
+    Args:
+        doc (XComponent): Office document.
+        update (bool, optional): If ``True`` text document statistics are recounted before they are read.
+            When ``False`` values may be those of the last time office updated statistics. Defaults to ``True``.
+
+    Raises:
+        MissingInterfaceError: If ``doc`` does not implement ``XDocumentPropertiesSupplier``.
+
+    Returns:
+        DocStats: Statistics.
+
+    See Also:
+        :py:class:`~.doc_stats.DocStatsCache`
+
+    .. versionadded:: 0.8.4
+    """
+    if update:
+        mps = mLo.Lo.qi(XMultiPropertySet, doc)
+        if mps is not None:
+            try:
+                # reading counts of a text document makes office recount statistics.
+                mps.getPropertyValues(_UPDATE_PROPS)
+            except Exception:
+                # not a text document
+                pass
+    supplier = mLo.Lo.qi(XDocumentPropertiesSupplier, doc, True)
+    values: Dict[str, int] = {}
+    for nv in supplier.getDocumentProperties().DocumentStatistics:
+        try:
+            values[nv.Name] = int(nv.Value)
+        except (TypeError, ValueError):
+            continue
+    return DocStats(
+        pages=values.get("PageCount", 0),
+        paragraphs=values.get("ParagraphCount", 0),
+        words=values.get("WordCount", 0),
+        characters=values.get("CharacterCount", 0),
+        non_whitespace_characters=values.get("NonWhitespaceCharacterCount", 0),
+        tables=values.get("TableCount", 0),
+        images=values.get("ImageCount", 0),
+        objects=values.get("ObjectCount", 0),
+        values=values,
+    )
+
+
+class _StatsModifyListener(XModifyAdapter):
+    def __init__(self, owner: DocStatsCache) -> None:
+        super().__init__()
+        # weak so a cache that is not closed can still be released
+        self._owner = weakref.ref(owner)
+
+    def modified(self, event: EventObject) -> None:
+        owner = self._owner()
+        if owner is not None:
+            owner.invalidate()
+
+    def disposing(self, event: EventObject) -> None:
+        self.modified(event)
+
+
+class _StatsUndoListener(XUndoManagerAdapter):
+    # the modify event is only sent when an unmodified document becomes modified,
+    # each change that can be undone is reported here.
+    def __init__(self, owner: DocStatsCache) -> None:
+        super().__init__()
+        self._owner = weakref.ref(owner)
+
+    def _invalidate(self) -> None:
+        owner = self._owner()
+        if owner is not None:
+            owner.invalidate()
+
+    def undoActionAdded(self, event: UndoManagerEvent) -> None:
+        self._invalidate()
+
+    def actionUndone(self, event: UndoManagerEvent) -> None:
+        self._invalidate()
+
+    def actionRedone(self, event: UndoManagerEvent) -> None:
+        self._invalidate()
+
+    def leftContext(self, event: UndoManagerEvent) -> None:
+        self._invalidate()
+
+    def leftHiddenContext(self, event: UndoManagerEvent) -> None:
+        self._invalidate()
+
+    def disposing(self, event: EventObject) -> None:
+        self._invalidate()
+
+
+class DocStatsCache:
+    """
+    Caches the statistics of a document until the document is modified.
+
+    A modify listener is added to the document and, when the document has one, a listener to its undo manager.
+    Repeated calls to :py:meth:`~.doc_stats.DocStatsCache.get` do not call office until the document
+    broadcasts a modification or an undo action.
+
+    Note:
+        Office only broadcasts a modification when the document modified state changes,
+        later changes are seen through the undo manager.
+        Changes made while the undo manager is locked or disabled are not seen.
+        Call :py:meth:`~.doc_stats.DocStatsCache.invalidate` after such changes when exact values are needed.
+
+    Example:
+
+        .. code::
+
+            with DocStatsCache(doc) as stats:
+                for fnm in parts:
+                    if stats.get().pages >= max_pages:
+                        break
+                    Write.append_para(cursor, get_text(fnm))
+
+    .. versionadded:: 0.8.4
+    """
+
+    def __init__(self, doc: XComponent, update: bool = True) -> None:
+        """
+        Constructor
+
+        Args:
+            doc (XComponent): Office document.
+            update (bool, optional): Passed to :py:func:`~.doc_stats.get_doc_stats`. Defaults to ``True``.
+
+        Raises:
+            MissingInterfaceError: If ``doc`` does not implement ``XModifyBroadcaster``.
+        """
+        self._doc = doc
+        self._update = update
+        self._lock = threading.Lock()
+        self._stats: DocStats | None = None
+        # incremented on each modification, stats read while document changed are not cached.
+        self._generation = 0
+        self._listener = _StatsModifyListener(self)
+        self._broadcaster = mLo.Lo.qi(XModifyBroadcaster, doc, True)
+        self._broadcaster.addModifyListener(self._listener)
+        self._undo_listener = _StatsUndoListener(self)
+        self._undo_manager: XUndoManager | None = None
+        undo_supplier = mLo.Lo.qi(XUndoManagerSupplier, doc)
+        if undo_supplier is not None:
+            self._undo_manager = undo_supplier.getUndoManager()
+            self._undo_manager.addUndoManagerListener(self._undo_listener)
+
+    def __enter__(self) -> DocStatsCache:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def get(self) -> DocStats:
+        """
+        Gets document statistics, reading them from office only if document was modified since last read.
+
+        Returns:
+            DocStats: Statistics.
+        """
+        stats = self._stats
+        if stats is None:
+            generation = self._generation
+            stats = get_doc_stats(self._doc, self._update)
+            with self._lock:
+                if generation == self._generation:
+                    self._stats = stats
+        return stats
+
+    def invalidate(self) -> None:
+        """
+        Clears cached statistics. Next call to :py:meth:`~.doc_stats.DocStatsCache.get` reads from office.
+        """
+        with self._lock:
+            self._stats = None
+            self._generation += 1
+
+    def close(self) -> None:
+        """
+        Removes listeners from document.
+        """
+        if self._broadcaster is None:
+            return
+        try:
+            self._broadcaster.removeModifyListener(self._listener)
+            if self._undo_manager is not None:
+                self._undo_manager.removeUndoManagerListener(self._undo_listener)
+        except Exception:
+            # document may already be closed
+            pass
+        self._broadcaster = None
+        self._undo_manager = None
+        self._stats = None
+
+    @property
+    def is_cached(self) -> bool:
+        """Gets if statistics are cached"""
+        return self._stats is not None
+
+
+__all__ = ("DocStats", "DocStatsCache", "get_doc_stats")
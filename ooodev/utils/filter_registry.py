@@ -0,0 +1,398 @@
+# coding: utf-8
+from __future__ import annotations
+import json
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Tuple
+
+import uno
+from com.sun.star.container import XNameAccess
+
+from ooo.dyn.beans.property_value import PropertyValue
+
+from . import info as mInfo
+from . import lo as mLo
+from . import props as mProps
+from .type_var import PathOrStr
+from ..events.args.event_args import EventArgs
+from ..events.event_singleton import _Events
+from ..events.lo_named_event import LoNamedEvent
+
+_FILE_VERSION = 1
+
+
+class FilterInfo(NamedTuple):
+    """
+    Information about an office import or export filter
+
+    .. versionadded:: 0.8.4
+    """
+
+    name: str
+    """Filter name such as ``writer_pdf_Export``"""
+    ui_name: str
+    """Name of filter shown in user interface"""
+    type: str
+    """Type detection name of files handled by filter"""
+    document_service: str
+    """Document service such as ``com.sun.star.text.TextDocument``"""
+    flags: int
+    """Filter flags, see :py:class:`.Info.Filter`"""
+    extensions: Tuple[str, ...]
+    """Lower case file extensions of filter type, without leading dot"""
+    mime_type: str
+    """Media type of filter type"""
+
+    @property
+    def is_import(self) -> bool:
+        """Gets if filter can import"""
+        return mInfo.Info.is_import(self.flags)
+
+    @property
+    def is_export(self) -> bool:
+        """Gets if filter can export"""
+        return mInfo.Info.is_export(self.flags)
+
+
+class FilterRegistry:
+    """
+    Process wide cache of office filters.
+
+    Filters are read from office the first time they are needed and indexed by name,
+    extension, media type and document service. After that, lookups do not make any calls to office.
+
+    The registry can be saved to a file with :py:meth:`~.FilterRegistry.save` and loaded in another process
+    with :py:meth:`~.FilterRegistry.load_file`, saving the time to read filters from office.
+
+    .. versionadded:: 0.8.4
+    """
+
+    _lock = threading.RLock()
+    _filters: Dict[str, FilterInfo] | None = None
+    _props: Dict[str, Dict[str, Any]] = {}
+    _by_ext: Dict[str, List[FilterInfo]] = {}
+    _by_mime: Dict[str, List[FilterInfo]] = {}
+    _by_service: Dict[str, List[FilterInfo]] = {}
+    _export_cache: Dict[Tuple[str, str], str | None] = {}
+
+    # region internal
+    @staticmethod
+    def _to_dict(props: Any) -> Dict[str, Any]:
+        result = {}
+        for p in props:
+            val = p.Value
+            if isinstance(val, uno.Any):
+                val = val.value
+            result[p.Name] = val
+        return result
+
+    @classmethod
+    def _read_office(cls) -> Dict[str, Dict[str, Any]]:
+        filter_factory = mLo.Lo.create_instance_mcf(XNameAccess, "com.sun.star.document.FilterFactory")
+        if filter_factory is None:
+            mLo.Lo.print("No Filter factory found")
+            return {}
+        type_detect = mLo.Lo.create_instance_mcf(XNameAccess, "com.sun.star.document.TypeDetection")
+        types: Dict[str, Dict[str, Any]] = {}
+        result = {}
+        for name in filter_factory.getElementNames():
+            try:
+                props = cls._to_dict(filter_factory.getByName(name))
+            except Exception:
+                continue
+            type_name = props.get("Type", "")
+            if type_detect is not None and type_name and type_name not in types:
+                try:
+                    types[type_name] = cls._to_dict(type_detect.getByName(type_name))
+                except Exception:
+                    types[type_name] = {}
+            type_props = types.get(type_name, {})
+            # extensions and media type belong to type, not filter, stored with filter so they are persisted.
+            props["_Extensions"] = tuple(type_props.get("Extensions", ()))
+            props["_MediaType"] = type_props.get("MediaType", "")
+            result[name] = props
+        return result
+
+    @classmethod
+    def _build(cls, props: Dict[str, Dict[str, Any]]) -> None:
+        filters = {}
+        by_ext: Dict[str, List[FilterInfo]] = {}
+        by_mime: Dict[str, List[FilterInfo]] = {}
+        by_service: Dict[str, List[FilterInfo]] = {}
+        for name, p in props.items():
+            fi = FilterInfo(
+                name=name,
+                ui_name=str(p.get("UIName", "")),
+                type=str(p.get("Type", "")),
+                document_service=str(p.get("DocumentService", "")),
+                flags=int(p.get("Flags", 0)),
+                extensions=tuple(str(e).lower() for e in p.get("_Extensions", ())),
+                mime_type=str(p.get("_MediaType", "")),
+            )
+            filters[name] = fi
+            for ext in fi.extensions:
+                by_ext.setdefault(ext, []).append(fi)
+            if fi.mime_type:
+                by_mime.setdefault(fi.mime_type, []).append(fi)
+            if fi.document_service:
+                by_service.setdefault(fi.document_service, []).append(fi)
+        cls._props = props
+        cls._by_ext = by_ext
+        cls._by_mime = by_mime
+        cls._by_service = by_service
+        cls._export_cache = {}
+        cls._filters = filters
+
+    @classmethod
+    def _get_filters(cls) -> Dict[str, FilterInfo]:
+        filters = cls._filters
+        if filters is None:
+            with cls._lock:
+                if cls._filters is None:
+                    props = cls._read_office()
+                    if not props:
+                        # office not available, try again next time.
+                        return {}
+                    cls._build(props)
+                filters = cls._filters
+        return filters
+
+    # endregion internal
+
+    @classmethod
+    def clear(cls) -> None:
+        """
+        Clears registry. Filters are read again from office the next time they are needed.
+
+        Registry is cleared automatically when office connection changes.
+        """
+        with cls._lock:
+            cls._filters = None
+            cls._props = {}
+            cls._by_ext = {}
+            cls._by_mime = {}
+            cls._by_service = {}
+            cls._export_cache = {}
+
+    @classmethod
+    def is_loaded(cls) -> bool:
+        """
+        Gets if registry has been populated.
+
+        Returns:
+            bool: ``True`` if populated; Otherwise, ``False``.
+        """
+        return cls._filters is not None
+
+    @classmethod
+    def get_names(cls) -> Tuple[str, ...]:
+        """
+        Gets all filter names.
+
+        Returns:
+            Tuple[str, ...]: Filter names.
+        """
+        return tuple(cls._get_filters().keys())
+
+    @classmethod
+    def get(cls, name: str) -> FilterInfo | None:
+        """
+        Gets filter information.
+
+        Args:
+            name (str): Filter name.
+
+        Returns:
+            FilterInfo | None: Filter information if found; Otherwise, ``None``.
+        """
+        return cls._get_filters().get(name, None)
+
+    @classmethod
+    def get_props(cls, name: str) -> List[PropertyValue]:
+        """
+        Gets filter properties as returned by office ``FilterFactory``.
+
+        Args:
+            name (str): Filter name.
+
+        Returns:
+            List[PropertyValue]: Properties. Empty if filter is not found.
+        """
+        cls._get_filters()
+        props = cls._props.get(name, None)
+        if props is None:
+            return []
+        return [
+            mProps.Props.make_prop_value(name=key, value=val) for key, val in props.items() if not key.startswith("_")
+        ]
+
+    @classmethod
+    def find_by_ext(cls, ext: str, document_service: str = "", flags: int = 0) -> List[FilterInfo]:
+        """
+        Gets filters that handle a file extension.
+
+        Args:
+            ext (str): File extension such as ``pdf`` or ``.pdf``.
+            document_service (str, optional): Only include filters for this document service such as
+                ``com.sun.star.text.TextDocument``.
+            flags (int, optional): Only include filters that have all of these :py:class:`.Info.Filter` flags set.
+
+        Returns:
+            List[FilterInfo]: Matching filters.
+        """
+        cls._get_filters()
+        found = cls._by_ext.get(ext.lstrip(".").lower(), [])
+        return cls._filter(found, document_service, flags)
+
+    @classmethod
+    def find_by_mime(cls, mime_type: str, document_service: str = "", flags: int = 0) -> List[FilterInfo]:
+        """
+        Gets filters that handle a media type.
+
+        Args:
+            mime_type (str): Media type such as ``application/pdf``.
+            document_service (str, optional): Only include filters for this document service.
+            flags (int, optional): Only include filters that have all of these :py:class:`.Info.Filter` flags set.
+
+        Returns:
+            List[FilterInfo]: Matching filters.
+        """
+        cls._get_filters()
+        found = cls._by_mime.get(mime_type, [])
+        return cls._filter(found, document_service, flags)
+
+    @classmethod
+    def find_by_service(cls, document_service: str, flags: int = 0) -> List[FilterInfo]:
+        """
+        Gets filters for a document service.
+
+        Args:
+            document_service (str): Document service such as ``com.sun.star.sheet.SpreadsheetDocument``.
+            flags (int, optional): Only include filters that have all of these :py:class:`.Info.Filter` flags set.
+
+        Returns:
+            List[FilterInfo]: Matching filters.
+        """
+        cls._get_filters()
+        found = cls._by_service.get(document_service, [])
+        return cls._filter(found, "", flags)
+
+    @staticmethod
+    def _filter(found: List[FilterInfo], document_service: str, flags: int) -> List[FilterInfo]:
+        if not found:
+            return []
+        flags = int(flags)
+        return [
+            fi
+            for fi in found
+            if (not document_service or fi.document_service == document_service) and (fi.flags & flags) == flags
+        ]
+
+    @classmethod
+    def get_export_filter(cls, ext: str, document_service: str) -> str | None:
+        """
+        Gets the export filter name for a file extension and document service.
+
+        Result is cached, repeated calls are a single dictionary lookup.
+        When more than one filter matches, a filter with the ``PREFERRED`` or ``DEFAULT`` flag is chosen.
+
+        Args:
+            ext (str): File extension such as ``pdf`` or ``.pdf``.
+            document_service (str): Document service such as ``com.sun.star.text.TextDocument``.
+
+        Returns:
+            str | None: Filter name if found; Otherwise, ``None``.
+        """
+        key = (ext.lstrip(".").lower(), document_service)
+        try:
+            return cls._export_cache[key]
+        except KeyError:
+            pass
+        found = cls.find_by_ext(key[0], document_service, mInfo.Info.Filter.EXPORT)
+        result = None
+        if found:
+            preferred = mInfo.Info.Filter.PREFERRED | mInfo.Info.Filter.DEFAULT
+            found = sorted(found, key=lambda fi: (fi.flags & preferred) == 0)
+            result = found[0].name
+        if cls._filters is not None:
+            # do not cache a miss while office is not available.
+            cls._export_cache[key] = result
+        return result
+
+    @classmethod
+    def save(cls, fnm: PathOrStr) -> None:
+        """
+        Saves registry to a json file.
+
+        Property values that can not be written to json are not saved.
+
+        Args:
+            fnm (PathOrStr): File to save to.
+        """
+        cls._get_filters()
+        filters = {}
+        for name, props in cls._props.items():
+            vals = {}
+            for key, val in props.items():
+                if isinstance(val, tuple):
+                    val = list(val)
+                try:
+                    json.dumps(val)
+                except (TypeError, ValueError):
+                    continue
+                vals[key] = val
+            filters[name] = vals
+        data = {"version": _FILE_VERSION, "office": cls._get_office_version(), "filters": filters}
+        with open(Path(fnm), "w", encoding="utf-8") as f:
+            json.dump(data, f)
+
+    @classmethod
+    def load_file(cls, fnm: PathOrStr, check_version: bool = True) -> bool:
+        """
+        Loads registry from a file created by :py:meth:`~.FilterRegistry.save`.
+
+        Args:
+            fnm (PathOrStr): File to load.
+            check_version (bool, optional): If ``True`` file is ignored when it was saved by a different office version.
+                Requires office to be loaded. Defaults to ``True``.
+
+        Returns:
+            bool: ``True`` if registry was loaded from file; Otherwise, ``False``.
+        """
+        pth = Path(fnm)
+        if not pth.exists():
+            return False
+        try:
+            with open(pth, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version", None) != _FILE_VERSION:
+                return False
+            if check_version and data.get("office", "") != cls._get_office_version():
+                return False
+            props = {}
+            for name, vals in data["filters"].items():
+                props[name] = {key: tuple(val) if isinstance(val, list) else val for key, val in vals.items()}
+        except Exception:
+            return False
+        with cls._lock:
+            cls._build(props)
+        return True
+
+    @staticmethod
+    def _get_office_version() -> str:
+        try:
+            return str(mInfo.Info.version)
+        except Exception:
+            return ""
+
+
+def _on_connection_changed(source: Any, event: EventArgs) -> None:
+    # filters belong to the office instance they were read from.
+    FilterRegistry.clear()
+
+
+_Events().on(LoNamedEvent.BRIDGE_DISPOSED, _on_connection_changed)
+_Events().on(LoNamedEvent.OFFICE_LOADING, _on_connection_changed)
+_Events().on(LoNamedEvent.OFFICE_CLOSED, _on_connection_changed)
+
+__all__ = ("FilterInfo", "FilterRegistry")
@@ -0,0 +1,251 @@
+# coding: utf-8
+from __future__ import annotations
+import threading
+from typing import Any, Dict, List, NamedTuple, Sequence, Tuple, TYPE_CHECKING
+
+import uno
+from com.sun.star.sheet import XFunctionDescriptions
+
+from . import lo as mLo
+from ..events.args.event_args import EventArgs
+from ..events.event_singleton import _Events
+from ..events.lo_named_event import LoNamedEvent
+
+if TYPE_CHECKING:
+    from com.sun.star.beans import PropertyValue
+
+
+class FunctionArg(NamedTuple):
+    """
+    Calc function argument
+
+    .. versionadded:: 0.8.4
+    """
+
+    name: str
+    """Argument name"""
+    description: str
+    """Argument description"""
+    is_optional: bool
+    """``True`` if argument is optional"""
+
+
+class FunctionInfo(NamedTuple):
+    """
+    Calc function description
+
+    .. versionadded:: 0.8.4
+    """
+
+    index: int
+    """Index of function in ``com.sun.star.sheet.FunctionDescriptions``"""
+    id: int
+    """Function id"""
+    name: str
+    """Function name such as ``SUM``"""
+    description: str
+    """Function description"""
+    category: int
+    """Function category, see ``com.sun.star.sheet.FunctionCategory``"""
+    arguments: Tuple[FunctionArg, ...]
+    """Function arguments"""
+    props: Tuple[PropertyValue, ...]
+    """Function description properties as returned by office"""
+
+    @property
+    def min_args(self) -> int:
+        """Gets number of arguments that are not optional"""
+        return sum(1 for arg in self.arguments if not arg.is_optional)
+
+
+class FunctionCatalog:
+    """
+    Catalog of Calc functions.
+
+    All function descriptions are read from office once per connection and indexed by name and index,
+    making lookups constant time.
+
+    Catalog is cleared when office is loaded or closed, or the bridge is disposed.
+
+    .. versionadded:: 0.8.4
+    """
+
+    _lock = threading.Lock()
+    _infos: List[FunctionInfo] | None = None
+    _by_name: Dict[str, FunctionInfo] = {}
+    _by_upper_name: Dict[str, FunctionInfo] = {}
+    _names: Tuple[str, ...] = ()
+
+    @staticmethod
+    def _make_info(index: int, props: Sequence[PropertyValue]) -> FunctionInfo:
+        vals: Dict[str, Any] = {p.Name: p.Value for p in props}
+        fargs = vals.get("Arguments", None) or ()
+        args = tuple(
+            FunctionArg(name=str(fa.Name), description=str(fa.Description), is_optional=bool(fa.IsOptional))
+            for fa in fargs
+        )
+        return FunctionInfo(
+            index=index,
+            id=int(vals.get("Id", -1)),
+            name=str(vals.get("Name", "")),
+            description=str(vals.get("Description", "")),
+            category=int(vals.get("Category", 0)),
+            arguments=args,
+            props=tuple(props),
+        )
+
+    @classmethod
+    def load(cls) -> None:
+        """
+        Reads all function descriptions from office if not already loaded.
+
+        Raises:
+            Exception: If no function descriptions were found.
+        """
+        cls._load()
+
+    @classmethod
+    def _load(cls) -> List[FunctionInfo]:
+        # returns loaded infos, a local reference stays valid if catalog is cleared by another thread.
+        infos = cls._infos
+        if infos is not None:
+            return infos
+        with cls._lock:
+            infos = cls._infos
+            if infos is not None:
+                return infos
+            try:
+                func_desc = mLo.Lo.get_cached_service(
+                    XFunctionDescriptions, "com.sun.star.sheet.FunctionDescriptions", raise_err=True
+                )
+            except Exception as e:
+                raise Exception("No function descriptions were found") from e
+            infos = []
+            for i in range(func_desc.getCount()):
+                try:
+                    infos.append(cls._make_info(i, func_desc.getByIndex(i)))
+                except Exception:
+                    continue
+            by_name = {}
+            by_upper_name = {}
+            for info in infos:
+                # first function wins, same as a linear scan.
+                by_name.setdefault(info.name, info)
+                by_upper_name.setdefault(info.name.upper(), info)
+            cls._by_name = by_name
+            cls._by_upper_name = by_upper_name
+            cls._names = tuple(sorted(by_name.keys()))
+            cls._infos = infos
+        return infos
+
+    @classmethod
+    def clear(cls) -> None:
+        """
+        Clears catalog. Function descriptions are read again the next time they are needed.
+        """
+        with cls._lock:
+            cls._infos = None
+            cls._by_name = {}
+            cls._by_upper_name = {}
+            cls._names = ()
+
+    @classmethod
+    def is_loaded(cls) -> bool:
+        """
+        Gets if function descriptions have been read from office.
+
+        Returns:
+            bool: ``True`` if loaded; Otherwise, ``False``.
+        """
+        return cls._infos is not None
+
+    @classmethod
+    def get_names(cls) -> Tuple[str, ...]:
+        """
+        Gets sorted function names.
+
+        Returns:
+            Tuple[str, ...]: Function names.
+        """
+        cls.load()
+        return cls._names
+
+    @classmethod
+    def find(cls, name: str, case_sensitive: bool = True) -> FunctionInfo | None:
+        """
+        Gets a function by name.
+
+        Args:
+            name (str): Function name such as ``SUM``.
+            case_sensitive (bool, optional): If ``False`` name is matched ignoring case. Defaults to ``True``.
+
+        Returns:
+            FunctionInfo | None: Function if found; Otherwise, ``None``.
+        """
+        cls.load()
+        if case_sensitive:
+            return cls._by_name.get(name, None)
+        return cls._by_upper_name.get(name.upper(), None)
+
+    @classmethod
+    def get(cls, idx: int) -> FunctionInfo | None:
+        """
+        Gets a function by index.
+
+        Args:
+            idx (int): Index of function in ``com.sun.star.sheet.FunctionDescriptions``.
+
+        Raises:
+            IndexError: If ``idx`` is negative.
+
+        Returns:
+            FunctionInfo | None: Function if found; Otherwise, ``None``.
+        """
+        if idx < 0:
+            raise IndexError("Negative index in not allowed.")
+        infos = cls._load()
+        if idx < len(infos) and infos[idx].index == idx:
+            return infos[idx]
+        # an entry failed to load, indexes are shifted.
+        for info in infos:
+            if info.index == idx:
+                return info
+        return None
+
+    @classmethod
+    def validate_args(cls, name: str, args: Sequence[Any]) -> None:
+        """
+        Checks that a function is given at least its required number of arguments.
+
+        Catalog is loaded if it is not already loaded.
+
+        Args:
+            name (str): Function name, case is ignored.
+            args (Sequence[Any]): Arguments that will be passed to function.
+
+        Raises:
+            ValueError: If function is found in catalog and has too few arguments.
+
+        Note:
+            Catalog names are the names shown in office, which are localized when office does not use
+            English function names. Names that are not in catalog, such as English names in a localized office
+            or add-in names like ``com.sun.star.sheet.addin.Analysis.getEomonth``, are not checked
+            and are left for office to resolve.
+        """
+        info = cls.find(name, case_sensitive=False)
+        if info is None:
+            return
+        if len(args) < info.min_args:
+            raise ValueError(f"Function '{info.name}' requires at least {info.min_args} arguments, got {len(args)}")
+
+
+def _on_connection_changed(source: Any, event: EventArgs) -> None:
+    # function descriptions belong to the connection they were read from.
+    FunctionCatalog.clear()
+
+
+_Events().on(LoNamedEvent.BRIDGE_DISPOSED, _on_connection_changed)
+_Events().on(LoNamedEvent.OFFICE_LOADING, _on_connection_changed)
+_Events().on(LoNamedEvent.OFFICE_CLOSED, _on_connection_changed)
+
+__all__ = ("FunctionArg", "FunctionInfo", "FunctionCatalog")
@@ -37,6 +37,7 @@ from ooo.dyn.beans.the_introspection import theIntrospection
 
 from . import date_time_util as mDate
 from . import file_io as mFileIO
+from . import filter_registry as mFilterReg
 from . import lo as mLo
 from . import props as mProps
 from ..events.args.event_args import EventArgs
@@ -107,7 +108,7 @@ class Info(metaclass=StaticProperty):
         Returns:
             Tuple[FontDescriptor, ...]: Font Descriptors
         """
-        xtoolkit = mLo.Lo.create_instance_mcf(XToolkit, "com.sun.star.awt.Toolkit")
+        xtoolkit = mLo.Lo.get_cached_service(XToolkit, "com.sun.star.awt.Toolkit")
         device = xtoolkit.createScreenCompatibleDevice(0, 0)
         if device is None:
             mLo.Lo.print("Could not access graphical output device")
@@ -1757,12 +1758,11 @@ class Info(metaclass=StaticProperty):
 
         Returns:
             Tuple[str, ...]: Filter names
+
+        .. versionchanged:: 0.8.4
+            Filters are read from office once and cached in :py:class:`~.filter_registry.FilterRegistry`.
         """
-        na = mLo.Lo.create_instance_mcf(XNameAccess, "com.sun.star.document.FilterFactory")
-        if na is None:
-            mLo.Lo.print("No Filter factory found")
-            return ()
-        return na.getElementNames()
+        return mFilterReg.FilterRegistry.get_names()
 
     @staticmethod
     def get_filter_props(filter_nm: str) -> List[PropertyValue]:
@@ -1774,16 +1774,14 @@ class Info(metaclass=StaticProperty):
 
         Returns:
             List[PropertyValue]: List of PropertValue
+
+        .. versionchanged:: 0.8.4
+            Filters are read from office once and cached in :py:class:`~.filter_registry.FilterRegistry`.
         """
-        na = mLo.Lo.create_instance_mcf(XNameAccess, "com.sun.star.document.FilterFactory")
-        if na is None:
-            mLo.Lo.print("No Filter factory found")
-            return []
-        result = na.getByName(filter_nm)
-        if result is None:
+        result = mFilterReg.FilterRegistry.get_props(filter_nm)
+        if not result:
             mLo.Lo.print(f"No props for filter: {filter_nm}")
-            return []
-        return list(result)
+        return result
 
     @classmethod
     def is_import(cls, filter_flags: Info.Filter) -> bool:
@@ -7,7 +7,20 @@ from dataclasses import dataclass
 from datetime import datetime, timezone
 import time
 import types
-from typing import TYPE_CHECKING, Any, Iterable, Optional, List, Sequence, Tuple, cast, overload, Type
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    NamedTuple,
+    Optional,
+    List,
+    Sequence,
+    Tuple,
+    cast,
+    overload,
+    Type,
+)
 from urllib.parse import urlparse
 import uno
 from enum import IntEnum, Enum
@@ -24,6 +37,7 @@ from . import table_helper as mThelper
 from . import xml_util as mXML
 from ..conn import cache as mCache
 from ..conn import connectors
+from ..conn import office_standby as mStandby
 from ..conn.connect import ConnectBase, LoPipeStart, LoSocketStart, LoDirectStart
 from ..events.args.cancel_event_args import CancelEventArgs
 from ..events.args.dispatch_args import DispatchArgs
@@ -84,6 +98,21 @@ from ooo.dyn.util.close_veto_exception import CloseVetoException
 # """Path like object or string"""
 
 
+class QiStats(NamedTuple):
+    """
+    ``Lo.qi()`` counters
+
+    .. versionadded:: 0.8.4
+    """
+
+    calls: int
+    """Number of calls to ``Lo.qi()``"""
+    queries: int
+    """Number of ``queryInterface()`` calls made to office"""
+    cache_hits: int
+    """Number of results returned from ``Lo.QiCache``"""
+
+
 class Lo(metaclass=StaticProperty):
     @dataclass(frozen=True)
     class Options:
@@ -129,6 +158,50 @@ class Lo(metaclass=StaticProperty):
         def __exit__(self, exc_type, exc_val, exc_tb):
             Lo.unlock_controllers()
 
+    class QiCache:
+        """
+        Context manager that caches ``Lo.qi()`` results per object.
+
+        While the context is active querying the same object for the same interface more than once
+        only calls office the first time. Interfaces supported by an object do not change so this is safe
+        for any object that is alive.
+
+        Cached objects are held until the outermost context exits.
+
+        Example:
+
+            .. code::
+
+                with Lo.QiCache():
+                    for i in range(1000):
+                        idx = Calc.get_sheet_index(sheet)
+
+        .. versionadded:: 0.8.4
+        """
+
+        def __init__(self, max_size: int = 4096):
+            """
+            Constructor
+
+            Args:
+                max_size (int, optional): Maximum number of results cached.
+                    When reached the cache is cleared. Default ``4096``.
+            """
+            self._max_size = max_size
+            self._owner = False
+
+        def __enter__(self) -> Lo.QiCache:
+            if Lo._qi_obj_cache is None:
+                Lo._qi_obj_cache = {}
+                Lo._qi_obj_cache_max = self._max_size
+                self._owner = True
+            return self
+
+        def __exit__(self, exc_type, exc_val, exc_tb):
+            if self._owner:
+                Lo._qi_obj_cache = None
+                self._owner = False
+
     class Loader:
         """
         Context Manager for Loader
@@ -147,7 +220,7 @@ class Lo(metaclass=StaticProperty):
 
         def __init__(
             self,
-            connector: connectors.ConnectPipe | connectors.ConnectSocket | None,
+            connector: connectors.ConnectPipe | connectors.ConnectSocket | mStandby.OfficeStandby | None,
             cache_obj: mCache.Cache | None = None,
             opt: Lo.Options | None = None,
         ):
@@ -155,7 +228,7 @@ class Lo(metaclass=StaticProperty):
             Create a connection to office
 
             Args:
-                connector (connectors.ConnectPipe | connectors.ConnectSocket | None): Connection information. Ignore for macros.
+                connector (connectors.ConnectPipe | connectors.ConnectSocket | OfficeStandby | None): Connection information. Ignore for macros.
                 cache_obj (mCache.Cache | None, optional): Cache instance that determines if LibreOffice profile is to be copied and cached
                     Ignore for macros. Defaults to None.
                 opt (Options, optional): Extra Load options.
@@ -273,6 +346,17 @@ class Lo(metaclass=StaticProperty):
 
     _loader = None
 
+    _ext_formats: Dict[str, str | Dict[Lo.DocType, str]] | None = None
+
+    _service_cache: Dict[Tuple[str, type], Any] = {}
+
+    _qi_types: Dict[type, Any] = {}
+    _qi_obj_cache: Dict[Tuple[int, type], Tuple[Any, Any]] | None = None
+    _qi_obj_cache_max = 4096
+    _qi_calls = 0
+    _qi_queries = 0
+    _qi_cache_hits = 0
+
     # region    qi()
 
     @overload
@@ -357,14 +441,68 @@ class Lo(metaclass=StaticProperty):
                 srch = Lo.qi(XSearchable, cell_range)
                 sd = srch.createSearchDescriptor()
         """
+        Lo._qi_calls += 1
+        cache = Lo._qi_obj_cache
+        if cache is not None:
+            key = (id(obj), atype)
+            hit = cache.get(key, None)
+            # obj is held in cache so its id can not be reused while cached.
+            if hit is not None and hit[0] is obj:
+                Lo._qi_cache_hits += 1
+                result = hit[1]
+                if raise_err is True and result is None:
+                    raise mEx.MissingInterfaceError(atype)
+                return result
+
         result = None
-        if uno.isInterface(atype) and hasattr(obj, "queryInterface"):
+        uno_t = Lo._qi_types.get(atype, None)
+        if uno_t is None and uno.isInterface(atype):
             uno_t = uno.getTypeByName(atype.__pyunointerface__)
+            Lo._qi_types[atype] = uno_t
+        if uno_t is not None and hasattr(obj, "queryInterface"):
+            Lo._qi_queries += 1
             result = obj.queryInterface(uno_t)
+            if cache is not None:
+                if len(cache) >= Lo._qi_obj_cache_max:
+                    cache.clear()
+                cache[key] = (obj, result)
         if raise_err is True and result is None:
             raise mEx.MissingInterfaceError(atype)
         return result
 
+    @staticmethod
+    def get_qi_stats() -> QiStats:
+        """
+        Gets ``Lo.qi()`` counters.
+
+        Use with :py:meth:`~.Lo.reset_qi_stats` to measure the number of interface queries of an operation.
+
+        Returns:
+            QiStats: Counters since last reset.
+
+        Example:
+
+            .. code::
+
+                Lo.reset_qi_stats()
+                Calc.get_sheet_index(sheet)
+                print(Lo.get_qi_stats())
+
+        .. versionadded:: 0.8.4
+        """
+        return QiStats(calls=Lo._qi_calls, queries=Lo._qi_queries, cache_hits=Lo._qi_cache_hits)
+
+    @staticmethod
+    def reset_qi_stats() -> None:
+        """
+        Resets ``Lo.qi()`` counters to ``0``.
+
+        .. versionadded:: 0.8.4
+        """
+        Lo._qi_calls = 0
+        Lo._qi_queries = 0
+        Lo._qi_cache_hits = 0
+
     # endregion qi()
 
     @classmethod
@@ -583,6 +721,72 @@ class Lo(metaclass=StaticProperty):
 
     # endregion create_instance_mcf()
 
+    # region get_cached_service()
+    @overload
+    @classmethod
+    def get_cached_service(cls, atype: Type[T], service_name: str) -> T | None:
+        ...
+
+    @overload
+    @classmethod
+    def get_cached_service(cls, atype: Type[T], service_name: str, raise_err: Literal[True]) -> T:
+        ...
+
+    @overload
+    @classmethod
+    def get_cached_service(cls, atype: Type[T], service_name: str, raise_err: Literal[False]) -> T | None:
+        ...
+
+    @classmethod
+    def get_cached_service(cls, atype: Type[T], service_name: str, raise_err: bool = False) -> T | None:
+        """
+        Gets an instance of a service, creating it on first call.
+
+        The instance is kept for the current office connection and returned again by later calls.
+        Only use for services that do not keep state between calls, such as ``com.sun.star.sheet.FunctionAccess``
+        or ``com.sun.star.i18n.BreakIterator``.
+
+        Cached services are released when office is closed, loaded again or the bridge is disposed.
+
+        Args:
+            atype (Type[T]): Type of interface to return from service instance.
+            service_name (str): Service Name
+            raise_err (bool, optional): If ``True`` then can raise CreateInstanceMcfError or MissingInterfaceError. Default is ``False``
+
+        Raises:
+            CreateInstanceMcfError: If ``raise_err`` is ``True`` and no instance was created
+            MissingInterfaceError: If ``raise_err`` is ``True`` and instance was created but does not implement ``atype`` interface.
+            Exception: if unable to create instance for any other reason
+
+        Returns:
+            T | None: Instance of interface for the service name or possibly ``None`` if ``raise_err`` is False.
+
+        See Also:
+            :py:meth:`~.Lo.create_instance_mcf`
+
+        .. versionadded:: 0.8.4
+        """
+        key = (service_name, atype)
+        try:
+            return cls._service_cache[key]
+        except KeyError:
+            pass
+        obj = cls.create_instance_mcf(atype, service_name, raise_err=raise_err)
+        if obj is not None:
+            cls._service_cache[key] = obj
+        return obj
+
+    @classmethod
+    def clear_service_cache(cls) -> None:
+        """
+        Releases all services cached by :py:meth:`~.Lo.get_cached_service`.
+
+        .. versionadded:: 0.8.4
+        """
+        cls._service_cache.clear()
+
+    # endregion get_cached_service()
+
     # endregion interface object creation
 
     @classmethod
@@ -603,7 +807,7 @@ class Lo(metaclass=StaticProperty):
     @classmethod
     def load_office(
         cls,
-        connector: connectors.ConnectPipe | connectors.ConnectSocket | None = None,
+        connector: connectors.ConnectPipe | connectors.ConnectSocket | mStandby.OfficeStandby | None = None,
         cache_obj: mCache.Cache | None = None,
         opt: Options | None = None,
     ) -> XComponentLoader:
@@ -618,9 +822,10 @@ class Lo(metaclass=StaticProperty):
         ``using_pipes`` is ignored with running inside office.
 
         Args:
-            connector (connectors.ConnectPipe | connectors.ConnectSocket | None): Connection information. Ignore for macros.
+            connector (connectors.ConnectPipe | connectors.ConnectSocket | OfficeStandby | None): Connection information. Ignore for macros.
+                If an ``OfficeStandby`` is passed then an already started office instance is taken from it.
             cache_obj (Cache | None, optional): Cache instance that determines of LibreOffice profile is to be copied and cached
-                Ignore for macros. Defaults to None.
+                Ignore for macros. Ignored when ``connector`` is an ``OfficeStandby``. Defaults to None.
             opt (Options, optional): Extra Load options.
 
         Raises:
@@ -656,6 +861,10 @@ class Lo(metaclass=StaticProperty):
         .. versionchanged:: 0.6.10
 
                 Added ``opt`` parameter.
+
+        .. versionchanged:: 0.8.4
+
+                ``connector`` can be an :py:class:`~.conn.office_standby.OfficeStandby`.
         """
         if mock_g.DOCS_BUILDING:
             # some component call this method and are triggered during docs building.
@@ -715,6 +924,13 @@ class Lo(metaclass=StaticProperty):
                 Lo.print("Office context could not be created")
                 Lo.print(f"    {e}")
                 raise SystemExit(1)
+        elif isinstance(b_connector, mStandby.OfficeStandby):
+            try:
+                cls._lo_inst = b_connector.take()
+            except Exception as e:
+                Lo.print("Office context could not be created")
+                Lo.print(f"    {e}")
+                raise SystemExit(1)
         else:
             Lo.print("Invalid Connector type. Fatal Error.")
             raise SystemExit(1)
@@ -1571,105 +1787,84 @@ class Lo(metaclass=StaticProperty):
             This could be a lot more extensive.
 
             Use :py:meth:`Info.getFilterNames` to get the filter names for your Office.
+            Use :py:meth:`.FilterRegistry.get_export_filter` to look up the export filter of any extension
+            office supports.
 
         See Also:
             - :ref:`ch02_save_doc`
-        """
-        dtype = cls.DocType(doc_type)
-        s = ext.lower()
-        if s == "doc":
-            return "MS Word 97"
-        elif s == "docx":
-            return "Office Open XML Text"  # MS Word 2007 XML
-        elif s == "rtf":
-            if dtype == cls.DocType.CALC:
-                return "Rich Text Format (StarCalc)"
-            else:
-                return "Rich Text Format"
-        elif s == "odt":
-            return "writer8"
-        elif s == "ott":
-            return "writer8_template"
-        elif s == "pdf":
-            if dtype == cls.DocType.WRITER:
-                return "writer_pdf_Export"
-            elif dtype == cls.DocType.IMPRESS:
-                return "impress_pdf_Export"
-            elif dtype == cls.DocType.DRAW:
-                return "draw_pdf_Export"
-            elif dtype == cls.DocType.CALC:
-                return "calc_pdf_Export"
-            elif dtype == cls.DocType.MATH:
-                return "math_pdf_Export"
-            else:
-                return "writer_pdf_Export"  # assume we are saving a writer doc
-        elif s == "txt":
-            return "Text"
-        elif s == "ppt":
-            return "MS PowerPoint 97"
-        elif s == "pptx":
-            return "Impress MS PowerPoint 2007 XML"
-        elif s == "odp":
-            return "impress8"
-        elif s == "odg":
-            return "draw8"
-        elif s == "jpg":
-            if dtype == cls.DocType.IMPRESS:
-                return "impress_jpg_Export"
-            else:
-                return "draw_jpg_Export"
-        elif s == "png":
-            if dtype == cls.DocType.IMPRESS:
-                return "impress_png_Export"
-            else:
-                return "draw_png_Export"
-        elif s == "xls":
-            return "MS Excel 97"
-        elif s == "xlsx":
-            return "Calc MS Excel 2007 XML"
-        elif s == "csv":
-            return "Text - txt - csv (StarCalc)"  # "Text CSV"
-        elif s == "ods":
-            return "calc8"
-        elif s == "odb":
-            return "StarOffice XML (Base)"
-        elif s == "htm" or s == "html":
-            if dtype == cls.DocType.WRITER:
-                return "HTML (StarWriter)"
-            elif dtype == cls.DocType.IMPRESS:
-                return "impress_html_Export"
-            elif dtype == cls.DocType.DRAW:
-                return "draw_html_Export"
-            elif dtype == cls.DocType.CALC:
-                return "HTML (StarCalc)"
-            else:
-                return "HTML"
-        elif s == "xhtml":
-            if dtype == cls.DocType.WRITER:
-                return "XHTML Writer File"
-            elif dtype == cls.DocType.IMPRESS:
-                return "XHTML Impress File"
-            elif dtype == cls.DocType.DRAW:
-                return "XHTML Draw File"
-            elif dtype == cls.DocType.CALC:
-                return "XHTML Calc File"
-            else:
-                return "XHTML Writer File"
-        elif s == "xml":
-            if dtype == cls.DocType.WRITER:
-                return "OpenDocument Text Flat XML"
-            elif dtype == cls.DocType.IMPRESS:
-                return "OpenDocument Presentation Flat XML"
-            elif dtype == cls.DocType.DRAW:
-                return "OpenDocument Drawing Flat XML"
-            elif dtype == cls.DocType.CALC:
-                return "OpenDocument Spreadsheet Flat XML"
-            else:
-                return "OpenDocument Text Flat XML"
 
-        else:
+        .. versionchanged:: 0.8.4
+            Formats are looked up in a table instead of an ``if/elif`` chain.
+        """
+        formats = cls._ext_formats
+        if formats is None:
+            formats = cls._get_ext_formats()
+        entry = formats.get(ext.lower(), None)
+        if entry is None:
             Lo.print(f"Do not recognize extension '{ext}'; using text")
             return "Text"
+        if isinstance(entry, str):
+            return entry
+        return entry.get(cls.DocType(doc_type), entry[cls.DocType.UNKNOWN])
+
+    @classmethod
+    def _get_ext_formats(cls) -> Dict[str, str | Dict[Lo.DocType, str]]:
+        # lookup table for ext_to_format().
+        # When format depends on document type the value is a dict of DocType to format,
+        # DocType.UNKNOWN is the format for any document type not in dict.
+        dt = cls.DocType
+        pdf = {
+            dt.UNKNOWN: "writer_pdf_Export",  # assume we are saving a writer doc
+            dt.WRITER: "writer_pdf_Export",
+            dt.IMPRESS: "impress_pdf_Export",
+            dt.DRAW: "draw_pdf_Export",
+            dt.CALC: "calc_pdf_Export",
+            dt.MATH: "math_pdf_Export",
+        }
+        html = {
+            dt.UNKNOWN: "HTML",
+            dt.WRITER: "HTML (StarWriter)",
+            dt.IMPRESS: "impress_html_Export",
+            dt.DRAW: "draw_html_Export",
+            dt.CALC: "HTML (StarCalc)",
+        }
+        cls._ext_formats = {
+            "doc": "MS Word 97",
+            "docx": "Office Open XML Text",  # MS Word 2007 XML
+            "rtf": {dt.UNKNOWN: "Rich Text Format", dt.CALC: "Rich Text Format (StarCalc)"},
+            "odt": "writer8",
+            "ott": "writer8_template",
+            "pdf": pdf,
+            "txt": "Text",
+            "ppt": "MS PowerPoint 97",
+            "pptx": "Impress MS PowerPoint 2007 XML",
+            "odp": "impress8",
+            "odg": "draw8",
+            "jpg": {dt.UNKNOWN: "draw_jpg_Export", dt.IMPRESS: "impress_jpg_Export"},
+            "png": {dt.UNKNOWN: "draw_png_Export", dt.IMPRESS: "impress_png_Export"},
+            "xls": "MS Excel 97",
+            "xlsx": "Calc MS Excel 2007 XML",
+            "csv": "Text - txt - csv (StarCalc)",  # "Text CSV"
+            "ods": "calc8",
+            "odb": "StarOffice XML (Base)",
+            "htm": html,
+            "html": html,
+            "xhtml": {
+                dt.UNKNOWN: "XHTML Writer File",
+                dt.WRITER: "XHTML Writer File",
+                dt.IMPRESS: "XHTML Impress File",
+                dt.DRAW: "XHTML Draw File",
+                dt.CALC: "XHTML Calc File",
+            },
+            "xml": {
+                dt.UNKNOWN: "OpenDocument Text Flat XML",
+                dt.WRITER: "OpenDocument Text Flat XML",
+                dt.IMPRESS: "OpenDocument Presentation Flat XML",
+                dt.DRAW: "OpenDocument Drawing Flat XML",
+                dt.CALC: "OpenDocument Spreadsheet Flat XML",
+            },
+        }
+        return cls._ext_formats
 
     # region    store_doc_format()
 
@@ -2614,10 +2809,12 @@ class Lo(metaclass=StaticProperty):
         Note:
             .. include:: ../../resources/global/printing_note.rst
         """
-        cargs = CancelEventArgs(Lo.print.__qualname__)
-        _Events().trigger(GblNamedEvent.PRINTING, cargs)
-        if cargs.cancel:
-            return
+        events = _Events()
+        if events.has_listeners(GblNamedEvent.PRINTING):
+            cargs = CancelEventArgs(Lo.print.__qualname__)
+            events.trigger(GblNamedEvent.PRINTING, cargs)
+            if cargs.cancel:
+                return
         print(*args, **kwargs)
 
     @classproperty
@@ -2820,6 +3017,11 @@ class _LoManager(metaclass=StaticProperty):
         for attr, val in zip(dattrs, dvals):
             setattr(Lo, attr, val)
 
+    @staticmethod
+    def clear_services(source: Any, event: EventArgs) -> None:
+        # cached services belong to the connection they were created on.
+        Lo.clear_service_cache()
+
     @staticmethod
     def on_loading(source: Any, event: CancelEventArgs) -> None:
         try:
@@ -2854,6 +3056,9 @@ _Events().on(LoNamedEvent.RESET, _LoManager.del_cache_attrs)
 _Events().on(LoNamedEvent.OFFICE_LOADING, _LoManager.on_loading)
 _Events().on(LoNamedEvent.OFFICE_LOADED, _LoManager.on_loaded)
 _Events().on(LoNamedEvent.BRIDGE_DISPOSED, _LoManager.on_disposed)
+_Events().on(LoNamedEvent.BRIDGE_DISPOSED, _LoManager.clear_services)
+_Events().on(LoNamedEvent.OFFICE_LOADING, _LoManager.clear_services)
+_Events().on(LoNamedEvent.OFFICE_CLOSED, _LoManager.clear_services)
 
 
 __all__ = ("Lo",)
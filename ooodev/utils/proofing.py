@@ -0,0 +1,488 @@
+# coding: utf-8
+from __future__ import annotations
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Iterable, List, NamedTuple, Tuple
+
+import uno
+from com.sun.star.lang import Locale  # struct class
+from com.sun.star.linguistic2 import XProofreader
+from com.sun.star.linguistic2 import XSpellChecker
+from com.sun.star.text import XTextDocument
+
+from ..conn import cache as mCache
+from ..conn import connectors
+from ..conn import office_pool as mPool
+from ..office import write as mWrite
+from . import file_io as mFileIO
+from . import lo as mLo
+from .data_type.text_item import TextItemKind
+from .type_var import PathOrStr
+
+_WORD_RE = re.compile(r"\w+(?:['’]\w+)*")
+_NOT_FOUND = object()
+
+
+class SpellError(NamedTuple):
+    """
+    Word that is not spelled correctly
+
+    .. versionadded:: 0.8.4
+    """
+
+    paragraph: int
+    """Index of paragraph in document"""
+    offset: int
+    """Position of word in paragraph text"""
+    word: str
+    """Misspelled word"""
+    suggestions: Tuple[str, ...]
+    """Suggested spellings"""
+
+
+class GrammarError(NamedTuple):
+    """
+    Grammar error found by proofreader
+
+    .. versionadded:: 0.8.4
+    """
+
+    paragraph: int
+    """Index of paragraph in document"""
+    offset: int
+    """Position of error in paragraph text"""
+    length: int
+    """Length of error text"""
+    text: str
+    """Text of error"""
+    comment: str
+    """Short description of error"""
+    suggestions: Tuple[str, ...]
+    """Suggested changes"""
+    rule_id: str
+    """Proofreader rule identifier"""
+
+
+class ProofResult(NamedTuple):
+    """
+    Result of proofing a document
+
+    .. versionadded:: 0.8.4
+    """
+
+    src: str
+    """Document file, empty if document was not loaded from file"""
+    spelling: Tuple[SpellError, ...]
+    """Spelling errors"""
+    grammar: Tuple[GrammarError, ...]
+    """Grammar errors"""
+    paragraphs: int
+    """Number of paragraphs checked"""
+    words: int
+    """Number of words checked"""
+    seconds: float
+    """Time taken to proof document"""
+    error: str = ""
+    """Error message if document could not be proofed"""
+
+    @property
+    def ok(self) -> bool:
+        """Gets if document was proofed, regardless of errors found in document"""
+        return not self.error
+
+
+class ProofCache:
+    """
+    Thread safe least recently used cache of proofing results.
+
+    One cache can be shared by several :py:class:`~.proofing.Proofer` instances,
+    including instances that use different office connections.
+
+    .. versionadded:: 0.8.4
+    """
+
+    def __init__(self, maxsize: int = 100_000) -> None:
+        """
+        Constructor
+
+        Args:
+            maxsize (int, optional): Maximum number of entries. Defaults to ``100_000``.
+        """
+        self._maxsize = max(1, maxsize)
+        self._data: OrderedDict[Hashable, Any] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Gets a cached value.
+
+        Args:
+            key (Hashable): Key.
+            default (Any, optional): Returned when ``key`` is not cached. Defaults to ``None``.
+
+        Returns:
+            Any: Cached value or ``default``.
+        """
+        with self._lock:
+            try:
+                val = self._data[key]
+            except KeyError:
+                self._misses += 1
+                return default
+            self._data.move_to_end(key)
+            self._hits += 1
+            return val
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """
+        Caches a value, removing the least recently used entry when cache is full.
+
+        Args:
+            key (Hashable): Key.
+            value (Any): Value.
+        """
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self._maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """
+        Removes all entries and resets statistics.
+        """
+        with self._lock:
+            self._data.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    @property
+    def hits(self) -> int:
+        """Gets number of lookups that were found in cache"""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """Gets number of lookups that were not found in cache"""
+        return self._misses
+
+
+def _utf16_map(text: str) -> List[int] | None:
+    # maps office (utf-16) positions to python string positions, None when they are the same.
+    if text.isascii():
+        return None
+    result = []
+    for i, ch in enumerate(text):
+        result.append(i)
+        if ord(ch) > 0xFFFF:
+            result.append(i)
+    result.append(len(text))
+    return result
+
+
+class Proofer:
+    """
+    Checks spelling and grammar of text and documents.
+
+    Each distinct word is sent to the spell checker once, results are kept in a :py:class:`~.proofing.ProofCache`
+    keyed by word and locale. Grammar results are cached by paragraph text and locale, so repeated paragraphs
+    are only checked once.
+
+    Example:
+
+        .. code::
+
+            proofer = Proofer()
+            result = proofer.check_doc(doc)
+            for err in result.spelling:
+                print(err.word, err.suggestions)
+
+    .. versionadded:: 0.8.4
+    """
+
+    def __init__(
+        self,
+        speller: XSpellChecker | None = None,
+        proofreader: XProofreader | None = None,
+        loc: Locale | None = None,
+        cache: ProofCache | None = None,
+        spell: bool = True,
+        grammar: bool = True,
+    ) -> None:
+        """
+        Constructor
+
+        Args:
+            speller (XSpellChecker, optional): Spell checker. Defaults to :py:meth:`.Write.load_spell_checker`.
+            proofreader (XProofreader, optional): Proofreader. Defaults to :py:meth:`.Write.load_proofreader`.
+            loc (Locale, optional): Locale used to check text. Default ``Locale("en", "US", "")``
+            cache (ProofCache, optional): Cache of results. Defaults to a new cache.
+            spell (bool, optional): If ``True`` spelling is checked. Defaults to ``True``.
+            grammar (bool, optional): If ``True`` grammar is checked. Defaults to ``True``.
+
+        Raises:
+            CreateInstanceMcfError: If a spell checker or proofreader is needed and can not be created.
+        """
+        self._spell = spell
+        self._grammar = grammar
+        if spell and speller is None:
+            speller = mWrite.Write.load_spell_checker()
+        if grammar and proofreader is None:
+            proofreader = mWrite.Write.load_proofreader()
+        self._speller = speller
+        self._proofreader = proofreader
+        self._loc = Locale("en", "US", "") if loc is None else loc
+        self._loc_key = (self._loc.Language, self._loc.Country, self._loc.Variant)
+        self._cache = ProofCache() if cache is None else cache
+
+    @classmethod
+    def from_office(cls, office: mPool.PooledOffice, **kwargs: Any) -> Proofer:
+        """
+        Gets a proofer that uses the spell checker and proofreader of a pooled office instance.
+
+        Args:
+            office (PooledOffice): Office instance.
+            kwargs (Any): Other constructor arguments such as ``loc`` and ``cache``.
+
+        Returns:
+            Proofer: Proofer.
+        """
+        ctx = office.ctx
+        smgr = ctx.getServiceManager()
+        if kwargs.get("spell", True) and kwargs.get("speller", None) is None:
+            obj = smgr.createInstanceWithContext("com.sun.star.linguistic2.SpellChecker", ctx)
+            kwargs["speller"] = mLo.Lo.qi(XSpellChecker, obj, True)
+        if kwargs.get("grammar", True) and kwargs.get("proofreader", None) is None:
+            obj = smgr.createInstanceWithContext("com.sun.star.linguistic2.Proofreader", ctx)
+            kwargs["proofreader"] = mLo.Lo.qi(XProofreader, obj, True)
+        return cls(**kwargs)
+
+    def _spell_word(self, word: str) -> Tuple[str, ...] | None:
+        # None if word is correct; Otherwise, suggestions.
+        key = (word, self._loc_key)
+        result = self._cache.get(key, _NOT_FOUND)
+        if result is _NOT_FOUND:
+            alts = self._speller.spell(word, self._loc, ())
+            result = None if alts is None else tuple(alts.getAlternatives())
+            self._cache.put(key, result)
+        return result
+
+    def _proof_text(self, text: str) -> Tuple[Tuple[int, int, str, Tuple[str, ...], str], ...]:
+        key = ("\0grammar", text, self._loc_key)
+        result = self._cache.get(key, _NOT_FOUND)
+        if result is not _NOT_FOUND:
+            return result
+        pos_map = _utf16_map(text)
+        end = len(text) if pos_map is None else len(pos_map) - 1
+        errors = []
+        start = 0
+        # proofreader checks one sentence at a time and reports where the next sentence starts.
+        while start < end:
+            res = self._proofreader.doProofreading("1", text, self._loc, start, end, ())
+            if res is None:
+                break
+            for err in res.aErrors:
+                e_start = err.nErrorStart
+                e_end = err.nErrorStart + err.nErrorLength
+                if pos_map is not None:
+                    e_start = pos_map[min(e_start, end)]
+                    e_end = pos_map[min(e_end, end)]
+                errors.append(
+                    (
+                        e_start,
+                        e_end - e_start,
+                        str(err.aShortComment),
+                        tuple(err.aSuggestions),
+                        str(err.aRuleIdentifier),
+                    )
+                )
+            next_start = res.nBehindEndOfSentencePosition
+            if next_start <= start:
+                break
+            start = next_start
+        result = tuple(errors)
+        self._cache.put(key, result)
+        return result
+
+    def check_paragraph(self, text: str, paragraph: int = 0) -> Tuple[List[SpellError], List[GrammarError], int]:
+        """
+        Checks the text of a paragraph.
+
+        Args:
+            text (str): Paragraph text.
+            paragraph (int, optional): Paragraph index assigned to errors. Defaults to ``0``.
+
+        Returns:
+            Tuple[List[SpellError], List[GrammarError], int]: Spelling errors, grammar errors and number of words.
+        """
+        spelling = []
+        grammar = []
+        words = 0
+        if not text.strip():
+            return spelling, grammar, words
+        if self._spell:
+            for m in _WORD_RE.finditer(text):
+                word = m.group()
+                if any(c.isdigit() for c in word):
+                    continue
+                words += 1
+                suggestions = self._spell_word(word)
+                if suggestions is not None:
+                    spelling.append(SpellError(paragraph, m.start(), word, suggestions))
+        if self._grammar:
+            for offset, length, comment, suggestions, rule_id in self._proof_text(text):
+                grammar.append(
+                    GrammarError(
+                        paragraph=paragraph,
+                        offset=offset,
+                        length=length,
+                        text=text[offset : offset + length],
+                        comment=comment,
+                        suggestions=suggestions,
+                        rule_id=rule_id,
+                    )
+                )
+        return spelling, grammar, words
+
+    def check_doc(self, text_doc: XTextDocument, src: str = "") -> ProofResult:
+        """
+        Checks all paragraphs of a document.
+
+        Paragraphs are read one at a time with :py:meth:`.Write.iter_text_items`.
+        Text tables and frames are not checked.
+
+        Args:
+            text_doc (XTextDocument): Text Document.
+            src (str, optional): Document file recorded in result.
+
+        Returns:
+            ProofResult: Errors found in document.
+        """
+        start = time.perf_counter()
+        spelling: List[SpellError] = []
+        grammar: List[GrammarError] = []
+        words = 0
+        paragraphs = 0
+        for item in mWrite.Write.iter_text_items(text_doc, include_tables=False, include_frames=False):
+            if item.kind != TextItemKind.PARAGRAPH:
+                continue
+            s_errs, g_errs, count = self.check_paragraph(item.text, paragraphs)
+            spelling.extend(s_errs)
+            grammar.extend(g_errs)
+            words += count
+            paragraphs += 1
+        return ProofResult(
+            src=src,
+            spelling=tuple(spelling),
+            grammar=tuple(grammar),
+            paragraphs=paragraphs,
+            words=words,
+            seconds=time.perf_counter() - start,
+        )
+
+    @property
+    def cache(self) -> ProofCache:
+        """Gets cache of results"""
+        return self._cache
+
+
+def _proof_one(office: mPool.PooledOffice, proofer: Proofer, src: str) -> ProofResult:
+    with office.open_doc(src) as doc:
+        text_doc = mLo.Lo.qi(XTextDocument, doc, True)
+        return proofer.check_doc(text_doc, src)
+
+
+def proof_many(
+    inputs: Iterable[PathOrStr],
+    workers: int = 0,
+    *,
+    loc: Locale | None = None,
+    spell: bool = True,
+    grammar: bool = True,
+    cache: ProofCache | None = None,
+    connector: Callable[[int], connectors.ConnectPipe | connectors.ConnectSocket] | None = None,
+    cache_obj: mCache.Cache | None = None,
+    on_result: Callable[[ProofResult], None] | None = None,
+) -> List[ProofResult]:
+    """
+    Proofs many Writer documents using several office instances.
+
+    Each worker uses its own office instance of an :py:class:`~.conn.office_pool.OfficePool`
+    and its own spell checker and proofreader. All workers share one :py:class:`~.proofing.ProofCache`
+    so each distinct word of the whole corpus is only spell checked once.
+
+    Args:
+        inputs (Iterable[PathOrStr]): Documents to proof.
+        workers (int, optional): Number of office instances. Defaults to number of cpu's.
+        loc (Locale, optional): Locale used to check text. Default ``Locale("en", "US", "")``
+        spell (bool, optional): If ``True`` spelling is checked. Defaults to ``True``.
+        grammar (bool, optional): If ``True`` grammar is checked. Defaults to ``True``.
+        cache (ProofCache, optional): Cache of results. Defaults to a new cache.
+        connector (Callable[[int], ConnectPipe | ConnectSocket], optional): Gets connector for each office instance.
+            See :py:class:`~.conn.office_pool.OfficePool`.
+        cache_obj (Cache, optional): Profile cache for office instances.
+        on_result (Callable[[ProofResult], None], optional): Called with the result of each document as it completes.
+            Called from worker threads.
+
+    Raises:
+        Exception: Error raised by ``on_result``. No more documents are checked.
+
+    Returns:
+        List[ProofResult]: Result of each document in the order they completed.
+
+    Example:
+
+        .. code::
+
+            results = proof_many(Path("manuals").glob("*.odt"), workers=4)
+            for result in results:
+                print(result.src, len(result.spelling), len(result.grammar))
+
+    .. versionadded:: 0.8.4
+    """
+    shared_cache = ProofCache() if cache is None else cache
+    pool = mPool.OfficePool(size=workers, connector=connector, cache_obj=cache_obj)
+    lock = threading.Lock()
+    results: List[ProofResult] = []
+    # keyed by instance, a restarted instance is a new PooledOffice and gets new services.
+    # keys hold a reference to each instance so a key can never be reused by another instance.
+    proofers: Dict[mPool.PooledOffice, Proofer] = {}
+
+    def get_proofer(office: mPool.PooledOffice) -> Proofer:
+        # an instance is leased to one worker at a time, no lock needed.
+        proofer = proofers.get(office, None)
+        if proofer is None:
+            proofer = Proofer.from_office(office, loc=loc, cache=shared_cache, spell=spell, grammar=grammar)
+            proofers[office] = proofer
+        return proofer
+
+    def work(src: str) -> None:
+        start = time.perf_counter()
+        try:
+            with pool.lease() as office:
+                result = _proof_one(office, get_proofer(office), src)
+        except Exception as e:
+            result = ProofResult(src, (), (), 0, 0, time.perf_counter() - start, str(e))
+        with lock:
+            results.append(result)
+        # an error of on_result is raised by run_jobs() once workers stop.
+        if on_result is not None:
+            on_result(result)
+
+    pool.start()
+    try:
+        srcs = (str(mFileIO.FileIO.get_absolute_path(item)) for item in inputs)
+        mPool.run_jobs(pool, srcs, work, name="ooodev-proof")
+    finally:
+        pool.close()
+    return results
+
+
+__all__ = ("SpellError", "GrammarError", "ProofResult", "ProofCache", "Proofer", "proof_many")
@@ -4,12 +4,28 @@
 # See Also: https://fivedots.coe.psu.ac.th/~ad/jlop/
 # region Imports
 from __future__ import annotations
-from typing import Any, Iterable, Optional, Sequence, Tuple, TYPE_CHECKING, cast, overload
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    TYPE_CHECKING,
+    cast,
+    overload,
+)
 import uno
 
 from com.sun.star.beans import PropertyAttribute  # const
+from com.sun.star.beans import TolerantPropertySetResultType  # const
 from com.sun.star.beans import XPropertySet
 from com.sun.star.beans import XFastPropertySet
+from com.sun.star.beans import XMultiPropertySet
+from com.sun.star.beans import XTolerantMultiPropertySet
 from com.sun.star.container import XNameAccess
 from com.sun.star.document import XTypeDetection
 from com.sun.star.ui import ItemType  # const
@@ -21,7 +37,6 @@ from com.sun.star.container import XIndexAccess
 
 if TYPE_CHECKING:
     from com.sun.star.beans import Property, PropertyValue, XPropertySetInfo
-    from com.sun.star.beans import XMultiPropertySet
 
     # import module and not module content to avoid circular import issue.
     # https://stackoverflow.com/questions/22187279/python-circular-importing
@@ -32,6 +47,8 @@ from . import info as mInfo
 from . import gen_util as gUtil
 
 from ..exceptions import ex as mEx
+from ..events.event_singleton import _Events
+from ..events.lo_named_event import LoNamedEvent
 
 # endregion Imports
 
@@ -39,6 +56,9 @@ from ..exceptions import ex as mEx
 class Props:
     """make/get/set properties in an array"""
 
+    _prop_handles: Dict[str, Dict[str, int]] = {}
+    _writable_names: Dict[str, FrozenSet[str]] = {}
+
     # region ------------------- make properties -----------------------
     @staticmethod
     def make_prop_value(name: Optional[str] = None, value: Optional[str] = None) -> PropertyValue:
@@ -276,6 +296,131 @@ class Props:
 
     # endregion get_xproperty_fast_value()
 
+    # region    fast property handles
+    @classmethod
+    def get_prop_handles(cls, obj: object, impl_name: str = "") -> Dict[str, int]:
+        """
+        Gets property handles for the implementation of an object.
+
+        Handles are read from ``XPropertySetInfo.getProperties()`` once per implementation and cached.
+        The cache is cleared when the office bridge is disposed.
+
+        Args:
+            obj (object): Object that implements ``XPropertySet``.
+            impl_name (str, optional): Implementation name of ``obj``.
+                When omitted it is read from ``obj``, which is a call to office.
+
+        Raises:
+            PropertyGeneralError: If error occurs
+
+        Returns:
+            Dict[str, int]: Property handles keyed by property name.
+
+        Note:
+            When looping over many objects of the same type get ``impl_name`` once using
+            :py:meth:`.Info.get_implementation_name` and pass it for each object so no name lookups are made.
+
+        .. versionadded:: 0.8.4
+        """
+        if not impl_name:
+            try:
+                impl_name = mInfo.Info.get_implementation_name(obj)
+            except ValueError as e:
+                raise mEx.PropertyGeneralError("Error getting property handles") from e
+        handles = cls._prop_handles.get(impl_name, None)
+        if handles is None:
+            props = cls.get_property_set_info(obj).getProperties()
+            handles = {p.Name: p.Handle for p in props}
+            cls._prop_handles[impl_name] = handles
+        return handles
+
+    @classmethod
+    def get_fast(cls, obj: object, name: str, default: Any = gUtil.NULL_OBJ, impl_name: str = "") -> Any:
+        """
+        Gets a property value using ``XFastPropertySet`` and cached property handles.
+
+        Falls back to :py:meth:`~.Props.get` if ``obj`` does not support ``XFastPropertySet``
+        or the property has no handle.
+
+        Args:
+            obj (object): Object to get property from.
+            name (str): Property Name.
+            default (Any, optional): Return value if property value is ``None`` or property is not found.
+            impl_name (str, optional): Implementation name of ``obj``.
+                When omitted it is read from ``obj``, which is a call to office.
+
+        Raises:
+            PropertyNotFoundError: If Property is not found and default was not set.
+            PropertyError: If any other error occurs and default was not set.
+
+        Returns:
+            Any: Property value or default
+
+        See Also:
+            :py:meth:`~.Props.get_prop_handles`
+
+        .. versionadded:: 0.8.4
+        """
+        try:
+            handle = cls.get_prop_handles(obj, impl_name).get(name, -1)
+            if handle != -1:
+                fps = mLo.Lo.qi(XFastPropertySet, obj)
+                if fps is not None:
+                    val = fps.getFastPropertyValue(handle)
+                    if val is None and default is not gUtil.NULL_OBJ:
+                        return default
+                    return val
+        except Exception:
+            pass
+        return cls.get(obj, name, default)
+
+    @classmethod
+    def set_fast(cls, obj: object, name: str, value: Any, impl_name: str = "") -> None:
+        """
+        Sets a property value using ``XFastPropertySet`` and cached property handles.
+
+        Falls back to :py:meth:`~.Props.set` if ``obj`` does not support ``XFastPropertySet``,
+        the property has no handle or setting by handle fails.
+
+        Args:
+            obj (object): object to set property for.
+            name (str): Property Name.
+            value (Any): Property value.
+            impl_name (str, optional): Implementation name of ``obj``.
+                When omitted it is read from ``obj``, which is a call to office.
+
+        Raises:
+            MissingInterfaceError: if obj does not implement XPropertySet interface
+            MultiError: If unable to set property
+
+        See Also:
+            :py:meth:`~.Props.get_prop_handles`
+
+        .. versionadded:: 0.8.4
+        """
+        try:
+            handle = cls.get_prop_handles(obj, impl_name).get(name, -1)
+            if handle != -1:
+                fps = mLo.Lo.qi(XFastPropertySet, obj)
+                if fps is not None:
+                    fps.setFastPropertyValue(handle, value)
+                    return
+        except Exception:
+            pass
+        cls._set_by_names(obj, {name: value})
+
+    @classmethod
+    def clear_prop_handles(cls) -> None:
+        """
+        Clears cached property handles and writable property names.
+
+        .. versionadded:: 0.8.4
+        """
+        cls._prop_handles.clear()
+        cls._writable_names.clear()
+
+    # endregion fast property handles
+
     @classmethod
     def get_property_set_info(cls, obj: object) -> XPropertySetInfo:
         """
@@ -724,15 +869,117 @@ class Props:
         Note:
             If ``MultiError`` occurs only the properties that raised an error is part of the error object.
             The remaining properties will still be set.
+
+            Properties are set one at a time in the order they are passed.
+            To set many properties in a single call to office use :py:meth:`~.Props.set_many`.
         """
         if len(kwargs) == 0:
             return
+        cls._set_by_names(obj, kwargs)
+
+    @classmethod
+    def set_many(cls, obj: object, props: Mapping[str, Any], impl_name: str = "") -> None:
+        """
+        Set one or more properties using as few calls to office as possible.
+
+        Properties are set in one call using ``XTolerantMultiPropertySet`` or ``XMultiPropertySet`` when
+        ``obj`` supports them. Any property that fails is then set one at a time so the error is reported
+        the same as setting it alone.
+
+        Args:
+            obj (object): object to set properties for. Must support ``XPropertySet``
+            props (Mapping[str, Any]): Property names and values.
+            impl_name (str, optional): Implementation name of ``obj``. Used to cache the writable property names
+                when ``obj`` only supports ``XMultiPropertySet``. When omitted it is read from ``obj`` if needed.
+
+        Raises:
+            MissingInterfaceError: if obj does not implement XPropertySet interface
+            MultiError: If unable to set a property
+
+        Returns:
+            None:
+
+        Note:
+            If ``MultiError`` occurs only the properties that raised an error is part of the error object.
+            The remaining properties will still be set.
+
+            Properties set in a single call are set in name order.
+            When the order properties are set in matters use :py:meth:`~.Props.set`.
+
+        .. versionadded:: 0.8.4
+        """
+        if len(props) == 0:
+            return
+        if len(props) > 1:
+            names = sorted(props.keys())
+            retry = cls._set_multi(obj, names, [props[name] for name in names], impl_name)
+            if not retry:
+                return
+            props = {name: props[name] for name in retry}
+        cls._set_by_names(obj, props)
+
+    @classmethod
+    def _set_multi(cls, obj: object, names: Sequence[str], vals: Sequence[Any], impl_name: str) -> List[str]:
+        # sets properties in a single call.
+        # names must be sorted.
+        # returns the names that were not set and must be set one at a time.
+        tps = mLo.Lo.qi(XTolerantMultiPropertySet, obj)
+        if tps is not None:
+            try:
+                failed = tps.setPropertyValuesTolerant(tuple(names), tuple(vals))
+                return [f.Name for f in failed]
+            except Exception:
+                return list(names)
+
+        mps = mLo.Lo.qi(XMultiPropertySet, obj)
+        if mps is None:
+            return list(names)
+        # XMultiPropertySet.setPropertyValues() may silently ignore unknown and readonly properties.
+        # Only writable properties are set here, the others are set one at a time to get the proper error.
+        try:
+            writable = cls._get_writable_names(mps, impl_name)
+        except Exception:
+            return list(names)
+        batch_names = []
+        batch_vals = []
+        retry = []
+        for name, val in zip(names, vals):
+            if name in writable:
+                batch_names.append(name)
+                batch_vals.append(val)
+            else:
+                retry.append(name)
+        if batch_names:
+            try:
+                mps.setPropertyValues(tuple(batch_names), tuple(batch_vals))
+            except Exception:
+                return list(names)
+        return retry
+
+    @classmethod
+    def _get_writable_names(cls, mps: XMultiPropertySet, impl_name: str) -> FrozenSet[str]:
+        # writable property names are read once per implementation and cached.
+        if not impl_name:
+            impl_name = mInfo.Info.get_implementation_name(mps)
+        names = cls._writable_names.get(impl_name, None)
+        if names is None:
+            names = frozenset(
+                p.Name
+                for p in mps.getPropertySetInfo().getProperties()
+                if not p.Attributes & PropertyAttribute.READONLY
+            )
+            cls._writable_names[impl_name] = names
+        return names
+
+    @classmethod
+    def _set_by_names(cls, obj: object, props: Mapping[str, Any]) -> None:
+        # sets properties one at a time.
         if mInfo.Info.is_type_interface(obj, "com.sun.star.beans.XPropertySet"):
             ps = cast(XPropertySet, obj)
         else:
             ps = mLo.Lo.qi(XPropertySet, obj, True)
         errs = []
-        for key, value in kwargs.items():
+        for key, value in props.items():
             try:
                 ps.setPropertyValue(key, value)
             except AttributeError as e:
@@ -822,6 +1069,75 @@ class Props:
 
     # endregion get()
 
+    @classmethod
+    def get_many(cls, obj: object, names: Iterable[str], default: Any = gUtil.NULL_OBJ) -> Dict[str, Any]:
+        """
+        Gets many property values from an object using as few calls to office as possible.
+        ``obj`` must support ``XPropertySet`` interface
+
+        Values are read in one call using ``XTolerantMultiPropertySet`` or ``XMultiPropertySet`` when
+        ``obj`` supports them. Any property that fails is then read one at a time with :py:meth:`~.Props.get`.
+
+        Args:
+            obj (object): Object to get properties from.
+            names (Iterable[str]): Property Names.
+            default (Any, optional): Return value of any property that is ``None`` or not found.
+
+        Raises:
+            PropertyNotFoundError: If Property is not found and default was not set.
+            PropertyError: If any other error occurs and default was not set.
+
+        Returns:
+            Dict[str, Any]: Property values keyed by name, in the same order as ``names``.
+
+        .. versionadded:: 0.8.4
+        """
+        # remove duplicates, keep order
+        names = list(dict.fromkeys(names))
+        found: Dict[str, Any] = {}
+        if len(names) > 1:
+            found = cls._get_multi(obj, sorted(names))
+
+        result: Dict[str, Any] = {}
+        for name in names:
+            if name in found:
+                val = found[name]
+                if val is None and default is not gUtil.NULL_OBJ:
+                    val = default
+                result[name] = val
+            else:
+                result[name] = cls.get(obj, name, default)
+        return result
+
+    @staticmethod
+    def _get_multi(obj: object, names: Sequence[str]) -> Dict[str, Any]:
+        # gets property values in a single call.
+        # names must be sorted.
+        # returns the values that were read, names that are missing must be read one at a time.
+        result = {}
+        tps = mLo.Lo.qi(XTolerantMultiPropertySet, obj)
+        if tps is not None:
+            try:
+                for name, res in zip(names, tps.getPropertyValuesTolerant(tuple(names))):
+                    if res.Result == TolerantPropertySetResultType.SUCCESS:
+                        result[name] = res.Value
+            except Exception:
+                pass
+            return result
+
+        mps = mLo.Lo.qi(XMultiPropertySet, obj)
+        if mps is None:
+            return result
+        try:
+            # unknown properties may be returned as void (None),
+            # these are read one at a time to know if they exist.
+            for name, val in zip(names, mps.getPropertyValues(tuple(names))):
+                if val is not None:
+                    result[name] = val
+        except Exception:
+            pass
+        return result
+
     # region    get_property()
     @overload
     @classmethod
@@ -1402,3 +1718,12 @@ class Props:
         return tuple(names)
 
     # endregion ---------------- others --------------------------------
+
+
+def _on_bridge_disposed(source: Any, event: Any) -> None:
+    # handles belong to the office instance, a new office may have different handles
+    Props.clear_prop_handles()
+
+
+_Events().on(LoNamedEvent.BRIDGE_DISPOSED, _on_bridge_disposed)
+_Events().on(LoNamedEvent.OFFICE_LOADING, _on_bridge_disposed)
@@ -661,7 +661,7 @@ class Selection(metaclass=StaticProperty):
             # no need to pad. All characters will be counted including whitespaces
             st = text
 
-        brk = mLo.Lo.create_instance_mcf(XBreakIterator, "com.sun.star.i18n.BreakIterator")
+        brk = mLo.Lo.get_cached_service(XBreakIterator, "com.sun.star.i18n.BreakIterator")
         if brk is None:
             raise mEx.CreateInstanceMcfError(XBreakIterator, "com.sun.star.i18n.BreakIterator")
 
@@ -1,8 +1,9 @@
 # coding: utf-8
 """General Utilities"""
 from __future__ import annotations
+import re
 import sys
-import string
+from functools import lru_cache
 from typing import Callable, Iterable, Sequence, List, Any, Tuple, overload, TypeVar, NamedTuple
 
 from . import gen_util as gUtil
@@ -11,10 +12,79 @@ from .data_type.cell_values import CellValues as CellValues
 from .data_type import range_obj as mRo
 from .data_type import range_values as mRv
 from .type_var import DictTable, Table
-import string
 
 T = TypeVar("T")
 
+MAX_ROW = 1_048_576
+"""Default last row number of a sheet. Used for whole column references such as ``A:C``"""
+MAX_COL = 16_384
+"""Default last column number of a sheet (``XFD``). Used for whole row references such as ``2:5``"""
+
+# A1 notation, single pass.
+# Handles absolute refs ($Sheet1.$A$1), quoted sheet names ('My Sheet'.A1, quotes escaped as '')
+# and whole column or row references such as A:C or 2:5.
+# A sheet name may also be present on the end cell ($Sheet1.$A$1:$Sheet1.$C$3), it is ignored.
+_REG_A1 = re.compile(
+    r"^\s*"
+    r"(?:\$?(?:'(?P<qsheet>(?:[^']|'')+)'|(?P<sheet>[^.':$][^.':]*))\.)?"
+    r"\$?(?P<col1>[A-Za-z]+)?\$?(?P<row1>\d+)?"
+    r"(?P<end>:(?:\$?(?:'(?:[^']|'')+'|[^.':$][^.':]*)\.)?"
+    r"\$?(?P<col2>[A-Za-z]+)?\$?(?P<row2>\d+)?)?"
+    r"\s*$"
+)
+_REG_COL = re.compile(r"^\$?([A-Za-z]*)")
+_REG_ROW = re.compile(r"^\$?[A-Za-z]*\$?(-?\d+)$")
+
+
+@lru_cache(maxsize=16_384)
+def _col_name_to_num(name: str) -> int:
+    # name is upper case column letters, returns one based column number
+    col_num = 0
+    for letter in name:
+        col_num = col_num * 26 + (ord(letter) - 64)
+    return col_num
+
+
+@lru_cache(maxsize=16_384)
+def _col_num_to_name(col: int) -> str:
+    # col is one based column number
+    str_col = ""
+    div = col
+    while div:
+        (div, mod) = divmod(div - 1, 26)  # will return (x, 0 .. 25)
+        str_col = chr(mod + 65) + str_col
+    return str_col
+
+
+@lru_cache(maxsize=4_096)
+def _parse_a1(name: str) -> Tuple[str, str, int, str, int, bool]:
+    # returns (sheet, col_start, row_start, col_end, row_end, has_end)
+    # cells must have column and row. Only whole column (A:C) or whole row (2:5) ranges
+    # have a missing col, returned as empty str, or missing row, returned as 0.
+    m = _REG_A1.match(name)
+    if m is None:
+        raise ValueError(f"Unable to parse cell or range name: {name}")
+    col1, row1, col2, row2 = m.group("col1", "row1", "col2", "row2")
+    has_end = m.group("end") is not None
+    if has_end:
+        is_cells = bool(col1 and row1 and col2 and row2)
+        is_cols = bool(col1 and col2 and not (row1 or row2))
+        is_rows = bool(row1 and row2 and not (col1 or col2))
+        if not (is_cells or is_cols or is_rows):
+            raise ValueError(f"Unable to parse cell or range name: {name}")
+    elif not (col1 and row1):
+        raise ValueError(f"Unable to parse cell or range name: {name}")
+    qsheet = m.group("qsheet")
+    sheet = qsheet.replace("''", "'") if qsheet is not None else (m.group("sheet") or "")
+    return (
+        sheet,
+        col1.upper() if col1 else "",
+        int(row1) if row1 else 0,
+        col2.upper() if col2 else "",
+        int(row2) if row2 else 0,
+        has_end,
+    )
+
 
 class CellParts(NamedTuple):
     """Cell Named parts"""
@@ -41,7 +111,10 @@ class TableHelper:
         Gets cell parts from a cell name.
 
         Args:
-            cell_name (str): Cell name such as ``A23`` or ``Sheet1.A23``
+            cell_name (str): Cell name such as ``A23``, ``Sheet1.A23``, ``$Sheet1.$A$23`` or ``'My Sheet'.A23``
+
+        Raises:
+            ValueError: If ``cell_name`` can not be parsed.
 
         Returns:
             CellParts: Cell Parts
@@ -51,30 +124,38 @@ class TableHelper:
 
             Column name is upper case.
 
-        .. versionadded:: 0.8.3
-        """
-        doc_idx = cell_name.find(".")
-
-        if doc_idx >= 0:
-            sheet_name = cell_name[:doc_idx]
-            cell_name = cell_name[doc_idx + 1 :]
-        else:
-            sheet_name = ""
-        # split will cover if a range is passed in, return first cell
-        cells = cell_name.split(":")
+            Whole column or row names such as ``C:C`` or ``3:3`` are not cell names and raise ``ValueError``.
 
-        col = cells[0].rstrip(string.digits).upper()
-        row = cls.row_name_to_int(cells[0])
+        .. versionadded:: 0.8.3
 
-        return CellParts(sheet=sheet_name, col=col, row=row)
+        .. versionchanged:: 0.8.4
+            Added support for absolute names and quoted sheet names.
+        """
+        sheet, col, row, _, _, _ = _parse_a1(cell_name)
+        if not (col and row):
+            raise ValueError(f"Unable to parse cell name: {cell_name}")
+        return CellParts(sheet=sheet, col=col, row=row)
 
     @classmethod
-    def get_range_parts(cls, range_name: str) -> RangeParts:
+    def get_range_parts(
+        cls, range_name: str, allow_whole: bool = False, max_col: int = MAX_COL, max_row: int = MAX_ROW
+    ) -> RangeParts:
         """
         Gets range parts from a range name.
 
         Args:
-            range_name (str): Range name such as ``A23:G45`` or ``Sheet1.A23:G45``
+            range_name (str): Range name such as ``A23:G45``, ``Sheet1.A23:G45``, ``$Sheet1.$A$23:$G$45``
+                or ``'My Sheet'.A23:G45``.
+            allow_whole (bool, optional): If ``True`` whole column names such as ``A:C`` and whole row names
+                such as ``2:5`` are allowed. Default ``False``.
+            max_col (int, optional): Last column number of sheet, used to end whole row names.
+                Default :py:data:`MAX_COL`.
+            max_row (int, optional): Last row number of sheet, used to end whole column names.
+                Default :py:data:`MAX_ROW`.
+
+        Raises:
+            ValueError: If ``range_name`` can not be parsed.
+            ValueError: If ``range_name`` is a whole column or row name and ``allow_whole`` is ``False``.
 
         Returns:
             RangeParts: Range Parts
@@ -82,23 +163,34 @@ class TableHelper:
         Notes:
             Column names are upper case.
 
-        .. versionadded:: 0.8.2
-        """
-        doc_idx = range_name.find(".")
+            Whole column names such as ``A:C`` end on row ``max_row``.
+            Whole row names such as ``2:5`` end on column ``max_col``.
+            Sheet size depends on office version and settings, pass the size of the sheet when it is known.
 
-        if doc_idx >= 0:
-            sheet_name = range_name[:doc_idx]
-            range_name = range_name[doc_idx + 1 :]
-        else:
-            sheet_name = ""
+            A single cell name such as ``A23`` returns a range of one cell.
 
-        cells = range_name.split(":")
-        col_start = cells[0].rstrip(string.digits).upper()
-        col_end = cells[1].rstrip(string.digits).upper()
-        row_start = cls.row_name_to_int(cells[0])
-        row_end = cls.row_name_to_int(cells[1])
+        .. versionadded:: 0.8.2
 
-        return RangeParts(sheet=sheet_name, col_start=col_start, row_start=row_start, col_end=col_end, row_end=row_end)
+        .. versionchanged:: 0.8.4
+            Added support for absolute names, quoted sheet names and whole column or row names.
+        """
+        sheet, col_start, row_start, col_end, row_end, has_end = _parse_a1(range_name)
+        if not has_end:
+            col_end, row_end = col_start, row_start
+        elif not (col_start and row_start):
+            if not allow_whole:
+                raise ValueError(f"Whole column or row names are not allowed: {range_name}")
+            if col_start:
+                row_start, row_end = 1, max_row
+            else:
+                col_start, col_end = "A", _col_num_to_name(max_col)
+        return RangeParts(
+            sheet=sheet,
+            col_start=col_start,
+            row_start=row_start,
+            col_end=col_end,
+            row_end=row_end,
+        )
 
     @staticmethod
     def col_name_to_int(name: str, zero_index: bool = False) -> int:
@@ -123,12 +215,7 @@ class TableHelper:
         .. versionchanged:: 0.8.2
             Added ``zero_index`` parameter.
         """
-        chars = name.rstrip(string.digits)
-        pow = 1
-        col_num = 0
-        for letter in chars[::-1]:  # reverse chars
-            col_num += (int(letter, 36) - 9) * pow
-            pow *= 26
+        col_num = _col_name_to_num(_REG_COL.match(name.strip()).group(1).upper())
         if zero_index:
             return col_num - 1
         return col_num
@@ -161,12 +248,10 @@ class TableHelper:
         .. versionchanged:: 0.8.2
             Added ``zero_index`` parameter.
         """
-        chars = name.rstrip(string.digits + "-")
-        if chars:
-            s = name[len(chars) :]  # drop leading chars that are not numbers.
-        else:
-            s = name
-        result = int(s)
+        m = _REG_ROW.match(name.strip())
+        if m is None:
+            raise ValueError(f"Unable to parse row: {name}")
+        result = int(m.group(1))
         if result < 0:
             raise ValueError(f"Cannot parse negative values: {name}")
         if zero_index:
@@ -230,15 +315,93 @@ class TableHelper:
         idx_min = 0 if zero_index else 1
         if col < idx_min:
             raise ValueError(f"Value cannot be less then {idx_min}: {col}")
-        str_col = str()
         if zero_index:
-            div = col + 1
-        else:
-            div = col
-        while div:
-            (div, mod) = divmod(div - 1, 26)  # will return (x, 0 .. 25)
-            str_col = chr(mod + 65) + str_col
-        return str_col
+            return _col_num_to_name(col + 1)
+        return _col_num_to_name(col)
+
+    @classmethod
+    def get_cell_parts_list(cls, cell_names: Iterable[str]) -> List[CellParts]:
+        """
+        Gets cell parts for many cell names at once.
+
+        Args:
+            cell_names (Iterable[str]): Cell names such as ``A23`` or ``Sheet1.A23``
+
+        Raises:
+            ValueError: If any cell name can not be parsed.
+
+        Returns:
+            List[CellParts]: Cell Parts in the same order as ``cell_names``
+
+        See Also:
+            :py:meth:`~.TableHelper.get_cell_parts`
+
+        .. versionadded:: 0.8.4
+        """
+        get_parts = cls.get_cell_parts
+        return [get_parts(name) for name in cell_names]
+
+    @staticmethod
+    def get_cell_indexes(cell_names: Iterable[str], zero_index: bool = False) -> List[Tuple[int, int]]:
+        """
+        Converts many cell names into column and row numbers at once.
+
+        Args:
+            cell_names (Iterable[str]): Cell names such as ``A23`` or ``Sheet1.A23``
+            zero_index (bool, optional): determines if return is zero based or one based. Default ``False``.
+
+        Raises:
+            ValueError: If any cell name can not be parsed.
+
+        Returns:
+            List[Tuple[int, int]]: ``(col, row)`` for each cell name.
+
+        Example:
+            .. code-block:: python
+
+                >>> TableHelper.get_cell_indexes(["A1", "$C$5"], True)
+                [(0, 0), (2, 4)]
+
+        .. versionadded:: 0.8.4
+        """
+        offset = 1 if zero_index else 0
+        result = []
+        for name in cell_names:
+            _, col, row, _, _, _ = _parse_a1(name)
+            if not (col and row):
+                raise ValueError(f"Unable to parse cell name: {name}")
+            result.append((_col_name_to_num(col) - offset, row - offset))
+        return result
+
+    @staticmethod
+    def make_cell_names(cells: Iterable[Tuple[int, int]], zero_index: bool = False) -> List[str]:
+        """
+        Converts many ``(col, row)`` pairs into ``A1`` style cell names at once.
+
+        Args:
+            cells (Iterable[Tuple[int, int]]): ``(col, row)`` pairs.
+            zero_index (bool, optional): determines if ``cells`` are zero based or one based. Default ``False``.
+
+        Raises:
+            ValueError: If any col or row value is ``<1`` for one based or ``<0`` for zero based.
+
+        Returns:
+            List[str]: Cell names such as ``A1``, ``AB3``
+
+        See Also:
+            :py:meth:`~.TableHelper.make_cell_name`
+
+        .. versionadded:: 0.8.4
+        """
+        offset = 1 if zero_index else 0
+        result = []
+        for col, row in cells:
+            col += offset
+            row += offset
+            if col < 1 or row < 1:
+                raise ValueError(f"Value cannot be less then {1 - offset}: ({col - offset}, {row - offset})")
+            result.append(f"{_col_num_to_name(col)}{row}")
+        return result
 
     @overload
     @staticmethod
@@ -5,6 +5,7 @@ from pathlib import Path
 import shutil
 import tempfile
 from typing import List
+from unittest.mock import MagicMock, patch
 import pytest
 from tests.fixtures import __test__path__ as test_fixture_path
 from tests.fixtures.writer import __test__path__ as writer_fixture_path
@@ -17,6 +18,7 @@ from ooodev.utils import paths as mPaths
 
 # from ooodev.connect import connectors as mConnectors
 from ooodev.conn import cache as mCache
+from ooodev.conn.connect import LoPipeStart
 
 
 @pytest.fixture(scope="session")
@@ -216,3 +218,13 @@ def bond_movies_table(fix_writer_path) -> List[list]:
             results.append(row)
             line_count += 1
     return results
+
+
+@pytest.fixture(scope="function")
+def fake_office_start():
+    # office instances started by pools are not real, each gets a mock component context.
+    def fake_connect(self) -> None:
+        self._ctx = MagicMock()
+
+    with patch.object(LoPipeStart, "connect", fake_connect), patch.object(LoPipeStart, "kill_soffice"):
+        yield
@@ -0,0 +1,30 @@
+import asyncio
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+from ooodev.aio.aio_calc import AioCalc
+from ooodev.aio.aio_lo import AioLo
+from ooodev.office.calc import Calc
+from ooodev.utils.lo import Lo
+
+
+def test_aio_calc_array(loader) -> None:
+    async def main() -> tuple:
+        doc = await AioLo.run(Calc.create_doc, loader)
+        try:
+            sheet = await AioLo.run(Calc.get_sheet, doc, 0)
+            vals = [[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]]
+            await AioCalc.set_array(values=vals, sheet=sheet, name="A1")
+            await AioCalc.set_val(10.0, sheet, "A5")
+            arr = await AioCalc.get_array(sheet=sheet, range_name="A1:C2")
+            val = await AioCalc.get_val(sheet, "A5")
+            return arr, val
+        finally:
+            await AioLo.close_doc(doc)
+
+    arr, val = asyncio.run(main())
+    assert arr == ((1.0, 2.0, 3.0), (4.0, 5.0, 6.0))
+    assert val == 10.0
+    AioLo.get_executor().shutdown()
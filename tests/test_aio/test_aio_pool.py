@@ -0,0 +1,79 @@
+import asyncio
+from unittest.mock import patch
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+from ooodev.aio.aio_pool import AioOfficePool
+from ooodev.conn.cache import Cache
+from ooodev.conn.connect import LoPipeStart
+from ooodev.conn.office_pool import OfficePool
+
+
+def test_aio_pool_lease(fake_office_start) -> None:
+    active = set()
+    peak = 0
+
+    async def job(pool: AioOfficePool) -> int:
+        nonlocal peak
+        async with pool.lease() as office:
+            assert office.office.index not in active
+            active.add(office.office.index)
+            peak = max(peak, len(active))
+            result = await office.run(lambda: office.office.index)
+            await asyncio.sleep(0.01)
+            active.discard(office.office.index)
+            return result
+
+    async def main() -> list:
+        async with AioOfficePool(OfficePool(size=2, cache_obj=Cache(use_cache=False))) as pool:
+            return await asyncio.gather(*(job(pool) for _ in range(8)))
+
+    results = asyncio.run(main())
+    assert len(results) == 8
+    assert set(results) <= {0, 1}
+    assert peak == 2
+
+
+def test_aio_pool_restart_error(fake_office_start) -> None:
+    def fail(self) -> None:
+        raise ConnectionError("no office")
+
+    async def main() -> None:
+        async with AioOfficePool(OfficePool(size=1, cache_obj=Cache(use_cache=False))) as pool:
+            with patch.object(LoPipeStart, "connect", fail):
+                async with pool.lease() as office:
+                    office.office.conn.ctx.getServiceManager.side_effect = Exception("bridge gone")
+                # restart failed, the instance is still counted by the pool
+                with pytest.raises(ConnectionError):
+                    async with pool.lease():
+                        pass
+            async with pool.lease() as office:
+                assert await office.run(lambda: office.office.index) == 0
+
+    asyncio.run(asyncio.wait_for(main(), 10))
+
+
+def test_aio_pool_lease_waits_for_sync_user(fake_office_start) -> None:
+    async def main() -> None:
+        async with AioOfficePool(OfficePool(size=1, cache_obj=Cache(use_cache=False))) as pool:
+            # instance is taken by a sync user of the pool, lease waits for it instead of failing.
+            office = pool.pool.acquire()
+            loop = asyncio.get_running_loop()
+            loop.call_later(0.05, pool.pool.release, office)
+            async with pool.lease() as leased:
+                assert leased.office is office
+
+            # a cancelled lease returns the instance it acquired later on
+            office = pool.pool.acquire()
+            task = asyncio.ensure_future(pool.lease().__aenter__())
+            await asyncio.sleep(0.01)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+            pool.pool.release(office)
+            async with pool.lease() as leased:
+                assert leased.office is office
+
+    asyncio.run(asyncio.wait_for(main(), 10))
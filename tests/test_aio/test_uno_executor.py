@@ -0,0 +1,50 @@
+import asyncio
+import threading
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+from ooodev.aio.uno_executor import UnoExecutor
+
+
+def test_run_on_single_thread() -> None:
+    names = []
+
+    def work(i: int, offset: int = 0) -> int:
+        names.append(threading.current_thread().name)
+        return i + offset
+
+    async def main() -> list:
+        async with UnoExecutor(name="test-uno") as ex:
+            return await asyncio.gather(*(ex.run(work, i, offset=1) for i in range(10)))
+
+    results = asyncio.run(main())
+    assert results == list(range(1, 11))
+    assert len(set(names)) == 1
+    assert names[0].startswith("test-uno")
+    assert names[0] != threading.current_thread().name
+
+
+def test_event_loop_not_blocked() -> None:
+    started = threading.Event()
+    release = threading.Event()
+
+    def block() -> str:
+        started.set()
+        release.wait(5)
+        return "done"
+
+    async def main() -> str:
+        ex = UnoExecutor()
+        task = asyncio.ensure_future(ex.run(block))
+        # event loop keeps running while bridge call blocks.
+        while not started.is_set():
+            await asyncio.sleep(0.01)
+        assert not task.done()
+        release.set()
+        result = await task
+        ex.shutdown()
+        return result
+
+    assert asyncio.run(main()) == "done"
@@ -3062,6 +3062,34 @@ def test_find_all(loader) -> None:
         Lo.close(closeable=doc, deliver_ownership=False)
 
 
+def test_find_all_addresses(loader) -> None:
+    from ooodev.utils.lo import Lo
+    from ooodev.office.calc import Calc
+    from ooodev.utils.data_type.range_addr import RangeAddr
+    from com.sun.star.util import XSearchable
+
+    assert loader is not None
+    doc = Calc.create_doc(loader)
+    assert doc is not None
+    try:
+        sheet = Calc.get_sheet(doc=doc, index=0)
+        test_val = "test"
+        Calc.set_val(value=test_val, sheet=sheet, cell_name="A1")
+        Calc.set_val(value=test_val, sheet=sheet, cell_name="C3")
+        srch = Lo.qi(XSearchable, sheet)
+        sd = srch.createSearchDescriptor()
+        sd.setSearchString(test_val)
+        addrs = Calc.find_all_addresses(srch=srch, sd=sd)
+        assert addrs == [RangeAddr(0, 0, 0, 0), RangeAddr(2, 2, 2, 2)]
+        assert Calc.is_equal_addresses(addrs[1], Calc.get_address(sheet=sheet, range_name="C3:C3"))
+        assert Calc.get_range_str(cell_range=Calc.get_cell_range(sheet, addrs[1].to_uno())) == "C3:C3"
+
+        sd.setSearchString("hello")
+        assert Calc.find_all_addresses(srch=srch, sd=sd) == []
+    finally:
+        Lo.close(closeable=doc, deliver_ownership=False)
+
+
 # endregion search
 
 # region    cell decoration
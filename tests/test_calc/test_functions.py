@@ -305,3 +305,70 @@ def _test_funcs(loader) -> None:
     result = Calc.call_fun("TRANSPOSE", arr)
 
     assert result is not None
+
+
+def test_function_catalog(loader) -> None:
+    from ooodev.utils.function_catalog import FunctionCatalog
+
+    FunctionCatalog.clear()
+    names = Calc.get_function_names()
+    assert FunctionCatalog.is_loaded()
+    assert "SUM" in names
+    assert names == sorted(names)
+
+    info = FunctionCatalog.find("SUM")
+    assert info is not None
+    assert FunctionCatalog.find("sum", case_sensitive=False) is info
+    assert FunctionCatalog.get(info.index) is info
+    assert len(info.arguments) > 0
+    assert info.min_args >= 1
+    assert Calc.find_function("SUM") == info.props
+    assert Calc.find_function(info.index) == info.props
+    assert Calc.find_function("NOT_A_FUNCTION") is None
+
+    with pytest.raises(ValueError):
+        FunctionCatalog.validate_args("SUM", ())
+    FunctionCatalog.validate_args("SUM", (1, 2))
+    # names not in catalog are left for office
+    FunctionCatalog.validate_args("com.sun.star.sheet.addin.Analysis.getEomonth", ())
+    # too few arguments are rejected before calling office
+    assert Calc.call_fun("SUM", validate=True) is None
+    assert Calc.call_fun("SUM", 1, 2, validate=True) == 3.0
+    assert Calc.call_fun("SUM", 1, 2) == 3.0
+
+    # validation does not depend on catalog being loaded
+    FunctionCatalog.clear()
+    assert Calc.call_fun("SUM", validate=True) is None
+    assert FunctionCatalog.is_loaded()
+
+
+def test_call_fun_batch(loader) -> None:
+    params = [(1, 2), (3, 4, 5), (10,)]
+
+    # without doc each set is evaluated with function access
+    assert Calc.call_fun_batch("SUM", params) == [3.0, 12.0, 10.0]
+
+    doc = Calc.create_doc(loader)
+    try:
+        sheet_count = len(doc.getSheets().getElementNames())
+        assert Calc.call_fun_batch("sum", params, doc) == [3.0, 12.0, 10.0]
+        # error results are None
+        assert Calc.call_fun_batch("SQRT", [(4,), (-1,)], doc) == [2.0, None]
+        # temporary sheet is removed
+        assert len(doc.getSheets().getElementNames()) == sheet_count
+
+        # sets with text are evaluated the same as call_fun(), results keep the order of sets
+        mixed = [(1, 2), ("5", 1), (3,), ("abc",)]
+        assert Calc.call_fun_batch("SUM", mixed, doc) == [Calc.call_fun("SUM", *a) for a in mixed]
+        assert Calc.call_fun_batch("LEN", [("abc",), (12345,)], doc) == [3.0, 5.0]
+
+        arr = Calc.call_fun_batch("MAX", params, doc, True)
+        assert arr.tolist() == [2.0, 5.0, 10.0]
+        assert Calc.call_fun_batch("SUM", [], doc) == []
+        assert Calc.call_fun_batch("SUM", [], doc, True).shape == (0,)
+        # array results are masked
+        arr = Calc.call_fun_batch("TRANSPOSE", [(((1.0, 2.0),),)], None, True)
+        assert arr.shape == (1,)
+        assert arr.mask.tolist() == [True]
+    finally:
+        Lo.close_doc(doc)
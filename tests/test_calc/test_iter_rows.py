@@ -0,0 +1,41 @@
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+from ooodev.utils.lo import Lo
+from ooodev.office.calc import Calc
+from ooodev.utils.table_helper import TableHelper
+
+
+def test_iter_rows(loader) -> None:
+    num_rows = 105
+    num_cols = 4
+    doc = Calc.create_doc(loader)
+    assert doc is not None
+    try:
+        sheet = Calc.get_sheet(doc=doc, index=0)
+        vals = TableHelper.make_2d_array(num_rows=num_rows, num_cols=num_cols, val=lambda r, c, p: float(r * c))
+        Calc.set_array(values=vals, sheet=sheet, name="B3")
+
+        rows = list(Calc.iter_rows(sheet, chunk_rows=10))
+        assert len(rows) == num_rows
+        for i, row in enumerate(rows):
+            assert list(row) == vals[i]
+
+        rows = list(Calc.iter_rows(sheet, chunk_rows=1_000, prefetch=True))
+        assert len(rows) == num_rows
+
+        rows = list(Calc.iter_rows(sheet=sheet, chunk_rows=7, prefetch=True))
+        assert len(rows) == num_rows
+        assert list(rows[-1]) == vals[-1]
+
+        addr = Calc.get_address(sheet=sheet, range_name="B3:C12")
+        rows = list(Calc.iter_rows(sheet, chunk_rows=3, cr_addr=addr))
+        assert len(rows) == 10
+        assert len(rows[0]) == 2
+
+        with pytest.raises(ValueError):
+            next(Calc.iter_rows(sheet, chunk_rows=0))
+    finally:
+        Lo.close(closeable=doc, deliver_ownership=False)
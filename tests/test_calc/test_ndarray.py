@@ -0,0 +1,90 @@
+import os
+import time
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+np = pytest.importorskip("numpy")
+
+from ooodev.utils.lo import Lo
+from ooodev.office.calc import Calc
+from ooodev.utils.table_helper import TableHelper
+
+
+def test_get_ndarray(loader) -> None:
+    doc = Calc.create_doc(loader)
+    assert doc is not None
+    try:
+        sheet = Calc.get_sheet(doc=doc, index=0)
+        vals = [[1.0, 2.0, "a"], [4.0, "", 6.0], [7.0, 8.0, 9.0]]
+        Calc.set_array(values=vals, sheet=sheet, name="A1")
+
+        arr = Calc.get_ndarray(sheet, "A1:C3")
+        assert arr.shape == (3, 3)
+        assert arr.dtype == np.float64
+        assert arr.mask[0][2]
+        assert arr.mask[1][1]
+        assert not arr.mask[0][0]
+        assert arr[2][2] == 9.0
+        assert arr.sum() == 37.0
+
+        cols = Calc.get_ndarray_cols(sheet, "A1:C3")
+        assert len(cols) == 3
+        assert cols[0].tolist() == [1.0, 4.0, 7.0]
+        assert cols[1].mask.tolist() == [False, True, False]
+        assert cols[2].tolist() == [None, 6.0, 9.0]
+
+        cell_range = Calc.get_cell_range(sheet, "A3:C3")
+        arr = Calc.get_ndarray(cell_range)
+        assert arr.shape == (1, 3)
+    finally:
+        Lo.close(closeable=doc, deliver_ownership=False)
+
+
+def test_get_ndarray_large(loader) -> None:
+    # get_ndarray() must match get_float_array() for a large range
+    num_rows = 20_000
+    num_cols = 10
+    doc = Calc.create_doc(loader)
+    assert doc is not None
+    try:
+        sheet = Calc.get_sheet(doc=doc, index=0)
+        vals = TableHelper.make_2d_array(num_rows=num_rows, num_cols=num_cols, val=lambda r, c, p: float(r + c))
+        Calc.set_array(values=vals, sheet=sheet, name="A1")
+        rng = Calc.find_used_range(sheet)
+
+        floats = Calc.get_float_array(rng)
+        arr = Calc.get_ndarray(rng)
+        assert arr.shape == (num_rows, num_cols)
+        assert arr.tolist() == floats
+    finally:
+        Lo.close(closeable=doc, deliver_ownership=False)
+
+
+# benchmark, run with:
+#  OOODEV_BENCHMARK="1" pytest -s tests/test_calc/test_ndarray.py
+@pytest.mark.skipif(os.environ.get("OOODEV_BENCHMARK", "0") != "1", reason="benchmark, set OOODEV_BENCHMARK=1 to run")
+def test_get_ndarray_benchmark(loader) -> None:
+    # compares get_ndarray() with get_float_array()
+    num_rows = 20_000
+    num_cols = 10
+    doc = Calc.create_doc(loader)
+    assert doc is not None
+    try:
+        sheet = Calc.get_sheet(doc=doc, index=0)
+        vals = TableHelper.make_2d_array(num_rows=num_rows, num_cols=num_cols, val=lambda r, c, p: float(r + c))
+        Calc.set_array(values=vals, sheet=sheet, name="A1")
+        rng = Calc.find_used_range(sheet)
+
+        start = time.perf_counter()
+        Calc.get_float_array(rng)
+        float_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        Calc.get_ndarray(rng)
+        nd_time = time.perf_counter() - start
+
+        print(f"get_float_array: {float_time:.4f}s, get_ndarray: {nd_time:.4f}s")
+    finally:
+        Lo.close(closeable=doc, deliver_ownership=False)
@@ -0,0 +1,43 @@
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+from ooodev.utils.lo import Lo
+from ooodev.office.calc import Calc
+
+
+def test_write_rows(loader) -> None:
+    num_rows = 1_005
+    doc = Calc.create_doc(loader)
+    assert doc is not None
+    try:
+        sheet = Calc.get_sheet(doc=doc, index=0)
+
+        def gen_rows():
+            for i in range(num_rows):
+                yield (float(i), float(i * 2), f"Item {i}")
+
+        count = Calc.write_rows(sheet, "B2", gen_rows(), chunk_rows=100)
+        assert count == num_rows
+        assert Lo.has_controllers_locked() is False
+
+        rng = Calc.find_used_range(sheet)
+        addr = Calc.get_address(cell_range=rng)
+        assert addr.StartColumn == 1
+        assert addr.StartRow == 1
+        assert addr.EndColumn == 3
+        assert addr.EndRow == num_rows
+
+        arr = Calc.get_array(rng)
+        assert arr[0] == (0.0, 0.0, "Item 0")
+        assert arr[-1] == (float(num_rows - 1), float((num_rows - 1) * 2), f"Item {num_rows - 1}")
+
+        count = Calc.write_rows(sheet, "A1", iter([]))
+        assert count == 0
+
+        with pytest.raises(ValueError):
+            Calc.write_rows(sheet, "H1", [[1, 2], [1, 2, 3]])
+        assert Lo.has_controllers_locked() is False
+    finally:
+        Lo.close(closeable=doc, deliver_ownership=False)
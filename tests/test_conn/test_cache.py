@@ -1,4 +1,6 @@
 from unittest.mock import patch
+import os
+import shutil
 from pathlib import Path
 import pytest
 
@@ -62,4 +64,82 @@ def test_copy_profile(tmp_path_fn:Path, fixture_path:Path) -> None:
     assert tmp_path2.is_file()
     
     c.del_working_dir()
-    assert working_dir.exists() == False
\ No newline at end of file
+    assert working_dir.exists() == False
+
+def test_copy_profile_hardlink(tmp_path_fn: Path, fixture_path: Path) -> None:
+    src = Path(tmp_path_fn, "src")
+    Path(src, "4/user/fonts").mkdir(parents=True)
+    Path(src, "4/user/data.txt").write_text("data")
+    Path(src, "4/user/fonts/font.ttf").write_text("font")
+    Path(src, "4/user/registrymodifications.xcu").write_text("<xcu/>")
+    working_dir = Path(tmp_path_fn, "LO1")
+    working_dir.mkdir()
+    c = Cache(working_dir=working_dir, cache_path=Path(tmp_path_fn, "cache"))
+    # no cache yet, profile dir is created empty.
+    c.copy_cache_to_profile()
+    assert c._profile_cached is False
+    shutil.rmtree(c.user_profile)
+    shutil.copytree(src, c.user_profile)
+    c.cache_profile()
+    assert Path(c.cache_path, ".ooodev_manifest.json").exists()
+    assert c.is_cache_valid()
+
+    working_dir2 = Path(tmp_path_fn, "LO2")
+    working_dir2.mkdir()
+    c2 = Cache(working_dir=working_dir2, cache_path=c.cache_path, link_mode="hardlink")
+    assert c2.link_mode == Cache.LinkModeKind.HARDLINK
+    c2.copy_cache_to_profile()
+    assert c2._profile_cached is True
+    data = Path(c2.user_profile, "4/user/data.txt")
+    xcu = Path(c2.user_profile, "4/user/registrymodifications.xcu")
+    font = Path(c2.user_profile, "4/user/fonts/font.ttf")
+    assert data.read_text() == "data"
+    assert xcu.read_text() == "<xcu/>"
+    assert font.read_text() == "font"
+    assert not Path(c2.user_profile, ".ooodev_manifest.json").exists()
+    # only files in HARDLINK_PATTERNS are hard linked.
+    assert not os.path.samefile(xcu, Path(c.cache_path, "4/user/registrymodifications.xcu"))
+    assert not os.path.samefile(data, Path(c.cache_path, "4/user/data.txt"))
+    assert os.path.samefile(font, Path(c.cache_path, "4/user/fonts/font.ttf"))
+    stats = c2.copy_stats
+    assert stats.linked + stats.copied == 3
+    assert stats.seconds >= 0.0
+
+    working_dir3 = Path(tmp_path_fn, "LO3")
+    working_dir3.mkdir()
+    c3 = Cache(working_dir=working_dir3, cache_path=c.cache_path)
+    c3.copy_cache_to_profile()
+    assert not os.path.samefile(Path(c3.user_profile, "4/user/fonts/font.ttf"), font)
+    assert c3.copy_stats.copied == 3
+    assert c3.copy_stats.linked == 0
+
+
+def test_copy_profile_invalid_manifest(tmp_path_fn: Path) -> None:
+    working_dir = Path(tmp_path_fn, "LO1")
+    working_dir.mkdir()
+    c = Cache(working_dir=working_dir, cache_path=Path(tmp_path_fn, "cache"), validate_hash=True)
+    c.copy_cache_to_profile()
+    Path(c.user_profile, "data.txt").write_text("data")
+    c.cache_profile()
+    assert c.is_cache_valid()
+
+    Path(c.cache_path, "data.txt").write_text("changed")
+    assert c.is_cache_valid() is False
+
+    working_dir2 = Path(tmp_path_fn, "LO2")
+    working_dir2.mkdir()
+    c2 = Cache(working_dir=working_dir2, cache_path=c.cache_path)
+    c2.copy_cache_to_profile()
+    # invalid cache is discarded and recreated by cache_profile()
+    assert c2._profile_cached is False
+    assert c.cache_path.exists() is False
+
+
+def test_cache_clone(tmp_path_fn: Path) -> None:
+    c = Cache(use_cache=False, link_mode=Cache.LinkModeKind.HARDLINK, validate_hash=True, cache_path=tmp_path_fn)
+    c2 = c.clone()
+    assert c2 is not c
+    assert c2.use_cache is False
+    assert c2.link_mode == Cache.LinkModeKind.HARDLINK
+    assert c2.cache_path == c.cache_path
+    assert c2.working_dir != c.working_dir
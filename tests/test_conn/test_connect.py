@@ -0,0 +1,61 @@
+from unittest.mock import MagicMock, patch
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+from com.sun.star.connection import NoConnectException
+from ooodev.conn.cache import Cache
+from ooodev.conn.connect import LoPipeStart
+
+
+def test_connect_backoff() -> None:
+    conn = LoPipeStart(cache_obj=Cache(use_cache=False))
+    conn._timeout = 5.0
+    calls = []
+
+    def try_bridge() -> None:
+        calls.append(1)
+        if len(calls) < 3:
+            raise NoConnectException("not ready", None)
+        conn._ctx = MagicMock()
+
+    with patch.object(conn, "_try_bridge", try_bridge), patch.object(conn, "_probe_ready", return_value=None):
+        conn._connect()
+    assert conn.ctx is not None
+    timings = conn.connect_timings
+    assert timings.attempts == 3
+    assert timings.wait_ready > 0.0
+
+
+def test_connect_probe_skips_bridge() -> None:
+    conn = LoPipeStart(cache_obj=Cache(use_cache=False))
+    conn._timeout = 5.0
+    probes = iter([False, False, True])
+    calls = []
+
+    def try_bridge() -> None:
+        calls.append(1)
+        conn._ctx = MagicMock()
+
+    with patch.object(conn, "_try_bridge", try_bridge), patch.object(conn, "_probe_ready", lambda: next(probes)):
+        conn._connect()
+    # bridge is not attempted until probe reports office is ready
+    assert len(calls) == 1
+
+
+def test_connect_process_exited() -> None:
+    conn = LoPipeStart(cache_obj=Cache(use_cache=False))
+    conn._timeout = 30.0
+    conn._soffice_process = MagicMock()
+    conn._soffice_process.poll.return_value = 1
+
+    def try_bridge() -> None:
+        raise NoConnectException("not ready", None)
+
+    with patch.object(conn, "_try_bridge", try_bridge), patch.object(conn, "_probe_ready", return_value=None):
+        with pytest.raises(NoConnectException):
+            conn._connect()
+    # fails on first attempt rather than waiting for timeout
+    assert conn.connect_timings.attempts == 1
+    assert conn.connect_timings.wait_ready < 5.0
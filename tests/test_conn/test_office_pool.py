@@ -0,0 +1,128 @@
+from unittest.mock import patch
+from pathlib import Path
+import threading
+import time
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+from ooodev.conn.cache import Cache
+from ooodev.conn.connect import LoPipeStart
+from ooodev.conn.office_pool import OfficePool
+
+
+def test_office_pool_lease(fake_office_start) -> None:
+    with OfficePool(size=3, cache_obj=Cache(use_cache=False)) as pool:
+        assert len(pool.offices) == 3
+        pipes = {o.conn.connector.pipe for o in pool.offices}
+        assert len(pipes) == 3
+
+        with pool.lease() as o1:
+            with pool.lease() as o2:
+                assert o1 is not o2
+                conn = o1.make_connector()
+                assert conn.pipe == o1.conn.connector.pipe
+                assert conn.start_office is False
+
+        leased = [pool.acquire(), pool.acquire(), pool.acquire()]
+        with pytest.raises(TimeoutError):
+            pool.acquire(timeout=0.01)
+        for o in leased:
+            pool.release(o)
+    assert pool.offices == []
+
+
+def test_office_pool_restart(fake_office_start) -> None:
+    with OfficePool(size=2, cache_obj=Cache(use_cache=False)) as pool:
+        office = pool.acquire()
+        office.conn.ctx.getServiceManager.side_effect = Exception("bridge gone")
+        pool.release(office)
+        # dead instance is replaced
+        assert office not in pool.offices
+        assert len(pool.offices) == 2
+
+        pool.offices[0].conn.ctx.getServiceManager.side_effect = Exception("bridge gone")
+        assert pool.health_check() == 1
+        assert pool.health_check() == 0
+
+
+def test_office_pool_restart_error(fake_office_start) -> None:
+    def fail(self) -> None:
+        raise ConnectionError("no office")
+
+    with OfficePool(size=2, cache_obj=Cache(use_cache=False)) as pool:
+        office = pool.acquire()
+        office.conn.ctx.getServiceManager.side_effect = Exception("bridge gone")
+        with patch.object(LoPipeStart, "connect", fail):
+            # a failed restart is not raised from release
+            pool.release(office)
+            assert isinstance(pool.last_error, ConnectionError)
+            assert office not in pool.offices
+            assert len(pool.offices) == 1
+
+            # the healthy instance is still available, then the restart is tried again
+            other = pool.acquire(timeout=1)
+            with pytest.raises(ConnectionError):
+                pool.acquire(timeout=1)
+            pool.release(other)
+            assert pool.health_check() == 0
+
+        # restart succeeds once office can start again, the pool does not shrink
+        assert pool.health_check() == 1
+        assert len(pool.offices) == 2
+        leased = [pool.acquire(timeout=1), pool.acquire(timeout=1)]
+        assert {o.index for o in leased} == {0, 1}
+        for o in leased:
+            pool.release(o)
+
+
+def test_office_pool_threads(fake_office_start) -> None:
+    with OfficePool(size=2, cache_obj=Cache(use_cache=False)) as pool:
+        active = set()
+        errors = []
+        max_active = 0
+        lock = threading.Lock()
+
+        def work() -> None:
+            nonlocal max_active
+            try:
+                with pool.lease(timeout=5) as office:
+                    with lock:
+                        if office.index in active:
+                            errors.append(f"office {office.index} leased twice")
+                        active.add(office.index)
+                        max_active = max(max_active, len(active))
+                    time.sleep(0.01)
+                    with lock:
+                        active.remove(office.index)
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=work) for _ in range(10)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert errors == []
+        assert len(active) == 0
+        assert 1 <= max_active <= 2
+
+
+def test_pooled_office_open_doc(fake_office_start, tmp_path_fn) -> None:
+    with OfficePool(size=1, cache_obj=Cache(use_cache=False)) as pool:
+        with pool.lease() as office:
+            loader = office.loader
+            doc = loader.loadComponentFromURL.return_value
+            with office.open_doc(Path(tmp_path_fn, "doc.odt")) as opened:
+                assert opened is doc
+                args = loader.loadComponentFromURL.call_args[0]
+                assert args[0].startswith("file://")
+                assert args[3][0].Name == "Hidden"
+            # document is closed when done
+            doc.queryInterface.return_value.close.assert_called_once_with(False)
+
+            loader.loadComponentFromURL.return_value = None
+            with pytest.raises(Exception):
+                with office.open_doc(Path(tmp_path_fn, "missing.odt")):
+                    pass
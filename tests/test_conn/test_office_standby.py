@@ -0,0 +1,67 @@
+from unittest.mock import MagicMock, patch
+import threading
+import time
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+from ooodev.conn.cache import Cache
+from ooodev.conn.connect import LoPipeStart
+from ooodev.conn.office_standby import OfficeStandby
+
+
+def test_office_standby_take(fake_office_start) -> None:
+    standby = OfficeStandby(size=2, cache_obj=Cache(use_cache=False))
+    standby.start(wait=True)
+    c1 = standby.take(timeout=5)
+    c2 = standby.take(timeout=5)
+    c3 = standby.take(timeout=5)
+    assert len({c1.connector.pipe, c2.connector.pipe, c3.connector.pipe}) == 3
+    standby.close()
+    assert standby.ready_count == 0
+    with pytest.raises(RuntimeError):
+        standby.take()
+
+
+def test_office_standby_dead_instance(fake_office_start) -> None:
+    with OfficeStandby(size=1, cache_obj=Cache(use_cache=False)) as standby:
+        c1 = standby.take(timeout=5)
+        c1.ctx.getServiceManager.side_effect = Exception("bridge gone")
+        # a dead instance on standby is skipped
+        standby._ready.put(c1)
+        c2 = standby.take(timeout=5)
+        assert c2 is not c1
+
+
+def test_office_standby_take_deadline() -> None:
+    with patch.object(OfficeStandby, "_replenish_async"):
+        standby = OfficeStandby(size=1, cache_obj=Cache(use_cache=False))
+        standby._started = True
+        dead = MagicMock()
+        dead.ctx.getServiceManager.side_effect = Exception("bridge gone")
+
+        def feed() -> None:
+            for _ in range(6):
+                time.sleep(0.1)
+                standby._ready.put(dead)
+
+        t = threading.Thread(target=feed)
+        t.start()
+        start = time.monotonic()
+        # timeout is not restarted for each dead instance
+        with pytest.raises(TimeoutError):
+            standby.take(timeout=0.25)
+        elapsed = time.monotonic() - start
+        t.join()
+        assert elapsed < 0.5
+
+
+def test_office_standby_error() -> None:
+    def fail(self) -> None:
+        raise ConnectionError("no office")
+
+    with patch.object(LoPipeStart, "connect", fail):
+        with OfficeStandby(size=1, cache_obj=Cache(use_cache=False)) as standby:
+            with pytest.raises(ConnectionError):
+                standby.take(timeout=5)
@@ -0,0 +1,76 @@
+from __future__ import annotations
+import copy
+import pickle
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+from ooodev.utils.data_type.cell_addr import CellAddr
+from ooodev.utils.data_type.range_addr import RangeAddr
+
+
+def test_cell_addr() -> None:
+    a = CellAddr(col=2, row=4, sheet_idx=1)
+    assert a.col == 2
+    assert a.row == 4
+    assert a.sheet_idx == 1
+    assert a == CellAddr(2, 4, 1)
+    assert a != CellAddr(2, 4, 0)
+    assert len({a, CellAddr(2, 4, 1), CellAddr(0, 0)}) == 2
+    with pytest.raises(AttributeError):
+        a.col = 3  # type: ignore
+
+    addr = a.to_uno()
+    assert addr.Column == 2
+    assert addr.Row == 4
+    assert addr.Sheet == 1
+    assert CellAddr.from_uno(addr) == a
+
+
+def test_cell_addr_order() -> None:
+    cells = [CellAddr(0, 1), CellAddr(1, 0), CellAddr(0, 0, 1), CellAddr(0, 0)]
+    assert sorted(cells) == [CellAddr(0, 0), CellAddr(1, 0), CellAddr(0, 1), CellAddr(0, 0, 1)]
+
+
+def test_range_addr() -> None:
+    r = RangeAddr(col_start=1, row_start=2, col_end=3, row_end=4)
+    assert r.start == CellAddr(1, 2)
+    assert r.end == CellAddr(3, 4)
+    assert r.contains(CellAddr(2, 3))
+    assert not r.contains(CellAddr(2, 3, 1))
+    assert not r.contains(CellAddr(0, 3))
+
+    addr = r.to_uno()
+    assert addr.StartColumn == 1
+    assert addr.StartRow == 2
+    assert addr.EndColumn == 3
+    assert addr.EndRow == 4
+    assert RangeAddr.from_uno(addr) == r
+
+    d = {r: 1}
+    d[RangeAddr(1, 2, 3, 4)] += 1
+    assert d[r] == 2
+    assert sorted([RangeAddr(0, 1, 0, 1), RangeAddr(5, 0, 5, 0)])[0] == RangeAddr(5, 0, 5, 0)
+    with pytest.raises(AttributeError):
+        r.sheet_idx = 2  # type: ignore
+
+
+def test_range_addr_dedup() -> None:
+    addrs = [RangeAddr(i % 10, 0, i % 10, 0) for i in range(10_000)]
+    assert len(set(addrs)) == 10
+    assert list(dict.fromkeys(addrs)) == [RangeAddr(i, 0, i, 0) for i in range(10)]
+
+
+def test_addr_copy_pickle() -> None:
+    cell = CellAddr(2, 4, 1)
+    rng = RangeAddr(1, 2, 3, 4, 5)
+    for obj in (cell, rng):
+        assert copy.copy(obj) == obj
+        assert copy.deepcopy(obj) == obj
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            result = pickle.loads(pickle.dumps(obj, protocol))
+            assert type(result) is type(obj)
+            assert result == obj
+            assert hash(result) == hash(obj)
+    assert copy.deepcopy({cell: [rng]}) == {cell: [rng]}
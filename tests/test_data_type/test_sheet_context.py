@@ -0,0 +1,116 @@
+from __future__ import annotations
+import copy
+import dataclasses
+import os
+import time
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+from ooodev.office.calc import Calc
+from ooodev.utils.data_type.cell_obj import CellObj
+from ooodev.utils.data_type.range_obj import RangeObj
+from ooodev.utils.data_type.range_values import RangeValues
+from ooodev.utils.data_type.sheet_context import SheetContext
+
+
+@pytest.fixture
+def no_office(monkeypatch):
+    # any call to office while a context is active is an error.
+    calls = []
+
+    def _fail(*args, **kwargs):
+        calls.append((args, kwargs))
+        raise AssertionError("office was called")
+
+    for name in ("get_sheet_index", "get_sheet", "get_sheet_name", "open_doc"):
+        monkeypatch.setattr(Calc, name, _fail)
+    return calls
+
+
+def test_sheet_context_cell(no_office) -> None:
+    with SheetContext(sheet_idx=0, sheet_names=("Sheet1", "Sheet2")):
+        cell = CellObj.from_cell("b3")
+        assert cell.col == "B"
+        assert cell.row == 3
+        assert cell.sheet_idx == 0
+
+        cell = CellObj.from_cell("Sheet2.C4")
+        assert cell.sheet_idx == 1
+
+        cell = CellObj.from_cell("Unknown.C4")
+        assert cell.sheet_idx == -1
+        # copies stay unresolved
+        assert dataclasses.replace(cell, row=5).sheet_idx == -1
+        assert copy.copy(cell).sheet_idx == -1
+    assert len(no_office) == 0
+
+
+def test_sheet_context_range(no_office) -> None:
+    with SheetContext(sheet_idx=1, sheet_names=("Sheet1", "Sheet2")):
+        rng = RangeObj.from_range("a1:c5")
+        assert rng.sheet_idx == 1
+        assert rng.start.sheet_idx == 1
+        assert rng.end.sheet_idx == 1
+        assert rng.sheet_name == "Sheet2"
+        assert rng.to_string(True) == "Sheet2.A1:C5"
+
+        rng = RangeObj.from_range("Sheet1.A1:C5")
+        assert rng.sheet_idx == 0
+        assert rng.start == CellObj("A", 1, 0)
+
+        rv = RangeValues.from_range("Sheet2.A1:C5")
+        assert rv.sheet_idx == 1
+        assert rv.col_end == 2
+        assert rv.row_end == 4
+
+        # unknown sheet names do not fall back to active sheet
+        with pytest.raises(ValueError):
+            RangeObj.from_range("Unknown.A1:C5")
+        with pytest.raises(ValueError):
+            RangeValues.from_range("Unknown.A1:C5")
+    assert len(no_office) == 0
+
+
+def test_sheet_context_nested(no_office) -> None:
+    assert SheetContext.current() is None
+    with SheetContext(sheet_idx=0) as outer:
+        assert SheetContext.current() is outer
+        with SheetContext() as inner:
+            assert SheetContext.current() is inner
+            assert CellObj("A", 1).sheet_idx == -1
+        assert SheetContext.current() is outer
+        assert CellObj("A", 1).sheet_idx == 0
+    assert SheetContext.current() is None
+
+
+def test_sheet_context_many(no_office) -> None:
+    count = 10_000
+    with SheetContext(sheet_idx=0, sheet_names=("Sheet1",)):
+        for i in range(count):
+            assert CellObj.from_idx(col_idx=i % 100, row_idx=i).sheet_idx == 0
+            assert RangeObj(col_start="A", col_end="D", row_start=i + 1, row_end=i + 10).sheet_idx == 0
+    assert len(no_office) == 0
+
+
+# benchmark, run with:
+#  OOODEV_BENCHMARK="1" pytest -s tests/test_data_type/test_sheet_context.py
+@pytest.mark.skipif(os.environ.get("OOODEV_BENCHMARK", "0") != "1", reason="benchmark, set OOODEV_BENCHMARK=1 to run")
+def test_sheet_context_benchmark(no_office) -> None:
+    count = 100_000
+    with SheetContext(sheet_idx=0, sheet_names=("Sheet1",)):
+        start = time.perf_counter()
+        for i in range(count):
+            CellObj.from_idx(col_idx=i % 100, row_idx=i)
+        cell_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for i in range(count):
+            RangeObj(col_start="A", col_end="D", row_start=i + 1, row_end=i + 10)
+        rng_time = time.perf_counter() - start
+
+    print(
+        f"CellObj: {cell_time / count * 1_000_000:.2f}us/object, RangeObj: {rng_time / count * 1_000_000:.2f}us/object"
+    )
+    assert len(no_office) == 0
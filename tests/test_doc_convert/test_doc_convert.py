@@ -0,0 +1,158 @@
+from pathlib import Path
+from unittest.mock import patch
+import threading
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+from ooodev.conn.cache import Cache
+from ooodev.utils import doc_convert as mConvert
+
+
+def _make_inputs(root: Path, count: int):
+    for i in range(count):
+        fnm = Path(root, f"doc{i}.odt")
+        fnm.write_text("x")
+        yield fnm
+
+
+def test_convert_many(tmp_path_fn: Path, fake_office_start) -> None:
+    in_dir = Path(tmp_path_fn, "in")
+    in_dir.mkdir()
+    out_dir = Path(tmp_path_fn, "out")
+    manifest = Path(tmp_path_fn, "manifest.jsonl")
+    offices = set()
+    lock = threading.Lock()
+
+    def convert_one(office, src, dst, filter_name) -> None:
+        with lock:
+            offices.add(office.index)
+        if src.endswith("doc3.odt"):
+            raise Exception("bad document")
+        Path(dst).write_text("pdf")
+
+    results = []
+    with patch.object(mConvert, "_convert_one", convert_one):
+        summary = mConvert.convert_many(
+            _make_inputs(in_dir, 10),
+            out_dir,
+            "pdf",
+            workers=2,
+            manifest=manifest,
+            cache_obj=Cache(use_cache=False),
+            on_result=results.append,
+        )
+        assert summary.converted == 9
+        assert summary.failed == 1
+        assert summary.skipped == 0
+        assert summary.files_per_sec > 0.0
+        assert len(results) == 10
+        assert Path(out_dir, "doc0.pdf").exists()
+        assert all(r.seconds >= 0.0 for r in results)
+
+        # resumed run only tries the failed file.
+        summary = mConvert.convert_many(
+            sorted(in_dir.glob("*.odt")),
+            out_dir,
+            "pdf",
+            workers=2,
+            manifest=manifest,
+            cache_obj=Cache(use_cache=False),
+        )
+        assert summary.skipped == 9
+        assert summary.failed == 1
+
+
+def test_convert_many_retry_crash(tmp_path_fn: Path, fake_office_start) -> None:
+    src = Path(tmp_path_fn, "doc.odt")
+    src.write_text("x")
+    calls = []
+
+    def convert_one(office, src, dst, filter_name) -> None:
+        calls.append(office)
+        if len(calls) == 1:
+            # office crashed while converting
+            office.conn.ctx.getServiceManager.side_effect = Exception("bridge gone")
+            raise Exception("disposed")
+        Path(dst).write_text("pdf")
+
+    with patch.object(mConvert, "_convert_one", convert_one):
+        results = []
+        summary = mConvert.convert_many(
+            [src],
+            Path(tmp_path_fn, "out"),
+            "pdf",
+            workers=1,
+            cache_obj=Cache(use_cache=False),
+            on_result=results.append,
+        )
+    assert summary.converted == 1
+    assert results[0].attempts == 2
+    # crashed office was replaced
+    assert calls[0] is not calls[1]
+
+
+def test_convert_many_out_paths(tmp_path_fn: Path, fake_office_start) -> None:
+    in_dir = Path(tmp_path_fn, "in")
+    for sub in ("a", "b"):
+        Path(in_dir, sub).mkdir(parents=True)
+        Path(in_dir, sub, "report.odt").write_text("x")
+    Path(in_dir, "a", "report.docx").write_text("x")
+    inputs = [Path(in_dir, "a", "report.odt"), Path(in_dir, "b", "report.odt"), Path(in_dir, "a", "report.docx")]
+    out_dir = Path(tmp_path_fn, "out")
+
+    def convert_one(office, src, dst, filter_name) -> None:
+        Path(dst).write_text(src)
+
+    with patch.object(mConvert, "_convert_one", convert_one):
+        # same stem in different directories is not written to the same file
+        results = []
+        summary = mConvert.convert_many(
+            inputs[:2], out_dir, "pdf", workers=1, cache_obj=Cache(use_cache=False), on_result=results.append
+        )
+        assert summary.converted == 1
+        assert summary.failed == 1
+        assert "used by another input" in [r for r in results if not r.ok][0].error
+
+        # inputs keep their relative path below src_root
+        results = []
+        summary = mConvert.convert_many(
+            inputs,
+            out_dir,
+            "pdf",
+            workers=2,
+            src_root=in_dir,
+            cache_obj=Cache(use_cache=False),
+            on_result=results.append,
+        )
+        assert summary.converted == 2
+        assert summary.failed == 1
+        assert Path(out_dir, "a", "report.pdf").read_text() == str(inputs[0])
+        assert Path(out_dir, "b", "report.pdf").read_text() == str(inputs[1])
+        # report.docx and report.odt both map to a/report.pdf
+        failed = [r for r in results if not r.ok]
+        assert failed[0].src == str(inputs[2])
+
+
+def test_convert_many_on_result_error(tmp_path_fn: Path, fake_office_start) -> None:
+    in_dir = Path(tmp_path_fn, "in")
+    in_dir.mkdir()
+
+    def convert_one(office, src, dst, filter_name) -> None:
+        Path(dst).write_text("pdf")
+
+    def on_result(result) -> None:
+        raise RuntimeError("callback failed")
+
+    with patch.object(mConvert, "_convert_one", convert_one):
+        # callback error stops the run and is raised, reading more inputs does not block.
+        with pytest.raises(RuntimeError):
+            mConvert.convert_many(
+                _make_inputs(in_dir, 50),
+                Path(tmp_path_fn, "out"),
+                "pdf",
+                workers=2,
+                cache_obj=Cache(use_cache=False),
+                on_result=on_result,
+            )
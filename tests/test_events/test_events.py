@@ -132,3 +132,42 @@ def test_event_new_doc(loader) -> None:
     doc = Write.create_doc(loader)
     assert fired_creating is True
     assert fired_created is True
+
+
+def test_event_has_listeners() -> None:
+    from ooodev.events.event_singleton import _Events
+
+    fired = False
+
+    def on_ev(source, event: EventArgs):
+        nonlocal fired
+        fired = True
+
+    name = "test_event_has_listeners"
+    assert _Events().has_listeners(name) is False
+    events = Events()
+    events.on(name, on_ev)
+    assert _Events().has_listeners(name)
+    # global events reach Events instances through observers
+    _Events().trigger(name, EventArgs("test"))
+    assert fired is True
+
+    events.remove(name, on_ev)
+    assert _Events().has_listeners(name) is False
+
+    events.on(name, on_ev)
+    assert _Events().has_listeners(name)
+    events = None
+    assert _Events().has_listeners(name) is False
+
+
+def test_event_trigger_no_listeners() -> None:
+    from ooodev.events.event_singleton import _Events
+
+    name = "test_event_trigger_no_listeners"
+    assert _Events().has_listeners(name) is False
+    eargs = EventArgs("test")
+    _Events().trigger(name, eargs)
+    # observers are not visited so args are not touched
+    assert eargs.event_name == ""
+    assert eargs.event_source is None
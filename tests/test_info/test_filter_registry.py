@@ -0,0 +1,66 @@
+from pathlib import Path
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+
+def test_filter_registry(loader, tmp_path_fn: Path) -> None:
+    from ooodev.utils.info import Info
+    from ooodev.utils.filter_registry import FilterRegistry
+
+    FilterRegistry.clear()
+    names = Info.get_filter_names()
+    assert FilterRegistry.is_loaded()
+    assert "writer_pdf_Export" in names
+    assert len(Info.get_filter_props("writer_pdf_Export")) > 0
+
+    fi = FilterRegistry.get("writer_pdf_Export")
+    assert fi is not None
+    assert fi.is_export
+    assert fi.document_service == "com.sun.star.text.TextDocument"
+    assert "pdf" in fi.extensions
+
+    found = FilterRegistry.find_by_ext(".PDF", flags=Info.Filter.EXPORT)
+    assert fi in found
+    assert fi in FilterRegistry.find_by_mime("application/pdf")
+    assert fi in FilterRegistry.find_by_service("com.sun.star.text.TextDocument", Info.Filter.EXPORT)
+    assert FilterRegistry.get_export_filter("pdf", "com.sun.star.text.TextDocument") == "writer_pdf_Export"
+    assert FilterRegistry.get_export_filter("pdf", "com.sun.star.sheet.SpreadsheetDocument") == "calc_pdf_Export"
+
+    fnm = Path(tmp_path_fn, "filters.json")
+    FilterRegistry.save(fnm)
+    FilterRegistry.clear()
+    assert FilterRegistry.load_file(fnm)
+    assert FilterRegistry.get("writer_pdf_Export") == fi
+
+
+def test_filter_registry_export_cache() -> None:
+    from ooodev.events.args.event_args import EventArgs
+    from ooodev.events.event_singleton import _Events
+    from ooodev.events.lo_named_event import LoNamedEvent
+    from ooodev.utils.filter_registry import FilterRegistry
+
+    FilterRegistry.clear()
+    FilterRegistry._build(
+        {
+            "writer_pdf_Export": {
+                "DocumentService": "com.sun.star.text.TextDocument",
+                "Flags": 2,
+                "_Extensions": ("pdf",),
+                "_MediaType": "application/pdf",
+            }
+        }
+    )
+    try:
+        doc_service = "com.sun.star.text.TextDocument"
+        assert FilterRegistry.get_export_filter("pdf", doc_service) == "writer_pdf_Export"
+        assert FilterRegistry.get_export_filter(".PDF", doc_service) == "writer_pdf_Export"
+        assert list(FilterRegistry._export_cache.keys()) == [("pdf", doc_service)]
+
+        # registry belongs to the office connection
+        _Events().trigger(LoNamedEvent.BRIDGE_DISPOSED, EventArgs(FilterRegistry))
+        assert not FilterRegistry.is_loaded()
+        assert FilterRegistry._export_cache == {}
+    finally:
+        FilterRegistry.clear()
@@ -33,4 +33,69 @@ def _test_dispose() -> None:
     # bridge via LoNamedEvent.OFFICE_LOADED event.
     assert Lo._xcc is None
     assert Lo._mc_factory is None
-    assert Lo._lo_inst is None
\ No newline at end of file
+    assert Lo._lo_inst is None
+
+def test_qi_cache(loader) -> None:
+    from ooodev.utils.lo import Lo
+    from ooodev.office.calc import Calc
+    from com.sun.star.sheet import XCellRangeAddressable
+    from com.sun.star.util import XSearchable
+
+    doc = Calc.create_doc(loader)
+    try:
+        sheet = Calc.get_sheet(doc=doc, index=0)
+        Lo.reset_qi_stats()
+        assert Lo.qi(XCellRangeAddressable, sheet) is not None
+        assert Lo.qi(XCellRangeAddressable, sheet) is not None
+        stats = Lo.get_qi_stats()
+        assert stats.calls == 2
+        assert stats.queries == 2
+        assert stats.cache_hits == 0
+
+        Lo.reset_qi_stats()
+        with Lo.QiCache():
+            for _ in range(10):
+                assert Lo.qi(XCellRangeAddressable, sheet, True) is not None
+                assert Lo.qi(XSearchable, sheet, True) is not None
+            with Lo.QiCache():
+                assert Lo.qi(XCellRangeAddressable, sheet, True) is not None
+        stats = Lo.get_qi_stats()
+        assert stats.calls == 21
+        assert stats.queries == 2
+        assert stats.cache_hits == 19
+        assert Lo._qi_obj_cache is None
+    finally:
+        Lo.close(closeable=doc, deliver_ownership=False)
+
+
+def test_ext_to_format() -> None:
+    from ooodev.utils.lo import Lo
+
+    assert Lo.ext_to_format("docx") == "Office Open XML Text"
+    assert Lo.ext_to_format("PDF") == "writer_pdf_Export"
+    assert Lo.ext_to_format("pdf", Lo.DocType.CALC) == "calc_pdf_Export"
+    assert Lo.ext_to_format("pdf", Lo.DocType.BASE) == "writer_pdf_Export"
+    assert Lo.ext_to_format("rtf", Lo.DocType.CALC) == "Rich Text Format (StarCalc)"
+    assert Lo.ext_to_format("rtf", Lo.DocType.WRITER) == "Rich Text Format"
+    assert Lo.ext_to_format("jpg", Lo.DocType.IMPRESS) == "impress_jpg_Export"
+    assert Lo.ext_to_format("jpg", Lo.DocType.CALC) == "draw_jpg_Export"
+    assert Lo.ext_to_format("html") == "HTML"
+    assert Lo.ext_to_format("htm", Lo.DocType.CALC) == "HTML (StarCalc)"
+    assert Lo.ext_to_format("unknown") == "Text"
+
+
+def test_get_cached_service(loader) -> None:
+    from com.sun.star.sheet import XFunctionAccess
+    from ooodev.utils.lo import Lo
+    from ooodev.office.calc import Calc
+
+    Lo.clear_service_cache()
+    fa1 = Lo.get_cached_service(XFunctionAccess, "com.sun.star.sheet.FunctionAccess", True)
+    fa2 = Lo.get_cached_service(XFunctionAccess, "com.sun.star.sheet.FunctionAccess", True)
+    assert fa1 is fa2
+    assert Calc.call_fun("SUM", (1, 2, 3)) == 6.0
+    assert Calc.call_fun("MAX", (1, 5, 3)) == 5.0
+
+    Lo.clear_service_cache()
+    fa3 = Lo.get_cached_service(XFunctionAccess, "com.sun.star.sheet.FunctionAccess", True)
+    assert fa3 is not fa1
@@ -87,3 +87,79 @@ def test_prop_get_with_default(loader) -> None:
         assert p is None
     finally:
         Lo.close(closeable=doc, deliver_ownership=False)
+
+
+def test_prop_get_set_many(loader) -> None:
+    from ooodev.utils.lo import Lo
+    from ooodev.utils.props import Props
+    from ooodev.utils.info import Info
+    from ooodev.office.calc import Calc
+    from ooodev.exceptions import ex as mEx
+
+    assert loader is not None
+    doc = Calc.create_doc(loader)
+    assert doc is not None
+    try:
+        sheet = Calc.get_sheet(doc=doc, index=0)
+        cell = Calc.get_cell(sheet=sheet, cell_name="A1")
+        Props.set_many(cell, {"CharHeight": 16.0, "CharWeight": 150.0, "CellBackColor": 0xFF0000})
+        vals = Props.get_many(cell, ["CharWeight", "CharHeight", "CellBackColor"])
+        assert list(vals.keys()) == ["CharWeight", "CharHeight", "CellBackColor"]
+        assert vals["CharHeight"] == 16.0
+        assert vals["CharWeight"] == 150.0
+        assert vals["CellBackColor"] == 0xFF0000
+
+        # Props.set sets properties one at a time in the order given
+        Props.set(cell, CharHeight=12.0, CellBackColor=0x00FF00)
+        assert Props.get(cell, "CharHeight") == 12.0
+        assert Props.get(cell, "CellBackColor") == 0x00FF00
+
+        # only the failed property is reported, the others are still set.
+        with pytest.raises(mEx.MultiError) as e:
+            Props.set_many(cell, {"CharHeight": 20.0, "no-such-prop": 1})
+        assert len(e.value.errors) == 1
+        assert Props.get(cell, "CharHeight") == 20.0
+
+        vals = Props.get_many(cell, ["CharHeight", "no-such-prop"], None)
+        assert vals["CharHeight"] == 20.0
+        assert vals["no-such-prop"] is None
+
+        # implementation name is used to cache writable names
+        impl_name = Info.get_implementation_name(cell)
+        Props.set_many(cell, {"CharHeight": 14.0, "CharWeight": 100.0}, impl_name)
+        assert Props.get(cell, "CharHeight") == 14.0
+
+        with pytest.raises(mEx.PropertyNotFoundError):
+            Props.get_many(cell, ["CharHeight", "no-such-prop"])
+    finally:
+        Lo.close(closeable=doc, deliver_ownership=False)
+
+
+def test_prop_fast(loader) -> None:
+    from ooodev.utils.lo import Lo
+    from ooodev.utils.info import Info
+    from ooodev.utils.props import Props
+    from ooodev.office.calc import Calc
+
+    assert loader is not None
+    doc = Calc.create_doc(loader)
+    assert doc is not None
+    try:
+        sheet = Calc.get_sheet(doc=doc, index=0)
+        cell = Calc.get_cell(sheet=sheet, cell_name="A1")
+        Props.clear_prop_handles()
+        handles = Props.get_prop_handles(cell)
+        assert "CellBackColor" in handles
+        impl_name = Info.get_implementation_name(cell)
+        assert Props.get_prop_handles(cell, impl_name) is handles
+
+        for i in range(10):
+            c = Calc.get_cell(sheet=sheet, col=0, row=i)
+            Props.set_fast(c, "CellBackColor", 0x0000FF, impl_name)
+            assert Props.get_fast(c, "CellBackColor", impl_name=impl_name) == 0x0000FF
+            assert Props.get(c, "CellBackColor") == 0x0000FF
+
+        # no handle, falls back to Props.get()
+        assert Props.get_fast(cell, "no-such-prop", None, impl_name) is None
+    finally:
+        Lo.close(closeable=doc, deliver_ownership=False)
@@ -418,3 +418,95 @@ def test_convert_1d_to_2d_no_fill(lst_len: int, col_count: int, expected_len: in
 def test_convert_1d_to_2d_col_error() -> None:
     with pytest.raises(ValueError):
         TableHelper.convert_1d_to_2d([1, 3], 0)
+
+
+@pytest.mark.parametrize(
+    ("val", "sheet", "col", "row"),
+    [
+        ("A23", "", "A", 23),
+        ("b2", "", "B", 2),
+        ("Sheet1.A23", "Sheet1", "A", 23),
+        ("$Sheet1.$AB$23", "Sheet1", "AB", 23),
+        ("'My Sheet'.C4", "My Sheet", "C", 4),
+        ("'Bob''s'.C4", "Bob's", "C", 4),
+        ("Sheet1.A23:G45", "Sheet1", "A", 23),
+        (" A23 ", "", "A", 23),
+    ],
+)
+def test_get_cell_parts(val: str, sheet: str, col: str, row: int) -> None:
+    parts = TableHelper.get_cell_parts(val)
+    assert parts.sheet == sheet
+    assert parts.col == col
+    assert parts.row == row
+
+
+@pytest.mark.parametrize(("val"), [("C"), ("3"), ("C:C"), ("3:3"), ("Sheet1.B"), ("A1B")])
+def test_get_cell_parts_err(val: str) -> None:
+    with pytest.raises(ValueError):
+        TableHelper.get_cell_parts(val)
+
+
+@pytest.mark.parametrize(
+    ("val", "expected"),
+    [
+        ("A23:G45", ("", "A", 23, "G", 45)),
+        ("Sheet1.a23:g45", ("Sheet1", "A", 23, "G", 45)),
+        ("$Sheet1.$A$1:$AMJ$1048576", ("Sheet1", "A", 1, "AMJ", 1048576)),
+        ("$Sheet1.$A$1:$Sheet1.$C$3", ("Sheet1", "A", 1, "C", 3)),
+        ("'My Sheet'.B2:C5", ("My Sheet", "B", 2, "C", 5)),
+        ("B3", ("", "B", 3, "B", 3)),
+        ("$A$1:$XFD$3", ("", "A", 1, "XFD", 3)),
+        (" A23:G45 ", ("", "A", 23, "G", 45)),
+    ],
+)
+def test_get_range_parts(val: str, expected: tuple) -> None:
+    parts = TableHelper.get_range_parts(val)
+    assert tuple(parts) == expected
+
+
+def test_get_range_parts_whole() -> None:
+    assert tuple(TableHelper.get_range_parts("A:C", allow_whole=True)) == ("", "A", 1, "C", 1048576)
+    assert tuple(TableHelper.get_range_parts("2:5", allow_whole=True)) == ("", "A", 2, "XFD", 5)
+    parts = TableHelper.get_range_parts("Sheet1.2:5", allow_whole=True, max_col=1024)
+    assert tuple(parts) == ("Sheet1", "A", 2, "AMJ", 5)
+    with pytest.raises(ValueError):
+        TableHelper.get_range_parts("A:C")
+    with pytest.raises(ValueError):
+        TableHelper.get_range_parts("2:5")
+
+
+@pytest.mark.parametrize(
+    ("val"), [(""), ("A1:"), (":"), ("1A"), ("Sheet1."), ("C"), ("3"), ("a1:b"), ("A1:3"), ("A:3")]
+)
+def test_get_range_parts_err(val: str) -> None:
+    with pytest.raises(ValueError):
+        TableHelper.get_range_parts(val, allow_whole=True)
+
+
+def test_cell_lists() -> None:
+    names = ["A1", "$C$5", "Sheet1.AA10"]
+    parts = TableHelper.get_cell_parts_list(names)
+    assert [p.col for p in parts] == ["A", "C", "AA"]
+    assert parts[2].sheet == "Sheet1"
+
+    idxs = TableHelper.get_cell_indexes(names)
+    assert idxs == [(1, 1), (3, 5), (27, 10)]
+    idxs = TableHelper.get_cell_indexes(names, True)
+    assert idxs == [(0, 0), (2, 4), (26, 9)]
+
+    assert TableHelper.make_cell_names(idxs, True) == ["A1", "C5", "AA10"]
+    assert TableHelper.make_cell_names([(1, 1), (28, 3)]) == ["A1", "AB3"]
+
+    with pytest.raises(ValueError):
+        TableHelper.make_cell_names([(0, 1)])
+    with pytest.raises(ValueError):
+        TableHelper.get_cell_indexes(["A1", "C"])
+    with pytest.raises(ValueError):
+        TableHelper.get_cell_parts_list(["A1", "3:3"])
+
+
+def test_name_to_int_whitespace() -> None:
+    assert TableHelper.row_name_to_int(" 5") == 5
+    assert TableHelper.row_name_to_int(" C5 ", True) == 4
+    assert TableHelper.col_name_to_int(" AA2 ") == 27
+    assert TableHelper.get_cell_indexes([" A1", "B2 "]) == [(1, 1), (2, 2)]
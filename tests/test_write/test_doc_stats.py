@@ -0,0 +1,50 @@
+from __future__ import annotations
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+from ooodev.utils.lo import Lo
+from ooodev.office.write import Write
+from ooodev.utils.doc_stats import DocStatsCache, get_doc_stats
+
+from com.sun.star.util import XModifiable
+
+
+def test_doc_stats(loader) -> None:
+    doc = Write.create_doc(loader)
+    try:
+        cursor = Write.get_cursor(doc)
+        Write.append_para(cursor, "One two three.")
+        Write.append_para(cursor, "Four five.")
+
+        stats = get_doc_stats(doc)
+        assert stats.words == 5
+        assert stats.pages >= 1
+        assert stats.paragraphs >= 2
+        assert stats.values["WordCount"] == stats.words
+
+        with DocStatsCache(doc) as cache:
+            first = cache.get()
+            assert first.words == 5
+            assert cache.is_cached
+            assert cache.get() is first
+
+            # document is already modified, no modify event is sent for later changes
+            assert Lo.qi(XModifiable, doc, True).isModified()
+            Write.append_para(cursor, "Six seven eight.")
+            assert cache.is_cached is False
+            assert cache.get().words == 8
+
+            Write.append_para(cursor, "Nine.")
+            assert cache.is_cached is False
+            assert cache.get().words == 9
+
+            # modify event clears cache
+            Lo.qi(XModifiable, doc, True).setModified(False)
+            assert cache.get().words == 9
+            Write.append_para(cursor, "Ten.")
+            assert cache.is_cached is False
+            assert cache.get().words == 10
+    finally:
+        Lo.close_doc(doc, False)
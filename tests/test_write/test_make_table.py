@@ -31,4 +31,45 @@ def test_make_table(loader, bond_movies_table: list):
         Write.append(cursor, f"Timestamp: {DateUtil.time_stamp()}")
         Lo.delay(delay)
     finally:
-        Lo.close_doc(doc, False)
\ No newline at end of file
+        Lo.close_doc(doc, False)
+
+
+def test_make_table_stream(loader, bond_movies_table: list):
+    from com.sun.star.text import XTextTablesSupplier
+
+    doc = Write.create_doc(loader)
+    try:
+        cursor = Write.get_cursor(doc)
+
+        def gen_rows():
+            yield bond_movies_table[0]
+            for row in bond_movies_table[1:]:
+                yield row
+
+        # small block size so rows are appended in several blocks
+        assert Write.add_table_stream(cursor=cursor, rows=gen_rows(), block_size=7)
+        Write.end_paragraph(cursor)
+
+        tables = Lo.qi(XTextTablesSupplier, doc, True).getTextTables()
+        table = tables.getByIndex(0)
+        assert table.getRows().getCount() == len(bond_movies_table)
+        data = table.getDataArray()
+        assert data[0][0] == str(bond_movies_table[0][0])
+        assert data[-1][-1] == str(bond_movies_table[-1][-1])
+    finally:
+        Lo.close_doc(doc, False)
+
+
+def test_make_table_wide(loader):
+    # Writer names columns after Z as a, b, ...
+    num_cols = 30
+    table_data = [[f"H{c}" for c in range(num_cols)]] + [[f"{r}-{c}" for c in range(num_cols)] for r in range(3)]
+    doc = Write.create_doc(loader)
+    try:
+        cursor = Write.get_cursor(doc)
+        assert Write.add_table(cursor=cursor, table_data=table_data)
+        tables = doc.getTextTables()
+        data = tables.getByIndex(0).getDataArray()
+        assert [list(row) for row in data] == table_data
+    finally:
+        Lo.close_doc(doc, False)
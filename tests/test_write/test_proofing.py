@@ -0,0 +1,95 @@
+from __future__ import annotations
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+import threading
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+from ooodev.utils.lo import Lo
+from ooodev.office.write import Write
+from ooodev.conn.cache import Cache
+from ooodev.utils import proofing as mProofing
+from ooodev.utils.proofing import Proofer, ProofCache, ProofResult
+
+
+def test_proof_cache() -> None:
+    cache = ProofCache(maxsize=2)
+    cache.put("a", 1)
+    cache.put("b", None)
+    assert cache.get("a") == 1
+    # "b" is least recently used
+    cache.put("c", 3)
+    assert cache.get("b", "missing") == "missing"
+    assert len(cache) == 2
+    assert cache.hits == 1
+    assert cache.misses == 1
+
+
+def test_proofer(loader) -> None:
+    doc = Write.create_doc(loader)
+    try:
+        cursor = Write.get_cursor(doc)
+        Write.append_para(cursor, "The horsebacc rider rode home.")
+        Write.append_para(cursor, "Another horsebacc rider rode home.")
+        Write.append_para(cursor, "")
+        Write.append_para(cursor, "Everything here is fine.")
+
+        proofer = Proofer(grammar=False)
+        result = proofer.check_doc(doc)
+        assert result.ok
+        assert result.paragraphs >= 3
+        words = [err.word for err in result.spelling]
+        assert words == ["horsebacc", "horsebacc"]
+        assert [err.paragraph for err in result.spelling] == [0, 1]
+        assert result.spelling[0].offset == len("The ")
+        # repeated words are only spell checked once
+        assert proofer.cache.hits >= 4
+
+        spelling, grammar, count = proofer.check_paragraph("horsebacc")
+        assert len(spelling) == 1
+        assert grammar == []
+        assert count == 1
+    finally:
+        Lo.close_doc(doc, False)
+
+
+def test_proof_many(tmp_path_fn: Path, fake_office_start) -> None:
+    inputs = []
+    for i in range(10):
+        fnm = Path(tmp_path_fn, f"doc{i}.odt")
+        fnm.write_text("x")
+        inputs.append(fnm)
+    created = []
+    lock = threading.Lock()
+
+    def from_office(office, **kwargs) -> Proofer:
+        with lock:
+            created.append(office)
+        return MagicMock()
+
+    def proof_one(office, proofer, src) -> ProofResult:
+        if src.endswith("doc3.odt"):
+            # office crashed while checking
+            office.conn.ctx.getServiceManager.side_effect = Exception("bridge gone")
+            raise Exception("disposed")
+        return ProofResult(src, (), (), 1, 2, 0.0)
+
+    with patch.object(mProofing, "_proof_one", proof_one), patch.object(Proofer, "from_office", from_office):
+        results = mProofing.proof_many(inputs, workers=2, cache_obj=Cache(use_cache=False))
+        assert len(results) == 10
+        failed = [r for r in results if not r.ok]
+        assert len(failed) == 1
+        assert failed[0].src.endswith("doc3.odt")
+        assert sum(r.words for r in results) == 18
+        # one proofer for each instance, the restarted instance gets a new proofer
+        assert len(created) == len(set(created))
+        assert len(created) <= 3
+
+        def on_result(result) -> None:
+            raise RuntimeError("callback failed")
+
+        # callback error stops the run and is raised, reading more inputs does not block.
+        with pytest.raises(RuntimeError):
+            mProofing.proof_many(inputs * 5, workers=2, cache_obj=Cache(use_cache=False), on_result=on_result)
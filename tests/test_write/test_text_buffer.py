@@ -0,0 +1,58 @@
+from __future__ import annotations
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+from ooodev.utils.lo import Lo
+from ooodev.office.write import Write
+from ooodev.utils.props import Props
+
+from com.sun.star.awt import FontWeight  # const
+
+
+def test_text_buffer(loader) -> None:
+    doc = Write.create_doc(loader)
+    try:
+        cursor = Write.get_cursor(doc)
+        lines = [f"Line {i} with some text. ü ✓ 😀" for i in range(200)]
+        with Write.TextBuffer(cursor, max_chars=1_000, text_doc=doc) as buf:
+            assert doc.hasControllersLocked()
+            buf.append_para("Title", ParaStyleName="Heading 1")
+            for line in lines:
+                buf.append_para(line)
+            buf.append("Plain ")
+            buf.append("bold", CharWeight=FontWeight.BOLD)
+            buf.append(" after")
+            buf.end_paragraph()
+            buf.append_para("", ParaStyleName="Heading 2")
+            # buffer flushes when max_chars is exceeded
+            assert buf.buffered < 1_000
+        assert buf.buffered == 0
+        assert doc.hasControllersLocked() is False
+
+        paras = []
+        enum = Write.get_enumeration(doc)
+        while enum.hasMoreElements():
+            paras.append(enum.nextElement())
+        texts = [p.getString() for p in paras]
+        assert texts[0] == "Title"
+        assert Props.get(paras[0], "ParaStyleName") == "Heading 1"
+        assert texts[1:201] == lines
+        assert texts[201] == "Plain bold after"
+        # empty paragraph keeps its style
+        assert texts[202] == ""
+        assert Props.get(paras[202], "ParaStyleName") == "Heading 2"
+        assert Props.get(paras[201], "ParaStyleName") != "Heading 2"
+        # style runs after characters outside basic plane are placed correctly
+        bold_start = len("Plain ")
+        tc = doc.getText().createTextCursorByRange(paras[201].getStart())
+        tc.goRight(bold_start, False)
+        tc.goRight(len("bold"), True)
+        assert tc.getString() == "bold"
+        assert Props.get(tc, "CharWeight") == FontWeight.BOLD
+        tc.collapseToEnd()
+        tc.goRight(1, True)
+        assert Props.get(tc, "CharWeight") != FontWeight.BOLD
+    finally:
+        Lo.close_doc(doc, False)
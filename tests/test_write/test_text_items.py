@@ -0,0 +1,88 @@
+from __future__ import annotations
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+from ooodev.utils.lo import Lo
+from ooodev.office.write import Write
+from ooodev.utils.data_type.text_item import TextItemKind
+
+
+def test_iter_text_items(loader) -> None:
+    doc = Write.create_doc(loader)
+    try:
+        cursor = Write.get_cursor(doc)
+        Write.append_para(cursor, "Title")
+        Write.style_prev_paragraph(cursor, "Heading 1")
+        Write.append_para(cursor, "First 😀 paragraph")
+        Write.add_table(cursor=cursor, table_data=[["Name", "Value"], ["a", "1"]])
+        Write.append_para(cursor, "After table")
+        Write.add_text_frame(cursor=cursor, ypos=2_000, text="Frame text", width=4_000, height=1_500)
+        Write.append_para(cursor, "Last")
+
+        items = list(Write.iter_text_items(doc))
+        paras = [item for item in items if item.kind == TextItemKind.PARAGRAPH]
+        texts = [item.text for item in paras]
+        assert texts[:2] == ["Title", "First 😀 paragraph"]
+        assert "After table" in texts
+        assert "Last" in texts
+        assert paras[0].style_name == "Heading 1"
+        assert paras[0].offset == 0
+        # emoji counts as two characters
+        assert paras[1].offset == len("Title") + 1
+        assert [item.index for item in items] == list(range(len(items)))
+
+        tables = [item for item in items if item.kind == TextItemKind.TABLE]
+        assert len(tables) == 1
+        assert tables[0].text == "Name\tValue\na\t1"
+        # table comes before the paragraph that follows it
+        assert items.index(tables[0]) < items.index(paras[texts.index("After table")])
+
+        frames = [item for item in items if item.kind == TextItemKind.FRAME]
+        assert len(frames) == 1
+        assert frames[0].text == "Frame text"
+
+        no_extra = list(Write.iter_text_items(doc, include_tables=False, include_frames=False))
+        assert all(item.kind == TextItemKind.PARAGRAPH for item in no_extra)
+        assert [item.text for item in no_extra] == texts
+    finally:
+        Lo.close_doc(doc, False)
+
+
+def test_iter_text_items_frame_anchors(loader) -> None:
+    from com.sun.star.text import XTextFrame
+    from ooo.dyn.awt.size import Size
+    from ooo.dyn.text.text_content_anchor_type import TextContentAnchorType
+
+    doc = Write.create_doc(loader)
+
+    def add_frame(cursor, anchor: TextContentAnchorType, text: str) -> None:
+        frame = Lo.create_instance_msf(XTextFrame, "com.sun.star.text.TextFrame", raise_err=True)
+        frame.setSize(Size(3_000, 1_000))
+        frame.setPropertyValue("AnchorType", anchor)
+        doc.getText().insertTextContent(cursor, frame, False)
+        frame.setString(text)
+        cursor.gotoEnd(False)
+
+    try:
+        cursor = Write.get_cursor(doc)
+        Write.append_para(cursor, "First")
+        Write.append(cursor, "Char ")
+        add_frame(cursor, TextContentAnchorType.AT_CHARACTER, "At char")
+        Write.append_para(cursor, "anchor")
+        Write.append(cursor, "As ")
+        add_frame(cursor, TextContentAnchorType.AS_CHARACTER, "As char")
+        Write.append_para(cursor, "char")
+        Write.append_para(cursor, "Last")
+
+        items = list(Write.iter_text_items(doc))
+        frames = [item for item in items if item.kind == TextItemKind.FRAME]
+        assert sorted(item.text for item in frames) == ["As char", "At char"]
+        for frame_text, para_start in (("At char", "Char"), ("As char", "As")):
+            pos = [item.text for item in items].index(frame_text)
+            # frame follows the paragraph that holds its anchor
+            assert items[pos - 1].kind == TextItemKind.PARAGRAPH
+            assert items[pos - 1].text.startswith(para_start)
+    finally:
+        Lo.close_doc(doc, False)